@@ -0,0 +1,149 @@
+"""Compare RNCClient throughput over HTTP/1.1 and HTTP/2.
+
+Starts the local stand-in RNC server with hypercorn (which speaks both
+HTTP/1.1 and cleartext HTTP/2) and fires the same concurrent concordance
+workload through RNCClient once per protocol. Every call requests a
+distinct page, so RNCClient's coalescing of identical in-flight payloads
+cannot merge requests; the reported upstream request count (from the
+stand-in's /_mock/stats) confirms each call reached the server.
+
+Usage (from the repository root):
+
+    pip install hypercorn 'httpx[http2]'
+    python -m benchmarks.http2_throughput --requests 2000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# fmt: off
+from hypercorn.asyncio import serve  # noqa: E402
+from hypercorn.config import Config as HypercornConfig  # noqa: E402
+
+from benchmarks.mock_rnc_server import API_PREFIX, create_app  # noqa: E402
+from rnc_mcp.clients.rnc_client import RNCClient  # noqa: E402
+from rnc_mcp.config import Config  # noqa: E402
+# fmt: on
+
+# Distinct page numbers across both runs
+_pages = itertools.count()
+
+
+def next_payload() -> Dict[str, Any]:
+    """A concordance payload no other call of the benchmark sends."""
+    return {
+        "corpus": {"type": "MAIN"},
+        "params": {"pageParams": {"page": next(_pages)}}
+    }
+
+
+async def upstream_requests(port: int) -> int:
+    """Responses served by the stand-in server so far."""
+    async with httpx.AsyncClient() as http:
+        response = await http.get(f"http://127.0.0.1:{port}/_mock/stats")
+    return sum(response.json()["served"].values())
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_workload(
+    http2: bool, requests: int, concurrency: int, port: int
+) -> Dict[str, float]:
+    Config.RNC_HTTP2 = http2
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with RNCClient() as client:
+        # Warm the pool so handshakes are not part of the measurement
+        await asyncio.gather(*[
+            client.execute_concordance(next_payload())
+            for _ in range(min(concurrency, 20))
+        ])
+        served = await upstream_requests(port)
+
+        async def one() -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                await client.execute_concordance(next_payload())
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*[one() for _ in range(requests)])
+        elapsed = time.perf_counter() - started
+        served = await upstream_requests(port) - served
+
+    return {
+        "protocol": "HTTP/2" if http2 else "HTTP/1.1",
+        "requests": requests,
+        "upstream_requests": served,
+        "concurrency": concurrency,
+        "throughput_rps": requests / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+async def main(args: argparse.Namespace) -> List[Dict[str, float]]:
+    server_config = HypercornConfig()
+    server_config.bind = [f"127.0.0.1:{args.port}"]
+    server_config.accesslog = None
+    server_config.errorlog = None
+    # Defaults would recycle a connection after 1000 requests, which
+    # aborts every multiplexed stream still in flight on it
+    server_config.keep_alive_max_requests = 10 ** 9
+    server_config.h2_max_concurrent_streams = 1000
+    shutdown = asyncio.Event()
+    server = asyncio.create_task(serve(
+        create_app(latency=args.latency), server_config,
+        shutdown_trigger=shutdown.wait
+    ))
+    await asyncio.sleep(0.5)
+
+    Config.RNC_BASE_URL = f"http://127.0.0.1:{args.port}{API_PREFIX}"
+    Config._RNC_TOKEN = Config._RNC_TOKEN or "benchmark"
+    try:
+        return [
+            await run_workload(
+                http2, args.requests, args.concurrency, args.port)
+            for http2 in (False, True)
+        ]
+    finally:
+        shutdown.set()
+        await server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02,
+                        help="Emulated upstream latency in seconds.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--json", action="store_true",
+                        help="Print machine-readable results.")
+    args = parser.parse_args()
+
+    results = asyncio.run(main(args))
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            print(
+                f"{r['protocol']:<9} {r['throughput_rps']:8.1f} req/s  "
+                f"p50={r['p50_ms']:7.1f}ms  p99={r['p99_ms']:7.1f}ms  "
+                f"upstream={r['upstream_requests']}/{r['requests']}"
+            )
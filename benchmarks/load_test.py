@@ -0,0 +1,446 @@
+"""Load-test the MCP server's concordance tool over HTTP.
+
+Starts the local stand-in RNC server and the MCP server (streamable HTTP
+transport) as subprocesses, then calls the concordance tool with a
+weighted mix of the queries in tests/fixtures/e2e_queries.py. The load
+ramps through stages of increasing concurrency; each worker is a
+separate MCP session calling the tool back to back. Per stage, reports
+throughput, latency percentiles, errors, the server's peak RSS and CPU,
+and its concordance cache hits and misses (from /metrics).
+
+Usage (from the repository root):
+
+    python -m benchmarks.load_test --stages 1x10,8x10,32x20,64x20
+    python -m benchmarks.load_test --upstream-latency 0.1 \\
+        --upstream-error-rate 0.02 --output load.json
+
+Server settings come from the environment (e.g. RNC_MAX_CONCURRENCY).
+The client rate limit defaults to off (RNC_RATE_LIMIT=0) so the server,
+not the upstream quota, is measured. Use --server-url to target an
+already running server instead (RSS is then only reported with
+--server-pid).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from fastmcp import Client
+
+from benchmarks.mock_rnc_server import API_PREFIX
+from tests.fixtures import e2e_queries
+
+ROOT = Path(__file__).parent.parent
+
+# Query fixture name and weight; weights are relative
+DEFAULT_MIX = (
+    "SIMPLE_LEMMA_QUERY:4,STATISTICS_ONLY_QUERY:2,"
+    "COMPLEX_QUERY_WITH_SUBCORPUS:1,QUERY_WITH_CUSTOM_PAGINATION:1,"
+    "PAPER_SIMPLE:1,POETIC_PUSHKIN:1"
+)
+
+SERVER_SCRIPT = (
+    "import sys; sys.path.insert(0, 'src'); "
+    "from rnc_mcp.mcp import mcp; "
+    "mcp.run(transport='http', show_banner=False, "
+    "host=sys.argv[1], port=int(sys.argv[2]), log_level='warning')"
+)
+
+
+def parse_stages(spec: str) -> List[Tuple[int, float]]:
+    """'1x10,8x30' -> [(1, 10.0), (8, 30.0)]: concurrency x seconds."""
+    stages = []
+    for part in spec.split(","):
+        concurrency, _, seconds = part.strip().partition("x")
+        stages.append((int(concurrency), float(seconds)))
+    return stages
+
+
+def parse_mix(spec: str) -> List[Tuple[str, Dict[str, Any], float]]:
+    mix = []
+    for part in spec.split(","):
+        name, _, weight = part.strip().partition(":")
+        query = getattr(e2e_queries, name, None)
+        if not isinstance(query, dict) or "query" not in query:
+            raise SystemExit(f"Unknown query fixture: {name}")
+        mix.append((name, query, float(weight or 1)))
+    return mix
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def cpu_seconds(pid: int) -> Optional[float]:
+    """User + system CPU time of a process (Linux /proc; None elsewhere)."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            # Fields after the parenthesised command name; utime and
+            # stime are the 14th and 15th fields of the whole line
+            fields = f.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def rss_bytes(pid: int) -> Optional[int]:
+    """Resident set size of a process (Linux /proc; None elsewhere)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+class Stage:
+    """Measurements of one concurrency stage."""
+
+    def __init__(self, concurrency: int, duration: float):
+        self.concurrency = concurrency
+        self.duration = duration
+        self.latencies: List[float] = []
+        self.errors: Dict[str, int] = {}
+        self.by_query: Dict[str, int] = {}
+        self.peak_rss: Optional[int] = None
+        self.server_cpu: Optional[float] = None
+        self.client_cpu = 0.0
+        self.cache: Optional[Dict[str, int]] = None
+        self.elapsed = 0.0
+
+    def record(self, name: str, latency: float, error: Optional[str]):
+        self.by_query[name] = self.by_query.get(name, 0) + 1
+        if error is None:
+            self.latencies.append(latency)
+        else:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def report(self) -> Dict[str, Any]:
+        errors = sum(self.errors.values())
+        total = len(self.latencies) + errors
+
+        def ms(pct: float) -> Optional[float]:
+            value = percentile(self.latencies, pct)
+            return None if value is None else round(value * 1000, 2)
+
+        def cpu_pct(seconds: Optional[float]) -> Optional[float]:
+            if seconds is None or not self.elapsed:
+                return None
+            return round(100 * seconds / self.elapsed, 1)
+
+        return {
+            "concurrency": self.concurrency,
+            "duration_s": round(self.elapsed, 2),
+            "requests": total,
+            "errors": errors,
+            "error_rate": round(errors / total, 4) if total else 0.0,
+            "throughput_rps": round(total / self.elapsed, 2)
+            if self.elapsed else 0.0,
+            "p50_ms": ms(50),
+            "p95_ms": ms(95),
+            "p99_ms": ms(99),
+            "max_ms": ms(100),
+            "peak_rss_mb": round(self.peak_rss / 2 ** 20, 1)
+            if self.peak_rss else None,
+            # Near 100% of one core the single-threaded server (or, for
+            # the client, this harness) is the bottleneck
+            "server_cpu_pct": cpu_pct(self.server_cpu),
+            "client_cpu_pct": cpu_pct(self.client_cpu),
+            # Hits inflate throughput; expect none without --repeat-queries
+            "cache_hits": self.cache.get("hit", 0)
+            if self.cache is not None else None,
+            "cache_misses": self.cache.get("miss", 0)
+            if self.cache is not None else None,
+            "errors_by_type": dict(sorted(self.errors.items())),
+            "requests_by_query": dict(sorted(self.by_query.items())),
+        }
+
+
+async def ignore_log(message) -> None:
+    """Drop server log notifications (e.g. retry warnings)."""
+
+
+class LoadTest:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.mix = parse_mix(args.mix)
+        self.rng = random.Random(args.seed)
+        self.clients: List[Client] = []
+        self.server_pid: Optional[int] = args.server_pid
+        self.sequence = 0
+
+    def next_call(self) -> Tuple[str, Dict[str, Any]]:
+        name, query, _ = self.rng.choices(
+            self.mix, weights=[w for _, _, w in self.mix])[0]
+        arguments = json.loads(json.dumps(query))
+        if not self.args.repeat_queries:
+            # A distinct payload per call keeps the response cache out of
+            # the measurement. Stats-only searches always request page 0,
+            # so they get a distinct date range instead of a distinct page
+            self.sequence += 1
+            query = arguments["query"]
+            if query.get("return_examples", True):
+                query["page"] = self.sequence
+            else:
+                subcorpus = query.get("subcorpus") or {}
+                subcorpus["date_range"] = {
+                    "start_year": 1, "end_year": self.sequence
+                }
+                query["subcorpus"] = subcorpus
+        return name, arguments
+
+    async def client(self, index: int) -> Client:
+        while len(self.clients) <= index:
+            client = Client(self.args.server_url, log_handler=ignore_log)
+            await client.__aenter__()
+            self.clients.append(client)
+        return self.clients[index]
+
+    async def run_stage(self, stage: Stage) -> None:
+        clients = [await self.client(i) for i in range(stage.concurrency)]
+        started = time.perf_counter()
+        deadline = started + stage.duration
+
+        async def worker(client: Client) -> None:
+            while time.perf_counter() < deadline:
+                name, arguments = self.next_call()
+                start = time.perf_counter()
+                error = None
+                try:
+                    result = await client.call_tool(
+                        "concordance", arguments,
+                        timeout=self.args.timeout, raise_on_error=False)
+                    if result.is_error:
+                        text = result.content[0].text if result.content else ""
+                        error = text.split(":", 1)[0] or "Tool error"
+                except Exception as e:
+                    error = type(e).__name__
+                stage.record(name, time.perf_counter() - start, error)
+
+        async def sample_rss() -> None:
+            while self.server_pid is not None:
+                rss = rss_bytes(self.server_pid)
+                if rss is not None:
+                    stage.peak_rss = max(stage.peak_rss or 0, rss)
+                await asyncio.sleep(0.25)
+
+        server_cpu = self.server_cpu()
+        client_cpu = time.process_time()
+        cache = await self.cache_lookups()
+        sampler = asyncio.create_task(sample_rss())
+        try:
+            await asyncio.gather(*[worker(c) for c in clients])
+        finally:
+            sampler.cancel()
+            stage.elapsed = time.perf_counter() - started
+            stage.client_cpu = time.process_time() - client_cpu
+            if server_cpu is not None:
+                stage.server_cpu = self.server_cpu() - server_cpu
+        after = await self.cache_lookups()
+        if cache is not None and after is not None:
+            stage.cache = {
+                result: int(after.get(result, 0) - cache.get(result, 0))
+                for result in after
+            }
+
+    async def cache_lookups(self) -> Optional[Dict[str, float]]:
+        """The server's rnc_cache_lookups_total by result, if reachable."""
+        url = self.args.server_url.rsplit("/", 1)[0] + "/metrics"
+        prefix = 'rnc_cache_lookups_total{result="'
+        try:
+            async with httpx.AsyncClient() as http:
+                response = await http.get(url)
+                response.raise_for_status()
+        except httpx.HTTPError:
+            return None
+        lookups = {}
+        for line in response.text.splitlines():
+            if line.startswith(prefix):
+                labels, _, value = line.rpartition(" ")
+                lookups[labels[len(prefix):-2]] = float(value)
+        return lookups
+
+    def server_cpu(self) -> Optional[float]:
+        if self.server_pid is None:
+            return None
+        return cpu_seconds(self.server_pid)
+
+    async def run(self) -> List[Dict[str, Any]]:
+        reports = []
+        try:
+            for concurrency, duration in parse_stages(self.args.stages):
+                stage = Stage(concurrency, duration)
+                await self.run_stage(stage)
+                report = stage.report()
+                reports.append(report)
+                if not self.args.json:
+                    print_stage(report)
+        finally:
+            for client in self.clients:
+                await client.__aexit__(None, None, None)
+        return reports
+
+
+def print_stage(r: Dict[str, Any]) -> None:
+    def fmt(value: Optional[float]) -> str:
+        return f"{value:8.1f}" if value is not None else "       -"
+
+    print(
+        f"c={r['concurrency']:<4} {r['throughput_rps']:8.1f} req/s  "
+        f"p50={fmt(r['p50_ms'])}ms p95={fmt(r['p95_ms'])}ms "
+        f"p99={fmt(r['p99_ms'])}ms  errors={r['error_rate']:.2%}  "
+        f"rss={fmt(r['peak_rss_mb'])}MB  "
+        f"cpu server={fmt(r['server_cpu_pct'])}% "
+        f"client={fmt(r['client_cpu_pct'])}%  "
+        f"cache hits={r['cache_hits'] if r['cache_hits'] is not None else '-'}",
+        flush=True
+    )
+
+
+def start_processes(
+    args: argparse.Namespace
+) -> List[subprocess.Popen]:
+    """Start the stand-in upstream and the MCP server."""
+    log = open(args.server_log, "a") if args.server_log else None
+    output = log or subprocess.DEVNULL
+    upstream = subprocess.Popen(
+        [
+            sys.executable, "-m", "benchmarks.mock_rnc_server",
+            "--port", str(args.upstream_port),
+            "--latency", str(args.upstream_latency),
+            "--jitter", str(args.upstream_jitter),
+            "--error-rate", str(args.upstream_error_rate),
+            "--rate-limit-rate", str(args.upstream_rate_limit_rate),
+            "--snippets", str(args.upstream_snippets),
+            "--seed", str(args.seed),
+            *(["--docs", str(args.upstream_docs)]
+              if args.upstream_docs is not None else []),
+        ],
+        cwd=ROOT, stdout=output, stderr=output
+    )
+    env = dict(os.environ)
+    env["RNC_BASE_URL"] = f"http://127.0.0.1:{args.upstream_port}{API_PREFIX}"
+    env.setdefault("RNC_API_TOKEN", "load-test")
+    env.setdefault("RNC_RATE_LIMIT", "0")
+    env.setdefault("RNC_PREWARM", "false")
+    server = subprocess.Popen(
+        [sys.executable, "-c", SERVER_SCRIPT, "127.0.0.1", str(args.port)],
+        cwd=ROOT, env=env, stdout=output, stderr=output
+    )
+    return [upstream, server]
+
+
+async def wait_ready(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as http:
+        while True:
+            try:
+                if (await http.get(url)).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            if time.monotonic() > deadline:
+                raise SystemExit(f"Server not ready after {timeout:g}s: {url}")
+            await asyncio.sleep(0.2)
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"], cwd=ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main(args: argparse.Namespace) -> Dict[str, Any]:
+    processes = []
+    if args.server_url is None:
+        processes = start_processes(args)
+        args.server_url = f"http://127.0.0.1:{args.port}/mcp"
+        args.server_pid = processes[1].pid
+    try:
+        await wait_ready(args.server_url.rsplit("/", 1)[0] + "/ready")
+        stages = await LoadTest(args).run()
+    finally:
+        for process in reversed(processes):
+            process.terminate()
+            process.wait(timeout=10)
+
+    return {
+        "benchmark": "load_test",
+        "revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "settings": {
+            "stages": args.stages,
+            "mix": args.mix,
+            "repeat_queries": args.repeat_queries,
+            "upstream_latency": args.upstream_latency,
+            "upstream_error_rate": args.upstream_error_rate,
+            "upstream_rate_limit_rate": args.upstream_rate_limit_rate,
+            "upstream_docs": args.upstream_docs,
+            "seed": args.seed,
+        },
+        "stages": stages,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stages", default="1x10,8x10,32x20,64x20",
+                        help="Concurrency x seconds per stage, in order.")
+    parser.add_argument("--mix", default=DEFAULT_MIX,
+                        help="Comma-separated e2e_queries fixture "
+                             "names with optional :weight.")
+    parser.add_argument("--repeat-queries", action="store_true",
+                        help="Send fixtures unchanged, so repeats are "
+                             "served from the response cache.")
+    parser.add_argument("--timeout", type=float, default=60.0,
+                        help="Seconds before a tool call counts as failed.")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--server-url", default=None,
+                        help="MCP endpoint of a running server "
+                             "(e.g. http://127.0.0.1:8000/mcp).")
+    parser.add_argument("--server-pid", type=int, default=None,
+                        help="PID of that server, to report its RSS.")
+    parser.add_argument("--server-log", default=None,
+                        help="File for the subprocesses' output.")
+    parser.add_argument("--upstream-port", type=int, default=8765)
+    parser.add_argument("--upstream-latency", type=float, default=0.05)
+    parser.add_argument("--upstream-jitter", type=float, default=0.02)
+    parser.add_argument("--upstream-error-rate", type=float, default=0.0)
+    parser.add_argument("--upstream-rate-limit-rate", type=float,
+                        default=0.0)
+    parser.add_argument("--upstream-docs", type=int, default=None,
+                        help="Documents per concordance page "
+                             "(default: the small fixture response).")
+    parser.add_argument("--upstream-snippets", type=int, default=5)
+    parser.add_argument("--json", action="store_true",
+                        help="Print the machine-readable report.")
+    parser.add_argument("--output", default=None,
+                        help="Also write the JSON report to this file.")
+    args = parser.parse_args()
+
+    report = asyncio.run(main(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
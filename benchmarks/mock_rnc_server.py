@@ -0,0 +1,149 @@
+"""Local stand-in for the RNC API.
+
+Serves the payload shapes from tests/fixtures/mock_responses.py on the
+same paths as the public API, so RNCClient (or the whole MCP server) can
+be benchmarked and load-tested without a token or network access.
+
+Latency, error rate, 429 throttling and response size are configurable,
+and fault injection is seeded, so runs are reproducible. Point the
+server at it through the environment:
+
+    python -m benchmarks.mock_rnc_server --port 8765 --latency 0.05 \\
+        --error-rate 0.01 --rate-limit-rate 0.05 --docs 50
+    RNC_BASE_URL=http://127.0.0.1:8765/api/v1 RNC_API_TOKEN=mock \\
+        python main.py
+
+GET /_mock/stats reports how many responses were served per status.
+"""
+
+import argparse
+import asyncio
+import random
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from tests.fixtures.mock_responses import (
+    CONCORDANCE_SUCCESS,
+    CORPUS_CONFIG_MAIN,
+    ATTRIBUTES_GRAMMAR,
+)
+from tests.fixtures.synthetic_responses import build_concordance_response
+
+API_PREFIX = "/api/v1"
+
+
+def create_app(
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    error_rate: float = 0.0,
+    rate_limit_rate: float = 0.0,
+    retry_after: float = 1.0,
+    docs: Optional[int] = None,
+    snippets: int = 5,
+    total_pages: int = 100,
+    seed: Optional[int] = None
+) -> Starlette:
+    """
+    Build the stand-in ASGI app.
+
+    Every response is delayed by `latency` seconds plus up to `jitter`
+    more, to emulate upstream work. A fraction `rate_limit_rate` of
+    requests gets 429 with a Retry-After of `retry_after` seconds, and a
+    fraction `error_rate` gets 503. With `docs`, concordance responses
+    are synthetic pages of that many documents with `snippets` snippets
+    each (and `total_pages` pages in total) instead of the small fixture.
+    """
+    rng = random.Random(seed)
+    served: Counter = Counter()
+    if docs is None:
+        concordance_payload = CONCORDANCE_SUCCESS
+    else:
+        # Built once: response size, not payload generation, is measured
+        concordance_payload = build_concordance_response(docs, snippets)
+        concordance_payload["pagination"]["totalPageCount"] = total_pages
+
+    async def respond(payload: Dict[str, Any]) -> JSONResponse:
+        delay = latency + (rng.uniform(0, jitter) if jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        draw = rng.random()
+        if draw < rate_limit_rate:
+            response = JSONResponse(
+                {"detail": "Too many requests"}, status_code=429,
+                headers={"Retry-After": f"{retry_after:g}"})
+        elif draw < rate_limit_rate + error_rate:
+            response = JSONResponse(
+                {"detail": "Service unavailable"}, status_code=503)
+        else:
+            response = JSONResponse(payload)
+        served[response.status_code] += 1
+        return response
+
+    async def concordance(request: Request) -> JSONResponse:
+        await request.body()
+        return await respond(concordance_payload)
+
+    async def config(request: Request) -> JSONResponse:
+        return await respond(CORPUS_CONFIG_MAIN)
+
+    async def attrs(request: Request) -> JSONResponse:
+        return await respond(ATTRIBUTES_GRAMMAR)
+
+    async def stats(request: Request) -> JSONResponse:
+        return JSONResponse({
+            "served": {str(status): n for status, n in sorted(served.items())}
+        })
+
+    return Starlette(routes=[
+        Route(f"{API_PREFIX}/lex-gramm/concordance", concordance,
+              methods=["POST"]),
+        Route(f"{API_PREFIX}/config/", config, methods=["GET"]),
+        Route(f"{API_PREFIX}/attrs/{{attr_type}}", attrs, methods=["GET"]),
+        Route("/_mock/stats", stats, methods=["GET"]),
+    ])
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Seconds every response is delayed.")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="Up to this many extra seconds of delay.")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of requests answered with 503.")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0,
+                        help="Fraction of requests answered with 429.")
+    parser.add_argument("--retry-after", type=float, default=1.0,
+                        help="Retry-After seconds sent with 429.")
+    parser.add_argument("--docs", type=int, default=None,
+                        help="Documents per synthetic concordance page "
+                             "(default: the small fixture response).")
+    parser.add_argument("--snippets", type=int, default=5,
+                        help="Snippets per synthetic document.")
+    parser.add_argument("--total-pages", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Seed for reproducible latency and faults.")
+    args = parser.parse_args()
+
+    print(f"Serving the RNC API stand-in at "
+          f"http://{args.host}:{args.port}{API_PREFIX}")
+    uvicorn.run(
+        create_app(
+            latency=args.latency, jitter=args.jitter,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            retry_after=args.retry_after, docs=args.docs,
+            snippets=args.snippets, total_pages=args.total_pages,
+            seed=args.seed
+        ),
+        host=args.host, port=args.port, log_level="warning"
+    )
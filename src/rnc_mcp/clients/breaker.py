@@ -0,0 +1,147 @@
+"""Circuit breaker for upstream RNC API endpoints."""
+import time
+from typing import Dict
+
+import httpx
+
+from rnc_mcp.exceptions import RNCCircuitOpenError
+from rnc_mcp.metrics import BREAKER_STATE
+
+ENDPOINTS = ("concordance", "config", "attrs")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Values of the rnc_circuit_breaker_state gauge
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """
+    Whether an error means the API is unhealthy: network errors,
+    timeouts, throttling and server errors. Other 4xx responses are
+    answers to a bad request and say nothing about the API's health.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to an endpoint that keeps failing.
+
+    - closed: requests pass. `failure_threshold` consecutive failures, or
+      responses slower than `latency_slo` seconds, open the circuit.
+    - open: requests fail immediately with RNCCircuitOpenError for
+      `recovery_timeout` seconds.
+    - half-open: one probe request is let through; its success closes
+      the circuit, its failure opens it again.
+
+    A non-positive `failure_threshold` disables the breaker and a
+    non-positive `latency_slo` disables the latency check.
+
+    The state is exported as the rnc_circuit_breaker_state gauge,
+    labelled with the breaker's name.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        latency_slo: float = 0.0
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.latency_slo = latency_slo
+        self._set_state(CLOSED)
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_threshold > 0
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a probe through."""
+        if self.state != OPEN:
+            return 0.0
+        elapsed = time.monotonic() - self._opened_at
+        return max(self.recovery_timeout - elapsed, 0.0)
+
+    def check(self) -> None:
+        """
+        Raise RNCCircuitOpenError unless a request may be sent now. In the
+        half-open state the first caller becomes the probe.
+        """
+        if not self.enabled or self.state == CLOSED:
+            return
+        if self.state == OPEN and self.retry_in() <= 0:
+            self._set_state(HALF_OPEN)
+        if self.state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return
+        self.rejected += 1
+        raise RNCCircuitOpenError(
+            f"RNC {self.name} endpoint is unavailable (circuit open after "
+            f"repeated failures); retry in {self.retry_in():.0f}s."
+        )
+
+    def record_error(self, error: BaseException) -> None:
+        """Record a request that raised `error`."""
+        if is_upstream_failure(error):
+            self.record_failure()
+        else:
+            # Cancelled or locally rejected requests say nothing about
+            # the API's health; just free the probe slot
+            self._probing = False
+
+    def record_success(self, latency: float) -> None:
+        if self.latency_slo > 0 and latency > self.latency_slo:
+            self.record_failure()
+            return
+        self._set_state(CLOSED)
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+        if not self.enabled:
+            return
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.opened += 1
+            self._set_state(OPEN)
+            self._opened_at = time.monotonic()
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        BREAKER_STATE.set(STATE_VALUES[state], endpoint=self.name)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened": self.opened,
+            "rejected": self.rejected
+        }
+
+
+def endpoint_breakers(
+    failure_threshold: int, recovery_timeout: float, latency_slo: float
+) -> Dict[str, CircuitBreaker]:
+    """One breaker per RNC API endpoint."""
+    return {
+        name: CircuitBreaker(
+            name, failure_threshold, recovery_timeout, latency_slo
+        )
+        for name in ENDPOINTS
+    }
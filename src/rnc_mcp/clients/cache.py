@@ -0,0 +1,112 @@
+"""Response cache for concordance requests."""
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+def _canonicalize(value: Any) -> Any:
+    """
+    Normalize a payload for hashing: drop keys whose value is None and
+    order condition lists, whose order does not change the query
+    (subsection order does, since it encodes the token sequence).
+    """
+    if isinstance(value, dict):
+        result = {}
+        for key, item in value.items():
+            if item is None:
+                continue
+            item = _canonicalize(item)
+            if key == "conditionValues":
+                item = sorted(
+                    item, key=lambda c: json.dumps(c, sort_keys=True)
+                )
+            result[key] = item
+        return result
+    if isinstance(value, list):
+        return [_canonicalize(item) for item in value]
+    return value
+
+
+def canonical_payload_key(payload: Dict[str, Any]) -> str:
+    """Stable hash of a concordance payload, including its pagination."""
+    canonical = json.dumps(
+        _canonicalize(payload),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ConcordanceCache:
+    """
+    LRU cache of raw concordance responses bounded by total response size.
+
+    Entries expire `ttl` seconds after they are stored. A non-positive
+    `max_bytes` or `ttl` disables the cache. Cached responses are shared
+    between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> (response, size in bytes, stored at)
+        self._entries: OrderedDict[
+            str, Tuple[Dict[str, Any], int, float]
+        ] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and self.ttl > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[2] >= self.ttl:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def get_stale(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return an entry even if it has expired (e.g. API outages)."""
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def put(self, key: str, response: Dict[str, Any], size: int) -> None:
+        if not self.enabled or size > self.max_bytes:
+            return
+        self._discard(key)
+        self._entries[key] = (response, size, time.monotonic())
+        self.size += size
+        while self.size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
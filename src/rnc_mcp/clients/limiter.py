@@ -0,0 +1,189 @@
+"""Client-side limits for upstream RNC API traffic."""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+from rnc_mcp.exceptions import RNCQueueTimeoutError
+from rnc_mcp.metrics import (
+    LIMITER_MAX_WAITING, LIMITER_QUEUE_TIMEOUTS, LIMITER_WAITING
+)
+
+
+class ConcurrencyLimiter:
+    """
+    Bounds the number of concurrent upstream requests, both globally and
+    per corpus type, so bursts are queued instead of hitting the API at
+    once. A request that cannot get a slot within `max_wait` seconds
+    fails with RNCQueueTimeoutError.
+
+    Non-positive limits mean "unlimited". `per_corpus` overrides
+    `default_per_corpus` for individual corpus codes.
+
+    Queue depth and timeouts are exported as rnc_limiter_* metrics;
+    stats() returns the same counts for this limiter.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        default_per_corpus: int = 0,
+        per_corpus: Optional[Dict[str, int]] = None,
+        max_wait: float = 60.0
+    ):
+        self.max_concurrency = max_concurrency
+        self.default_per_corpus = default_per_corpus
+        self.per_corpus = per_corpus or {}
+        self.max_wait = max_wait
+        self._global = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency > 0
+            else None
+        )
+        self._corpus: Dict[str, Optional[asyncio.Semaphore]] = {}
+        self.in_flight = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.timeouts = 0
+        self._corpus_in_flight: Dict[str, int] = {}
+        self._corpus_waiting: Dict[str, int] = {}
+
+    def _corpus_semaphore(
+        self, corpus: Optional[str]
+    ) -> Optional[asyncio.Semaphore]:
+        if corpus is None:
+            return None
+        if corpus not in self._corpus:
+            limit = self.per_corpus.get(corpus, self.default_per_corpus)
+            self._corpus[corpus] = (
+                asyncio.Semaphore(limit) if limit > 0 else None
+            )
+        return self._corpus[corpus]
+
+    @asynccontextmanager
+    async def acquire(self, corpus: Optional[str] = None) -> AsyncIterator[None]:
+        # Take the corpus slot first so a request queued behind its own
+        # corpus does not hold a global slot other corpora could use
+        semaphores = [
+            s for s in (self._corpus_semaphore(corpus), self._global) if s
+        ]
+        acquired = []
+        self._enter_queue(corpus)
+        try:
+            async with asyncio.timeout(
+                self.max_wait if self.max_wait > 0 else None
+            ):
+                for semaphore in semaphores:
+                    await semaphore.acquire()
+                    acquired.append(semaphore)
+        except TimeoutError:
+            for semaphore in acquired:
+                semaphore.release()
+            self.timeouts += 1
+            LIMITER_QUEUE_TIMEOUTS.inc(corpus=corpus or "none")
+            raise RNCQueueTimeoutError(
+                f"No upstream slot for {corpus or 'RNC API'} request "
+                f"within {self.max_wait:g}s; the server is overloaded."
+            )
+        except BaseException:
+            for semaphore in acquired:
+                semaphore.release()
+            raise
+        finally:
+            self._leave_queue(corpus)
+
+        self._adjust(self._corpus_in_flight, corpus, 1)
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._adjust(self._corpus_in_flight, corpus, -1)
+            for semaphore in acquired:
+                semaphore.release()
+
+    def stats(self) -> Dict[str, object]:
+        """Current queue depth and in-flight counts."""
+        return {
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "timeouts": self.timeouts,
+            "in_flight_per_corpus": dict(self._corpus_in_flight),
+            "waiting_per_corpus": dict(self._corpus_waiting)
+        }
+
+    def _enter_queue(self, corpus: Optional[str]) -> None:
+        self.waiting += 1
+        if self.waiting > self.max_waiting:
+            self.max_waiting = self.waiting
+            if self.waiting > LIMITER_MAX_WAITING.value():
+                LIMITER_MAX_WAITING.set(self.waiting)
+        self._adjust(self._corpus_waiting, corpus, 1)
+        LIMITER_WAITING.inc(corpus=corpus or "none")
+
+    def _leave_queue(self, corpus: Optional[str]) -> None:
+        self.waiting -= 1
+        self._adjust(self._corpus_waiting, corpus, -1)
+        LIMITER_WAITING.dec(corpus=corpus or "none")
+
+    @staticmethod
+    def _adjust(counts: Dict[str, int], corpus: Optional[str], delta: int):
+        if corpus is None:
+            return
+        value = counts.get(corpus, 0) + delta
+        if value:
+            counts[corpus] = value
+        else:
+            counts.pop(corpus, None)
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter: `rate` requests per second on average with
+    bursts of up to `burst` requests. Callers wait in arrival order for a
+    token. A non-positive `rate` disables the limiter.
+
+    pause() stops handing out tokens for a while, so a 429 with
+    Retry-After backs off every request instead of only the throttled one.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.throttled = 0
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    async def acquire(self) -> None:
+        if not self.enabled:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._paused_until - now
+                if wait <= 0 and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                if wait <= 0:
+                    wait = (1 - self.tokens) / self.rate
+                self.throttled += 1
+                await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next `seconds` seconds."""
+        now = time.monotonic()
+        self._refill(now)
+        self._paused_until = max(self._paused_until, now + seconds)
+        self.tokens = min(self.tokens, 1.0)
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self._updated, 0.0)
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self._updated = now
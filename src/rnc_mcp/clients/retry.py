@@ -0,0 +1,64 @@
+"""Retry policy for transient upstream RNC API errors."""
+import email.utils
+import random
+import time
+from typing import Optional
+
+# Throttling and gateway errors that usually succeed when retried
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delay in seconds or an HTTP date) into
+    seconds from now. Returns None for a missing or malformed header.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(when.timestamp() - time.time(), 0.0)
+
+
+class RetryPolicy:
+    """
+    Bounded, jittered retries for RETRY_STATUSES.
+
+    Without Retry-After the n-th retry waits a random time up to
+    `backoff * 2**n` seconds ("full jitter"), capped at `max_delay`. A
+    Retry-After delay is honored and only gets up to `backoff` seconds of
+    jitter on top, so throttled clients do not retry in lockstep; if it
+    exceeds `max_delay` the request is not retried at all.
+    """
+
+    def __init__(
+        self, max_retries: int, backoff: float = 0.5, max_delay: float = 30.0
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_delay = max_delay
+
+    def delay(
+        self, attempt: int, status: int, retry_after: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Seconds to wait before retry number `attempt + 1`, or None if the
+        request should not be retried.
+        """
+        if status not in RETRY_STATUSES or attempt >= self.max_retries:
+            return None
+        requested = parse_retry_after(retry_after)
+        if requested is not None:
+            if requested > self.max_delay:
+                return None
+            return requested + random.uniform(0, self.backoff)
+        return random.uniform(
+            0, min(self.backoff * 2 ** attempt, self.max_delay)
+        )
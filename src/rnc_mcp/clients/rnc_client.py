@@ -1,59 +1,488 @@
+import asyncio
 import httpx
+import importlib.util
 import json
-from typing import Dict, Any
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Tuple
 from rnc_mcp.config import Config
 from rnc_mcp.clients.base import CorpusClient
-from rnc_mcp.exceptions import RNCAuthError, RNCAPIError
+from rnc_mcp.clients.breaker import CircuitBreaker
+from rnc_mcp.clients.cache import ConcordanceCache, canonical_payload_key
+from rnc_mcp.clients.limiter import ConcurrencyLimiter, TokenBucket
+from rnc_mcp.clients.retry import RetryPolicy
+from rnc_mcp.clients.singleflight import SingleFlight
+from rnc_mcp.clients.snapshot import SnapshotStore
+from rnc_mcp.exceptions import (
+    RNCAuthError, RNCAPIError, RNCCircuitOpenError, RNCConfigError,
+    RNCRateLimitError
+)
+from rnc_mcp.metrics import (
+    CACHE_LOOKUPS, UPSTREAM_IN_FLIGHT, UPSTREAM_RESPONSES, UPSTREAM_RETRIES,
+    stage
+)
+from rnc_mcp.tracing import KIND_CLIENT
 from rnc_mcp.utils import measure_time
 
+logger = logging.getLogger(__name__)
+
+
+class _Notices:
+    """
+    Stands in for a ctx in work shared by several callers: records the
+    notifications so each caller can replay them to its own ctx.
+    """
 
-class RNCClient(CorpusClient):
     def __init__(self):
+        self.messages: List[Tuple[str, str]] = []
+
+    async def info(self, message: str) -> None:
+        self.messages.append(("info", message))
+
+    async def warning(self, message: str) -> None:
+        self.messages.append(("warning", message))
+
+
+class RNCClient(CorpusClient):
+    """
+    Client for the RNC public API.
+
+    Owns a single pooled httpx.AsyncClient, so consecutive requests reuse
+    warm keep-alive connections. Call open()/aclose() (or use the client as
+    an async context manager) to bind the pool to the server lifespan;
+    requests made before open() lazily create the pool.
+
+    With Config.RNC_HTTP2 enabled, concurrent requests are multiplexed as
+    HTTP/2 streams over a few connections. Plain http:// base URLs (e.g. a
+    local stand-in server) use HTTP/2 with prior knowledge.
+
+    With a SnapshotStore, config and attrs responses are served from the
+    on-disk snapshot (loaded on open()) and refreshed in the background
+    once older than Config.RNC_SNAPSHOT_REFRESH_INTERVAL, so restarts
+    need no upstream calls and keep working while the API is unreachable.
+
+    With a ConcordanceCache, identical concordance payloads (compared by
+    canonical hash) are answered from memory until they expire. Identical
+    payloads requested concurrently are coalesced into one request.
+
+    With a ConcurrencyLimiter, upstream requests queue for a global and a
+    per-corpus slot before they are sent; a TokenBucket additionally caps
+    the request rate. With a RetryPolicy, throttled (429) and gateway
+    (502/503/504) responses are retried after a jittered delay that
+    honors Retry-After; each retry is reported to the request's ctx
+    (for coalesced concordance requests, to every caller's ctx once the
+    shared request has finished).
+
+    With circuit breakers (keyed by endpoint: concordance, config, attrs),
+    requests to a failing endpoint fail fast with RNCCircuitOpenError.
+    While the concordance circuit is open, expired cached responses are
+    served instead; config and attrs keep being served from the snapshot.
+
+    Upstream and JSON decode latencies, response statuses, retries, cache
+    lookups and in-flight requests are recorded in rnc_mcp.metrics.
+    """
+
+    def __init__(
+        self,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        snapshot: Optional[SnapshotStore] = None,
+        concordance_cache: Optional[ConcordanceCache] = None,
+        limiter: Optional[ConcurrencyLimiter] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        breakers: Optional[Dict[str, CircuitBreaker]] = None
+    ):
         self.timeout = httpx.Timeout(30.0, connect=10.0)
+        self.limits = httpx.Limits(
+            max_connections=Config.RNC_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=Config.RNC_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=Config.RNC_HTTP_KEEPALIVE_EXPIRY
+        )
+        self._transport = transport
+        self._http: Optional[httpx.AsyncClient] = None
+        self.snapshot = snapshot
+        self.concordance_cache = concordance_cache
+        self._inflight = SingleFlight()
+        self.limiter = limiter
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.retries = 0
+        self.breakers = breakers or {}
+        self._snapshot_loaded = False
+        self._snapshot_lock = asyncio.Lock()
+        self._refreshes: Dict[str, asyncio.Task] = {}
+        self._save_task: Optional[asyncio.Task] = None
 
-    @measure_time
-    async def execute_concordance(
-            self, payload: Dict[str, Any], **kwargs) -> Dict[str, Any]:
-        async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
+    @property
+    def is_open(self) -> bool:
+        return self._http is not None and not self._http.is_closed
+
+    async def open(self) -> None:
+        """
+        Create the shared connection pool if it is not open yet and load
+        the snapshot, if one is configured.
+        """
+        self._get_http_client()
+        if self.snapshot is not None:
+            await self._load_snapshot()
+
+    async def aclose(self) -> None:
+        """
+        Stop background snapshot refreshes, persist pending snapshot
+        changes and close the shared connection pool.
+        """
+        refreshes = list(self._refreshes.values())
+        for task in refreshes:
+            task.cancel()
+        await asyncio.gather(*refreshes, return_exceptions=True)
+        if self._save_task is not None:
+            await asyncio.gather(self._save_task, return_exceptions=True)
+        if self.snapshot is not None and self.snapshot.dirty:
             try:
-                response = await client.post(
-                    f"{Config.RNC_BASE_URL}/lex-gramm/concordance",
-                    json=payload,
-                    headers=Config.rnc_headers()
+                await asyncio.to_thread(
+                    self.snapshot.write, *self.snapshot.dump())
+            except OSError as e:
+                logger.warning("Failed to write RNC snapshot: %s", e)
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def __aenter__(self) -> "RNCClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        if not self.is_open:
+            http2 = Config.RNC_HTTP2
+            if http2 and importlib.util.find_spec("h2") is None:
+                raise RNCConfigError(
+                    "RNC_HTTP2 is enabled but the 'h2' package is not "
+                    "installed. Install it with: pip install 'httpx[http2]'"
                 )
-                response.raise_for_status()
-                return response.json()
+            self._http = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                follow_redirects=True,
+                http1=not (
+                    http2 and Config.RNC_BASE_URL.startswith("http://")
+                ),
+                http2=http2,
+                transport=self._transport
+            )
+        return self._http
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        endpoint: Optional[str] = None,
+        corpus: Optional[str] = None,
+        ctx: Optional[Any] = None,
+        **kwargs
+    ) -> httpx.Response:
+        breaker = self.breakers.get(endpoint)
+        attempt = 0
+        while True:
+            try:
+                response = await self._send_guarded(
+                    breaker, method, path, corpus, endpoint=endpoint,
+                    **kwargs)
             except httpx.HTTPStatusError as e:
-                if e.response.status_code == 401:
-                    raise RNCAuthError(
-                        "Invalid RNC Token. Please check your API key.")
-                raise RNCAPIError(
-                    f"RNC API Error {
-                        e.response.status_code}: {
-                        e.response.text}")
+                delay = self._retry_delay(attempt, e.response)
+                if delay is None:
+                    raise
+                attempt += 1
+                UPSTREAM_RETRIES.inc(
+                    endpoint=endpoint, status=e.response.status_code)
+                await self._report_retry(
+                    ctx, path, e.response.status_code, attempt, delay)
+                # Sleep outside the limiter so the slot serves others
+                await asyncio.sleep(delay)
+                continue
+            if attempt:
+                await self._report(
+                    ctx, "info",
+                    f"RNC API request {path} succeeded after "
+                    f"{attempt} retr{'y' if attempt == 1 else 'ies'}"
+                )
+            return response
 
-    async def get_corpus_config(self, corpus_type: str) -> Dict[str, Any]:
-        async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-            params = {"corpus": json.dumps({"type": corpus_type})}
-            response = await client.get(
-                f"{Config.RNC_BASE_URL}/config/",
-                params=params,
-                headers=Config.rnc_headers()
+    async def _send_guarded(
+        self,
+        breaker: Optional[CircuitBreaker],
+        method: str,
+        path: str,
+        corpus: Optional[str],
+        **kwargs
+    ) -> httpx.Response:
+        if breaker is None:
+            return await self._send_limited(method, path, corpus, **kwargs)
+        breaker.check()
+        try:
+            return await self._send_limited(
+                method, path, corpus, breaker=breaker, **kwargs)
+        except BaseException as e:
+            breaker.record_error(e)
+            raise
+
+    async def _send_limited(
+        self, method: str, path: str, corpus: Optional[str], **kwargs
+    ) -> httpx.Response:
+        if self.limiter is None:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            return await self._send(method, path, **kwargs)
+        async with self.limiter.acquire(corpus):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            return await self._send(method, path, **kwargs)
+
+    def _retry_delay(
+        self, attempt: int, response: httpx.Response
+    ) -> Optional[float]:
+        if self.retry_policy is None:
+            return None
+        return self.retry_policy.delay(
+            attempt, response.status_code,
+            response.headers.get("Retry-After")
+        )
+
+    async def _report_retry(
+        self,
+        ctx: Optional[Any],
+        path: str,
+        status: int,
+        attempt: int,
+        delay: float
+    ) -> None:
+        self.retries += 1
+        if status == 429 and self.rate_limiter is not None:
+            # Back off every request, not only the throttled one
+            self.rate_limiter.pause(delay)
+        await self._report(
+            ctx, "warning",
+            f"RNC API returned {status} for {path}; retry "
+            f"{attempt}/{self.retry_policy.max_retries} in {delay:.1f}s"
+        )
+
+    @classmethod
+    async def _report(
+        cls, ctx: Optional[Any], level: str, message: str
+    ) -> None:
+        getattr(logger, level)(message)
+        await cls._notify(ctx, level, message)
+
+    @staticmethod
+    async def _notify(ctx: Optional[Any], level: str, message: str) -> None:
+        if ctx is None:
+            return
+        try:
+            await getattr(ctx, level)(message)
+        except Exception as e:
+            # A caller that went away must not fail the request
+            logger.debug("Log notification failed: %s", e)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        breaker: Optional[CircuitBreaker] = None,
+        endpoint: Optional[str] = None,
+        **kwargs
+    ) -> httpx.Response:
+        start = time.monotonic()
+        try:
+            with UPSTREAM_IN_FLIGHT.track(endpoint=endpoint):
+                with stage(
+                    "upstream", kind=KIND_CLIENT,
+                    **{
+                        "http.request.method": method,
+                        "url.path": path,
+                        "rnc.endpoint": endpoint
+                    }
+                ) as span:
+                    response = await self._get_http_client().request(
+                        method,
+                        f"{Config.RNC_BASE_URL}{path}",
+                        headers=Config.rnc_headers(),
+                        **kwargs
+                    )
+                    if span is not None:
+                        span.set_attribute(
+                            "http.response.status_code",
+                            response.status_code)
+        except httpx.TransportError:
+            UPSTREAM_RESPONSES.inc(endpoint=endpoint, status="error")
+            raise
+        UPSTREAM_RESPONSES.inc(
+            endpoint=endpoint, status=response.status_code)
+        response.raise_for_status()
+        if breaker is not None:
+            # Upstream time only, excluding time queued by the limiters
+            breaker.record_success(time.monotonic() - start)
+        return response
+
+    @measure_time
+    async def execute_concordance(
+        self, payload: Dict[str, Any], cache: bool = True, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Runs a concordance query. With cache=False the result is neither
+        read from nor stored in the concordance cache, so one-off sweeps
+        such as jobs and exports do not evict interactive results.
+        """
+        key = canonical_payload_key(payload)
+        store = cache
+        cache = self.concordance_cache if store else None
+        if cache is not None and cache.enabled:
+            cached = cache.get(key)
+            CACHE_LOOKUPS.inc(result="miss" if cached is None else "hit")
+            if cached is not None:
+                return cached
+
+        # Identical payloads already in flight share one upstream request;
+        # its retry notices are replayed to each caller's own ctx
+        ctx = kwargs.get("ctx")
+        try:
+            result, notices = await self._inflight.do(
+                key, lambda: self._fetch_concordance(payload, key, store)
             )
-            response.raise_for_status()
-            return response.json()
+            for level, message in notices:
+                await self._notify(ctx, level, message)
+            return result
+        except RNCCircuitOpenError:
+            stale = cache.get_stale(key) if cache is not None else None
+            if stale is None:
+                raise
+            CACHE_LOOKUPS.inc(result="stale")
+            await self._report(
+                ctx, "warning",
+                "RNC API is unavailable; serving a cached result that "
+                "may be out of date"
+            )
+            return stale
+
+    async def _fetch_concordance(
+        self, payload: Dict[str, Any], key: str, store: bool = True
+    ) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+        notices = _Notices()
+        # The builder puts the RncCorpusType member here; limits and
+        # metrics are keyed by its code
+        corpus = payload.get("corpus", {}).get("type")
+        corpus = getattr(corpus, "value", corpus)
+        try:
+            response = await self._request(
+                "POST", "/lex-gramm/concordance",
+                endpoint="concordance",
+                corpus=corpus,
+                ctx=notices,
+                json=payload
+            )
+            size = len(response.content)
+            with stage("decode", **{"http.response.body.size": size}):
+                result = response.json()
+            if store and self.concordance_cache is not None:
+                self.concordance_cache.put(key, result, size)
+            return result, notices.messages
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                raise RNCAuthError(
+                    "Invalid RNC Token. Please check your API key.")
+            if e.response.status_code == 429:
+                raise RNCRateLimitError(
+                    "RNC API rate limit exceeded. Please retry later.")
+            raise RNCAPIError(
+                f"RNC API Error {e.response.status_code}: "
+                f"{e.response.text}")
+
+    async def get_corpus_config(self, corpus_type: str) -> Dict[str, Any]:
+        params = {"corpus": json.dumps({"type": corpus_type})}
+        return await self._get_with_snapshot(
+            f"config:{corpus_type}",
+            lambda: self._get_json(
+                "/config/", "config", corpus_type, params)
+        )
 
     async def get_attributes(
         self, corpus_type: str, attr_type: str
     ) -> Dict[str, Any]:
-        async with httpx.AsyncClient(
-            timeout=self.timeout, follow_redirects=True
-        ) as client:
-            params = {"corpus": json.dumps({"type": corpus_type})}
-            response = await client.get(
-                f"{Config.RNC_BASE_URL}/attrs/{attr_type}",
-                params=params,
-                headers=Config.rnc_headers()
-            )
-            response.raise_for_status()
+        params = {"corpus": json.dumps({"type": corpus_type})}
+        return await self._get_with_snapshot(
+            f"attrs:{corpus_type}:{attr_type}",
+            lambda: self._get_json(
+                f"/attrs/{attr_type}", "attrs", corpus_type, params)
+        )
+
+    async def _get_json(
+        self, path: str, endpoint: str, corpus: str, params: Dict[str, str]
+    ) -> Dict[str, Any]:
+        response = await self._request(
+            "GET", path, endpoint=endpoint, corpus=corpus, params=params
+        )
+        with stage("decode"):
             return response.json()
+
+    async def _get_with_snapshot(
+        self, key: str, fetch: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        if self.snapshot is None:
+            return await fetch()
+        await self._load_snapshot()
+
+        entry = self.snapshot.get(key)
+        if entry is None:
+            data = await fetch()
+            self._store_snapshot(key, data)
+            return data
+
+        data, fetched_at = entry
+        age = time.time() - fetched_at
+        if age > Config.RNC_SNAPSHOT_REFRESH_INTERVAL:
+            self._refresh_snapshot(key, fetch)
+        return data
+
+    async def _load_snapshot(self) -> None:
+        # Blocking file read, kept off the event loop; the lock stops a
+        # second load from discarding entries stored after the first
+        async with self._snapshot_lock:
+            if not self._snapshot_loaded:
+                await asyncio.to_thread(self.snapshot.load)
+                self._snapshot_loaded = True
+
+    def _refresh_snapshot(
+        self, key: str, fetch: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> None:
+        if key in self._refreshes:
+            return
+
+        async def refresh() -> None:
+            try:
+                self._store_snapshot(key, await fetch())
+            except Exception as e:
+                # Keep serving the snapshot while the API is unavailable
+                logger.warning(
+                    "Failed to refresh RNC snapshot entry %s: %s", key, e)
+            finally:
+                self._refreshes.pop(key, None)
+
+        self._refreshes[key] = asyncio.create_task(refresh())
+
+    def _store_snapshot(self, key: str, data: Dict[str, Any]) -> None:
+        self.snapshot.put(key, data)
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._save_snapshot())
+
+    async def _save_snapshot(self) -> None:
+        # Coalesces bursts of updates: entries stored while a write is
+        # in progress are picked up by the next loop iteration
+        while self.snapshot.dirty:
+            try:
+                await asyncio.to_thread(
+                    self.snapshot.write, *self.snapshot.dump()
+                )
+            except OSError as e:
+                logger.warning("Failed to write RNC snapshot: %s", e)
+                return
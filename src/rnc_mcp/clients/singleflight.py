@@ -0,0 +1,57 @@
+"""Request coalescing for identical in-flight calls."""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """
+    Merges concurrent calls that share a key into one upstream call whose
+    result (or exception) is fanned out to every waiter.
+
+    The shared call runs in its own task: a waiter that is cancelled
+    (e.g. its client disconnected) only stops waiting, the call keeps
+    running for the others. The call itself is cancelled only once every
+    waiter has gone, so abandoned work does not keep using the API quota;
+    callers arriving after that start a new call.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._calls[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda t: self._forget(key, t))
+
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if (not task.done() and self._calls.get(key) is task
+                    and self._waiters[key] == 1):
+                # Forget the call now, not when the task has finished
+                # cancelling, so a new caller starts a fresh call
+                # instead of joining the dying one
+                del self._calls[key]
+                del self._waiters[key]
+                task.cancel()
+            raise
+        finally:
+            if self._calls.get(key) is task:
+                self._waiters[key] -= 1
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+            del self._waiters[key]
+        # Waiters received the exception already; retrieve it so an
+        # abandoned call does not log "exception was never retrieved"
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,104 @@
+"""Persistent on-disk snapshot of corpus configs and attribute tagsets."""
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored layout changes; snapshots with another version
+# are ignored and rebuilt from the API.
+SNAPSHOT_VERSION = 1
+
+
+class SnapshotStore:
+    """
+    Versioned JSON file holding the last successful response of every
+    config and attrs request, keyed e.g. ``config:MAIN`` or
+    ``attrs:MAIN:gr``.
+
+    A snapshot is only reused when its version and base URL match the
+    running server. Writes go to a uniquely named temporary file that
+    atomically replaces the snapshot, so a crash never leaves a truncated
+    file. The store stays dirty until a write covering every change
+    has succeeded.
+    """
+
+    FILENAME = "rnc_snapshot.json"
+
+    def __init__(self, directory: Union[str, Path], base_url: str):
+        self.path = Path(directory) / self.FILENAME
+        self.base_url = base_url
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._changes = 0
+        self._saved = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def dirty(self) -> bool:
+        """Whether some change has not been written to disk yet."""
+        return self._changes > self._saved
+
+    def load(self) -> None:
+        """Read the snapshot from disk, ignoring missing or stale files."""
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable snapshot %s: %s", self.path, e)
+            return
+
+        if (
+            raw.get("version") != SNAPSHOT_VERSION
+            or raw.get("base_url") != self.base_url
+        ):
+            logger.info("Ignoring outdated snapshot %s", self.path)
+            return
+        self._entries = raw.get("entries", {})
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Return the stored data and its fetch time (Unix seconds)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return entry["data"], entry["fetched_at"]
+
+    def put(self, key: str, data: Any) -> None:
+        self._entries[key] = {"fetched_at": time.time(), "data": data}
+        self._changes += 1
+
+    def dump(self) -> Tuple[str, int]:
+        """Serialize the snapshot; also returns the changes it covers."""
+        return json.dumps({
+            "version": SNAPSHOT_VERSION,
+            "base_url": self.base_url,
+            "entries": self._entries
+        }, ensure_ascii=False), self._changes
+
+    def write(self, content: str, changes: int) -> None:
+        """
+        Atomically replace the snapshot file with `content`, as returned
+        by dump() together with `changes`.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.path.parent,
+            prefix=f"{self.path.name}.", suffix=".tmp", delete=False
+        )
+        try:
+            with tmp:
+                tmp.write(content)
+            os.replace(tmp.name, self.path)
+        except BaseException:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+        self._saved = max(self._saved, changes)
+
+    def save(self) -> None:
+        self.write(*self.dump())
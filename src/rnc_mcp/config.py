@@ -9,10 +9,155 @@ from rnc_mcp.exceptions import RNCConfigError
 load_dotenv()
 
 
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def _data_dir(*parts: str) -> str:
+    """A path in the per-user data directory ($XDG_DATA_HOME/rnc_mcp)."""
+    base = os.getenv("XDG_DATA_HOME") or os.path.join(
+        os.path.expanduser("~"), ".local", "share")
+    return os.path.join(base, "rnc_mcp", *parts)
+
+
+def _env_int_map(name: str) -> Dict[str, int]:
+    """Parse 'KEY=1,OTHER=2' into a dict."""
+    result = {}
+    for item in (os.getenv(name) or "").split(","):
+        if "=" in item:
+            key, value = item.split("=", 1)
+            result[key.strip().upper()] = int(value)
+    return result
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if not value:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
 class Config:
-    RNC_BASE_URL: str = "https://ruscorpora.ru/api/v1"
+    # RNC API root; point it at a local stand-in (e.g.
+    # benchmarks/mock_rnc_server.py) for offline development and load tests
+    RNC_BASE_URL: str = os.getenv(
+        "RNC_BASE_URL", "https://ruscorpora.ru/api/v1").rstrip("/")
     _RNC_TOKEN: Optional[str] = os.getenv("RNC_API_TOKEN")
 
+    # HTTP connection pool shared by all RNC API requests
+    RNC_HTTP_MAX_CONNECTIONS: int = _env_int("RNC_HTTP_MAX_CONNECTIONS", 20)
+    RNC_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = _env_int(
+        "RNC_HTTP_MAX_KEEPALIVE_CONNECTIONS", 10)
+    RNC_HTTP_KEEPALIVE_EXPIRY: float = _env_float(
+        "RNC_HTTP_KEEPALIVE_EXPIRY", 30.0)
+    # Opt-in HTTP/2 multiplexing (requires the 'h2' package)
+    RNC_HTTP2: bool = _env_bool("RNC_HTTP2", False)
+
+    # Concurrent upstream requests: global cap, default cap per corpus,
+    # per-corpus overrides ("MAIN=8,PAPER=4") and the maximum time a
+    # request may queue for a slot (0 means no limit)
+    RNC_MAX_CONCURRENCY: int = _env_int("RNC_MAX_CONCURRENCY", 16)
+    RNC_MAX_CONCURRENCY_PER_CORPUS: int = _env_int(
+        "RNC_MAX_CONCURRENCY_PER_CORPUS", 8)
+    RNC_CORPUS_CONCURRENCY: Dict[str, int] = _env_int_map(
+        "RNC_CORPUS_CONCURRENCY")
+    RNC_QUEUE_MAX_WAIT: float = _env_float("RNC_QUEUE_MAX_WAIT", 60.0)
+
+    # Request rate (requests per second, 0 disables) and burst size
+    RNC_RATE_LIMIT: float = _env_float("RNC_RATE_LIMIT", 10.0)
+    RNC_RATE_BURST: int = _env_int("RNC_RATE_BURST", 20)
+
+    # Retries of 429/502/503/504 responses: attempts, base backoff and
+    # the longest delay (including Retry-After) worth waiting for
+    RNC_MAX_RETRIES: int = _env_int("RNC_MAX_RETRIES", 3)
+    RNC_RETRY_BACKOFF: float = _env_float("RNC_RETRY_BACKOFF", 0.5)
+    RNC_RETRY_MAX_DELAY: float = _env_float("RNC_RETRY_MAX_DELAY", 30.0)
+
+    # Circuit breaker per endpoint: consecutive failures (or responses
+    # slower than the latency SLO, in seconds) that open the circuit, and
+    # seconds before a probe request is let through
+    RNC_BREAKER_FAILURE_THRESHOLD: int = _env_int(
+        "RNC_BREAKER_FAILURE_THRESHOLD", 5)
+    RNC_BREAKER_RECOVERY_TIMEOUT: float = _env_float(
+        "RNC_BREAKER_RECOVERY_TIMEOUT", 30.0)
+    RNC_BREAKER_LATENCY_SLO: float = _env_float(
+        "RNC_BREAKER_LATENCY_SLO", 15.0)
+
+    # Maximum number of result pages one multi-page search may request
+    RNC_MAX_PAGES_PER_QUERY: int = _env_int("RNC_MAX_PAGES_PER_QUERY", 20)
+
+    # Queries of one concordance_batch call run at once, and the largest
+    # accepted batch
+    RNC_BATCH_CONCURRENCY: int = _env_int("RNC_BATCH_CONCURRENCY", 8)
+    RNC_MAX_BATCH_SIZE: int = _env_int("RNC_MAX_BATCH_SIZE", 100)
+
+    # Seconds each corpus of a compare_corpora call may take (0: no limit)
+    RNC_COMPARE_TIMEOUT: float = _env_float("RNC_COMPARE_TIMEOUT", 20.0)
+
+    # Background concordance jobs: SQLite file persisting them (created
+    # with the first job), worker tasks, pages each job fetches at once,
+    # the most pages one job may collect, and the largest job_results batch
+    RNC_JOB_DB: str = os.getenv("RNC_JOB_DB") or _data_dir("jobs.sqlite3")
+    RNC_JOB_WORKERS: int = _env_int("RNC_JOB_WORKERS", 2)
+    RNC_JOB_PAGE_CONCURRENCY: int = _env_int("RNC_JOB_PAGE_CONCURRENCY", 4)
+    RNC_JOB_MAX_PAGES: int = _env_int("RNC_JOB_MAX_PAGES", 5000)
+    RNC_JOB_PAGE_RETRIES: int = _env_int("RNC_JOB_PAGE_RETRIES", 3)
+    RNC_JOB_RETRY_DELAY: float = _env_float("RNC_JOB_RETRY_DELAY", 5.0)
+    RNC_JOB_RESULTS_LIMIT: int = _env_int("RNC_JOB_RESULTS_LIMIT", 100)
+
+    # export_concordance: directory files are written to, the most pages
+    # one export may contain, and pages requested at once
+    RNC_EXPORT_DIR: str = os.getenv("RNC_EXPORT_DIR") or _data_dir("exports")
+    RNC_EXPORT_MAX_PAGES: int = _env_int("RNC_EXPORT_MAX_PAGES", 1000)
+    RNC_EXPORT_PAGE_CONCURRENCY: int = _env_int(
+        "RNC_EXPORT_PAGE_CONCURRENCY", 4)
+
+    # Tracing: fraction of tool calls traced (0 disables tracing), and
+    # where traces go as OTLP JSON: an OTLP/HTTP collector URL (e.g.
+    # http://localhost:4318) or, without one, a local file (one trace
+    # per line)
+    RNC_TRACE_SAMPLE_RATE: float = _env_float("RNC_TRACE_SAMPLE_RATE", 0.0)
+    RNC_TRACE_ENDPOINT: str = os.getenv("RNC_TRACE_ENDPOINT", "")
+    RNC_TRACE_FILE: str = os.getenv("RNC_TRACE_FILE", "")
+
+    # Generated corpus resources: seconds an entry is fresh, and how long
+    # after that a stale entry is still served while it is refreshed
+    RNC_RESOURCE_CACHE_TTL: float = _env_float(
+        "RNC_RESOURCE_CACHE_TTL", 86400.0)
+    RNC_RESOURCE_CACHE_STALE_TTL: float = _env_float(
+        "RNC_RESOURCE_CACHE_STALE_TTL", 604800.0)
+
+    # Startup prewarm of all corpus resources before serving traffic
+    RNC_PREWARM: bool = _env_bool("RNC_PREWARM", False)
+    RNC_PREWARM_CONCURRENCY: int = _env_int("RNC_PREWARM_CONCURRENCY", 4)
+
+    # On-disk snapshot of corpus configs and attribute tagsets (disabled
+    # when no directory is set) and the age after which entries are
+    # refreshed in the background
+    RNC_SNAPSHOT_DIR: Optional[str] = os.getenv("RNC_SNAPSHOT_DIR")
+    RNC_SNAPSHOT_REFRESH_INTERVAL: float = _env_float(
+        "RNC_SNAPSHOT_REFRESH_INTERVAL", 86400.0)
+
+    # Concordance response cache: total size of cached responses and
+    # seconds a response is reused (0 disables the cache)
+    RNC_CONCORDANCE_CACHE_MAX_BYTES: int = _env_int(
+        "RNC_CONCORDANCE_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+    RNC_CONCORDANCE_CACHE_TTL: float = _env_float(
+        "RNC_CONCORDANCE_CACHE_TTL", 3600.0)
+
+    # Debug payload logging to the MCP client: only emitted when the
+    # effective log level is DEBUG, and each preview is capped in size
+    RNC_LOG_LEVEL: str = (
+        os.getenv("RNC_LOG_LEVEL") or os.getenv("FASTMCP_LOG_LEVEL", "INFO")
+    ).upper()
+    RNC_DEBUG_PREVIEW_CHARS: int = _env_int("RNC_DEBUG_PREVIEW_CHARS", 2000)
+
     RNC_CORPORA: Dict[str, str] = {
         "MAIN": "Main",
         "PAPER": "Media (newspapers)",
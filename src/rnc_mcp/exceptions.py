@@ -16,3 +16,18 @@ class RNCAuthError(RNCError):
 class RNCAPIError(RNCError):
     """Raised when the RNC API returns an error response."""
     pass
+
+
+class RNCQueueTimeoutError(RNCAPIError):
+    """Raised when a request waits too long for a free upstream slot."""
+    pass
+
+
+class RNCRateLimitError(RNCAPIError):
+    """Raised when the RNC API keeps throttling a request after retries."""
+    pass
+
+
+class RNCCircuitOpenError(RNCAPIError):
+    """Raised without calling the API while its endpoint is failing."""
+    pass
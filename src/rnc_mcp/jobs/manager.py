@@ -0,0 +1,259 @@
+"""Worker pool running background concordance jobs."""
+import asyncio
+import logging
+import uuid
+from typing import Optional, Set
+
+import httpx
+from rnc_mcp.exceptions import RNCAPIError
+from rnc_mcp.jobs.store import (
+    COMPLETED, FAILED, QUEUED, RUNNING, JobStore
+)
+from rnc_mcp.schemas.schemas import (
+    ConcordanceJobRequest, DocumentItem, GlobalStats, JobResults, JobStatus,
+    SearchQuery
+)
+from rnc_mcp.services.rnc_search import RNCSearchService
+
+logger = logging.getLogger(__name__)
+
+
+class JobManager:
+    """
+    Collects every page of a concordance query in the background, for
+    sweeps too large for one tool call.
+
+    Jobs are queued in memory and run by `workers` worker tasks; each job
+    fetches up to `page_concurrency` pages at a time through the search
+    service, so the client's rate and concurrency limits apply. Progress
+    is persisted to a JobStore after every batch of pages: on start(),
+    jobs that were queued or interrupted by a restart continue from the
+    first page they had not stored.
+
+    A page that still fails after the client's own retries (e.g. while
+    a circuit is open) is retried `page_retries` more times, after
+    `retry_delay` seconds doubling each time; pages fetched before it
+    are stored first. A job that fails anyway keeps its progress and can
+    be continued with resume().
+    """
+
+    def __init__(
+        self,
+        service: RNCSearchService,
+        store: JobStore,
+        workers: int = 2,
+        page_concurrency: int = 4,
+        max_pages: int = 5000,
+        page_retries: int = 3,
+        retry_delay: float = 5.0
+    ):
+        self.service = service
+        self.store = store
+        self.workers = max(1, workers)
+        self.page_concurrency = max(1, page_concurrency)
+        self.max_pages = max(1, max_pages)
+        self.page_retries = max(0, page_retries)
+        self.retry_delay = max(0.0, retry_delay)
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """Start the workers and re-queue unfinished jobs."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        if await asyncio.to_thread(self.store.exists):
+            unfinished = await asyncio.to_thread(self.store.unfinished)
+            for job_id in unfinished:
+                self._queue.put_nowait(job_id)
+            if unfinished:
+                logger.info("Resuming %d unfinished jobs", len(unfinished))
+        for _ in range(self.workers):
+            self._tasks.add(asyncio.create_task(self._work()))
+
+    async def stop(self) -> None:
+        """
+        Stop the workers. Interrupted jobs keep their stored progress
+        and resume on the next start().
+        """
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._queue = None
+        await asyncio.to_thread(self.store.close)
+
+    async def submit(self, request: ConcordanceJobRequest) -> JobStatus:
+        if not request.return_examples:
+            raise ValueError(
+                "Jobs collect examples; use the concordance tool for "
+                "statistics only"
+            )
+        last_allowed = request.page + self.max_pages - 1
+        end_page = request.end_page
+        if end_page is None:
+            end_page = last_allowed
+        if end_page < request.page:
+            raise ValueError("end_page must not be before page")
+
+        query = SearchQuery.model_validate(
+            request.model_dump(include=set(SearchQuery.model_fields)))
+        job = await asyncio.to_thread(
+            self.store.create,
+            uuid.uuid4().hex,
+            query.model_dump_json(),
+            request.page,
+            min(end_page, last_allowed)
+        )
+        if self._queue is not None:
+            self._queue.put_nowait(job["id"])
+        return self._status(job)
+
+    async def resume(self, job_id: str) -> JobStatus:
+        """Queue a failed job again, from the first page it had not stored."""
+        job = await self._get(job_id)
+        if job["status"] != FAILED:
+            raise ValueError(
+                f"Job {job_id} is {job['status']}; only failed jobs can "
+                f"be resumed"
+            )
+        await asyncio.to_thread(self.store.set_status, job_id, QUEUED)
+        if self._queue is not None:
+            self._queue.put_nowait(job_id)
+        return await self.status(job_id)
+
+    async def status(self, job_id: str) -> JobStatus:
+        return self._status(await self._get(job_id))
+
+    async def results(
+        self, job_id: str, offset: int = 0, limit: int = 50
+    ) -> JobResults:
+        """Documents collected so far, `limit` at a time from `offset`."""
+        if offset < 0 or limit < 1:
+            raise ValueError("offset must be >= 0 and limit >= 1")
+        job = await self._get(job_id)
+        documents = await asyncio.to_thread(
+            self.store.documents, job_id, offset, limit)
+        next_offset = offset + len(documents)
+        return JobResults(
+            job=self._status(job),
+            stats=(
+                GlobalStats.model_validate(job["stats"])
+                if job["stats"] else None
+            ),
+            results=[DocumentItem.model_validate(d) for d in documents],
+            offset=offset,
+            next_offset=(
+                next_offset if next_offset < job["documents"] else None
+            )
+        )
+
+    async def _get(self, job_id: str) -> dict:
+        job = await asyncio.to_thread(self.store.get, job_id)
+        if job is None:
+            raise KeyError(f"Unknown job: {job_id}")
+        return job
+
+    async def _work(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Job %s failed: %s", job_id, e)
+                await asyncio.to_thread(
+                    self.store.set_status, job_id, FAILED, str(e))
+
+    async def _run(self, job_id: str) -> None:
+        job = await asyncio.to_thread(self.store.get, job_id)
+        if job is None or job["status"] not in (QUEUED, RUNNING):
+            return
+        await asyncio.to_thread(self.store.set_status, job_id, RUNNING)
+        query = SearchQuery.model_validate_json(job["query"])
+
+        page = job["next_page"]
+        total_pages = job["total_pages"]
+        attempt = 0
+        while True:
+            last = job["end_page"]
+            if total_pages is not None:
+                last = min(last, total_pages - 1)
+            if page > last:
+                break
+            # Until the first page is stored the result size is unknown
+            size = self.page_concurrency if total_pages is not None else 1
+            pages = list(range(page, min(page + size - 1, last) + 1))
+
+            responses = await asyncio.gather(*[
+                self.service.search(
+                    query.model_copy(update={"page": p}), cache=False)
+                for p in pages
+            ], return_exceptions=True)
+            # Store the pages before the first failed one, so a retry
+            # (or a resumed job) starts from the failed page
+            fetched = []
+            error = None
+            for p, response in zip(pages, responses):
+                if isinstance(response, BaseException):
+                    error = response
+                    break
+                fetched.append((p, response))
+
+            if fetched:
+                if total_pages is None:
+                    total_pages = fetched[0][1].stats.total_pages_available
+                await asyncio.to_thread(
+                    self.store.save_pages,
+                    job_id,
+                    [
+                        (p, [doc.model_dump() for doc in r.results])
+                        for p, r in fetched
+                    ],
+                    total_pages,
+                    fetched[0][1].stats.model_dump()
+                )
+                page = fetched[-1][0] + 1
+                attempt = 0
+            if error is None:
+                continue
+
+            if not self._retryable(error) or attempt >= self.page_retries:
+                raise error
+            attempt += 1
+            delay = self.retry_delay * 2 ** (attempt - 1)
+            logger.info(
+                "Job %s: page %d failed (%s); retry %d/%d in %.0fs",
+                job_id, page, error, attempt, self.page_retries, delay
+            )
+            await asyncio.sleep(delay)
+
+        await asyncio.to_thread(self.store.set_status, job_id, COMPLETED)
+
+    @staticmethod
+    def _retryable(error: BaseException) -> bool:
+        return isinstance(error, (RNCAPIError, httpx.TransportError))
+
+    def _status(self, job: dict) -> JobStatus:
+        total = job["total_pages"]
+        if total is not None:
+            # Pages this job will collect, given its page range
+            first = job["next_page"] - job["pages_done"]
+            total = max(min(total - 1, job["end_page"]) - first + 1, 0)
+        return JobStatus(
+            job_id=job["id"],
+            status=job["status"],
+            pages_done=job["pages_done"],
+            total_pages=total,
+            documents=job["documents"],
+            examples=job["examples"],
+            error=job["error"],
+            created_at=job["created_at"],
+            updated_at=job["updated_at"]
+        )
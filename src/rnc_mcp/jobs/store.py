@@ -0,0 +1,205 @@
+"""SQLite persistence for background concordance jobs."""
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+# Jobs in these states are picked up again after a restart
+UNFINISHED = (QUEUED, RUNNING)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    query TEXT NOT NULL,
+    status TEXT NOT NULL,
+    end_page INTEGER NOT NULL,
+    next_page INTEGER NOT NULL,
+    total_pages INTEGER,
+    pages_done INTEGER NOT NULL DEFAULT 0,
+    documents INTEGER NOT NULL DEFAULT 0,
+    examples INTEGER NOT NULL DEFAULT 0,
+    stats TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_documents (
+    job_id TEXT NOT NULL REFERENCES jobs(id),
+    seq INTEGER NOT NULL,
+    page INTEGER NOT NULL,
+    document TEXT NOT NULL,
+    PRIMARY KEY (job_id, seq)
+);
+"""
+
+
+class JobStore:
+    """
+    Jobs and their collected documents in one SQLite database.
+
+    Every method is blocking; async callers run them in a worker thread.
+    A page's documents are stored in the same transaction that advances
+    the job's `next_page`, so a crash never loses or duplicates a page.
+    The database file is only created when the first job is stored;
+    reads before that find no jobs.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        return self.path == ":memory:" or os.path.exists(self.path)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def _connect_existing(self) -> Optional[sqlite3.Connection]:
+        """The connection, unless there is no database to read yet."""
+        if self._conn is None and not self.exists():
+            return None
+        return self._connect()
+
+    def create(
+        self, job_id: str, query: str, start_page: int, end_page: int
+    ) -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT INTO jobs (id, query, status, end_page, next_page, "
+                "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, query, QUEUED, end_page, start_page, now, now)
+            )
+            return self._get(conn, job_id)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            conn = self._connect_existing()
+            if conn is None:
+                return None
+            return self._get(conn, job_id)
+
+    def unfinished(self) -> List[str]:
+        """Ids of queued or interrupted jobs, oldest first."""
+        with self._lock:
+            conn = self._connect_existing()
+            if conn is None:
+                return []
+            rows = conn.execute(
+                "SELECT id FROM jobs WHERE status IN (?, ?) "
+                "ORDER BY created_at",
+                UNFINISHED
+            ).fetchall()
+        return [row["id"] for row in rows]
+
+    def set_status(
+        self, job_id: str, status: str, error: Optional[str] = None
+    ) -> None:
+        with self._lock:
+            self._connect().execute(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ? "
+                "WHERE id = ?",
+                (status, error, time.time(), job_id)
+            )
+
+    def save_pages(
+        self,
+        job_id: str,
+        pages: List[Tuple[int, List[Dict[str, Any]]]],
+        total_pages: int,
+        stats: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Append the documents of consecutive pages and advance the job
+        past the last of them, atomically.
+        """
+        documents = sum(len(docs) for _, docs in pages)
+        examples = sum(
+            len(doc.get("examples", [])) for _, docs in pages for doc in docs
+        )
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            try:
+                seq = conn.execute(
+                    "SELECT documents FROM jobs WHERE id = ?", (job_id,)
+                ).fetchone()["documents"]
+                rows = []
+                for page, docs in pages:
+                    for doc in docs:
+                        rows.append((
+                            job_id, seq, page,
+                            json.dumps(doc, ensure_ascii=False)
+                        ))
+                        seq += 1
+                conn.executemany(
+                    "INSERT INTO job_documents (job_id, seq, page, document) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                conn.execute(
+                    "UPDATE jobs SET next_page = ?, total_pages = ?, "
+                    "pages_done = pages_done + ?, "
+                    "documents = documents + ?, examples = examples + ?, "
+                    "stats = COALESCE(stats, ?), updated_at = ? "
+                    "WHERE id = ?",
+                    (
+                        pages[-1][0] + 1, total_pages, len(pages),
+                        documents, examples,
+                        json.dumps(stats) if stats is not None else None,
+                        time.time(), job_id
+                    )
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def documents(
+        self, job_id: str, offset: int, limit: int
+    ) -> List[Dict[str, Any]]:
+        with self._lock:
+            conn = self._connect_existing()
+            if conn is None:
+                return []
+            rows = conn.execute(
+                "SELECT document FROM job_documents WHERE job_id = ? "
+                "ORDER BY seq LIMIT ? OFFSET ?",
+                (job_id, limit, offset)
+            ).fetchall()
+        return [json.loads(row["document"]) for row in rows]
+
+    @staticmethod
+    def _get(
+        conn: sqlite3.Connection, job_id: str
+    ) -> Optional[Dict[str, Any]]:
+        row = conn.execute(
+            "SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["stats"] = json.loads(job["stats"]) if job["stats"] else None
+        return job
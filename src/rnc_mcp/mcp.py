@@ -1,17 +1,137 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Dict, List
 from fastmcp import FastMCP, Context
-from rnc_mcp.schemas.schemas import SearchQuery, ConcordanceResponse
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse
+from rnc_mcp.schemas.schemas import (
+    SearchQuery, ConcordanceResponse, MultiPageQuery,
+    MultiPageConcordanceResponse, BatchConcordanceResponse,
+    FrequencyTimelineResponse, CorpusComparisonResponse, RncCorpusType,
+    ConcordanceJobRequest, JobStatus, JobResults, ExportRequest,
+    ExportResponse
+)
 from rnc_mcp.services.rnc_builder import RNCQueryBuilder
 from rnc_mcp.services.rnc_formatter import RNCResponseFormatter
+from rnc_mcp.services.rnc_search import RNCSearchService
+from rnc_mcp.services.rnc_exporter import RNCExporter
 from rnc_mcp.clients.rnc_client import RNCClient
+from rnc_mcp.clients.snapshot import SnapshotStore
+from rnc_mcp.clients.cache import ConcordanceCache
+from rnc_mcp.clients.breaker import endpoint_breakers
+from rnc_mcp.clients.limiter import ConcurrencyLimiter, TokenBucket
+from rnc_mcp.clients.retry import RetryPolicy
 from rnc_mcp.config import Config
+from rnc_mcp.jobs.manager import JobManager
+from rnc_mcp.jobs.store import JobStore
 from rnc_mcp.resources.rnc_generator import RNCResourceGenerator
+from rnc_mcp.resources.cache import ResourceCache
 from rnc_mcp.exceptions import RNCConfigError
+from rnc_mcp.metrics import REGISTRY
+from rnc_mcp.tracing import TRACER, ToolTracingMiddleware
+from rnc_mcp.utils import ProgressReporter, log_debug
+
+
+client = RNCClient(
+    snapshot=(
+        SnapshotStore(Config.RNC_SNAPSHOT_DIR, Config.RNC_BASE_URL)
+        if Config.RNC_SNAPSHOT_DIR else None
+    ),
+    concordance_cache=ConcordanceCache(
+        max_bytes=Config.RNC_CONCORDANCE_CACHE_MAX_BYTES,
+        ttl=Config.RNC_CONCORDANCE_CACHE_TTL
+    ),
+    limiter=ConcurrencyLimiter(
+        max_concurrency=Config.RNC_MAX_CONCURRENCY,
+        default_per_corpus=Config.RNC_MAX_CONCURRENCY_PER_CORPUS,
+        per_corpus=Config.RNC_CORPUS_CONCURRENCY,
+        max_wait=Config.RNC_QUEUE_MAX_WAIT
+    ),
+    rate_limiter=TokenBucket(
+        rate=Config.RNC_RATE_LIMIT,
+        burst=Config.RNC_RATE_BURST
+    ),
+    retry_policy=RetryPolicy(
+        max_retries=Config.RNC_MAX_RETRIES,
+        backoff=Config.RNC_RETRY_BACKOFF,
+        max_delay=Config.RNC_RETRY_MAX_DELAY
+    ),
+    breakers=endpoint_breakers(
+        failure_threshold=Config.RNC_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout=Config.RNC_BREAKER_RECOVERY_TIMEOUT,
+        latency_slo=Config.RNC_BREAKER_LATENCY_SLO
+    )
+)
+resource_generator = RNCResourceGenerator(
+    client,
+    cache=ResourceCache(
+        ttl=Config.RNC_RESOURCE_CACHE_TTL,
+        stale_ttl=Config.RNC_RESOURCE_CACHE_STALE_TTL
+    )
+)
+search_service = RNCSearchService(
+    client,
+    max_pages=Config.RNC_MAX_PAGES_PER_QUERY,
+    concurrency=Config.RNC_BATCH_CONCURRENCY,
+    max_batch_size=Config.RNC_MAX_BATCH_SIZE
+)
+exporter = RNCExporter(
+    search_service,
+    Config.RNC_EXPORT_DIR,
+    max_pages=Config.RNC_EXPORT_MAX_PAGES,
+    page_concurrency=Config.RNC_EXPORT_PAGE_CONCURRENCY
+)
+job_manager = JobManager(
+    search_service,
+    JobStore(Config.RNC_JOB_DB),
+    workers=Config.RNC_JOB_WORKERS,
+    page_concurrency=Config.RNC_JOB_PAGE_CONCURRENCY,
+    max_pages=Config.RNC_JOB_MAX_PAGES,
+    page_retries=Config.RNC_JOB_PAGE_RETRIES,
+    retry_delay=Config.RNC_JOB_RETRY_DELAY
+)
+
+logger = logging.getLogger(__name__)
+
+# Set once startup (including the optional prewarm) has finished
+ready = asyncio.Event()
+prewarm_status: Dict[str, bool] = {}
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """
+    Opens the shared RNC connection pool for the lifetime of the server
+    and closes it on shutdown. With RNC_PREWARM enabled, all corpus
+    resources are loaded before the server starts accepting traffic.
+    Background job workers run while the pool is open; unfinished jobs
+    from a previous run are resumed.
+    """
+    async with client:
+        await job_manager.start()
+        if Config.RNC_PREWARM:
+            prewarm_status.update(await resource_generator.prewarm(
+                Config.RNC_CORPORA, Config.RNC_PREWARM_CONCURRENCY
+            ))
+            failed = [c for c, ok in prewarm_status.items() if not ok]
+            logger.info(
+                "Prewarmed %d/%d corpus resources%s",
+                len(prewarm_status) - len(failed), len(prewarm_status),
+                f" (incomplete: {', '.join(failed)})" if failed else ""
+            )
+        ready.set()
+        try:
+            yield
+        finally:
+            ready.clear()
+            await job_manager.stop()
+            await TRACER.flush()
 
 
 mcp = FastMCP(
-    "Russian National Corpus")
-client = RNCClient()
-resource_generator = RNCResourceGenerator(client)
+    "Russian National Corpus", lifespan=lifespan)
+mcp.add_middleware(ToolTracingMiddleware(TRACER))
 
 
 def register_corpus_resources():
@@ -37,6 +157,40 @@ def register_corpus_resources():
 register_corpus_resources()
 
 
+@mcp.custom_route("/ready", methods=["GET"])
+async def readiness(request: Request) -> JSONResponse:
+    """
+    Readiness probe for load balancers: 200 once startup has finished,
+    503 while the server is still starting (or prewarming). Also reports
+    the circuit breaker state of each RNC API endpoint.
+    """
+    if not ready.is_set():
+        return JSONResponse({"status": "starting"}, status_code=503)
+    return JSONResponse({
+        "status": "ready",
+        "prewarmed": sorted(c for c, ok in prewarm_status.items() if ok),
+        "incomplete": sorted(
+            c for c, ok in prewarm_status.items() if not ok
+        ),
+        # Open circuits degrade to cached data; they do not fail readiness
+        "circuits": {
+            name: breaker.state for name, breaker in client.breakers.items()
+        }
+    })
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> PlainTextResponse:
+    """
+    Stage latencies, upstream statuses, retries, cache lookups and
+    in-flight requests in the Prometheus text exposition format.
+    """
+    return PlainTextResponse(
+        REGISTRY.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 @mcp.tool
 async def concordance(query: SearchQuery, ctx: Context) -> ConcordanceResponse:
     """
@@ -49,30 +203,287 @@ async def concordance(query: SearchQuery, ctx: Context) -> ConcordanceResponse:
         raise RuntimeError(str(e))
 
     await ctx.info(f"Searching {query.corpus}...")
-    await ctx.debug(f"Query: {query}")
+    await log_debug(ctx, "Query", query)
+
+    # Progress notifications with the timing of each stage
+    progress = ProgressReporter(ctx, total=3)
 
     try:
-        payload = RNCQueryBuilder.build_payload(query)
-        await ctx.debug(f"Payload: {payload}")
+        async with progress.track("Query build"):
+            payload = RNCQueryBuilder.build_payload(query)
+        await log_debug(ctx, "Payload", payload)
     except Exception as e:
         raise RuntimeError(f"Query Build Error: {str(e)}")
 
     try:
-        raw_result = await client.execute_concordance(payload, ctx=ctx)
-        await ctx.debug(f"Raw Result: {raw_result}")
+        async with progress.track("RNC API request"):
+            raw_result = await client.execute_concordance(payload, ctx=ctx)
+        await log_debug(ctx, "Raw Result", raw_result)
     except Exception as e:
         raise RuntimeError(f"API Execution Error: {str(e)}")
 
     try:
-        formatted_response = RNCResponseFormatter.format_search_results(
-            raw_result)
-
-        # Clear results if user only wants statistics
-        if not query.return_examples:
-            formatted_response.results = []
+        async with progress.track("Formatting"):
+            if query.return_examples:
+                formatted_response = (
+                    RNCResponseFormatter.format_search_results(raw_result))
+            else:
+                # Statistics only: skip walking the document groups
+                formatted_response = RNCResponseFormatter.format_stats_only(
+                    raw_result)
 
-        await ctx.debug(f"Formatted Response: {formatted_response}")
+        await log_debug(ctx, "Formatted Response", formatted_response)
 
         return formatted_response
     except Exception as e:
         raise RuntimeError(f"Response Formatting Error: {str(e)}")
+
+
+@mcp.tool
+async def concordance_pages(
+    query: MultiPageQuery, ctx: Context
+) -> MultiPageConcordanceResponse:
+    """
+    Performs a lexicographic search and returns several result pages at
+    once: the pages from `page` to `end_page`, or as many pages as needed
+    to collect `target_examples` examples. Pages are fetched concurrently
+    and merged; pages that fail are listed in `failed_pages`.
+    """
+    try:
+        Config.get_rnc_token()
+    except RNCConfigError as e:
+        raise RuntimeError(str(e))
+
+    await ctx.info(f"Searching {query.corpus} (multiple pages)...")
+    await log_debug(ctx, "Query", query)
+
+    try:
+        RNCQueryBuilder.build_payload(query)
+    except Exception as e:
+        raise RuntimeError(f"Query Build Error: {str(e)}")
+
+    try:
+        response = await search_service.fetch_pages(query, ctx=ctx)
+    except ValueError as e:
+        raise RuntimeError(f"Query Build Error: {str(e)}")
+    except Exception as e:
+        raise RuntimeError(f"API Execution Error: {str(e)}")
+
+    await log_debug(ctx, "Formatted Response", response)
+    return response
+
+
+@mcp.tool
+async def concordance_batch(
+    queries: List[SearchQuery], ctx: Context
+) -> BatchConcordanceResponse:
+    """
+    Runs several independent lexicographic searches in one call, e.g. the
+    frequencies of many synonyms. Queries run concurrently; results are
+    returned in input order, and a failing query gets an `error` entry
+    instead of failing the whole batch.
+    """
+    try:
+        Config.get_rnc_token()
+    except RNCConfigError as e:
+        raise RuntimeError(str(e))
+
+    await ctx.info(f"Running a batch of {len(queries)} searches...")
+
+    try:
+        response = await search_service.run_batch(queries, ctx=ctx)
+    except ValueError as e:
+        raise RuntimeError(f"Query Build Error: {str(e)}")
+
+    await log_debug(ctx, "Batch Response", response)
+    return response
+
+
+@mcp.tool
+async def frequency_timeline(
+    query: SearchQuery,
+    start_year: int,
+    end_year: int,
+    ctx: Context,
+    bucket_size: int = 10
+) -> FrequencyTimelineResponse:
+    """
+    Returns the frequency of a search over time: the span from
+    `start_year` to `end_year` is split into buckets of `bucket_size`
+    years (e.g. decades) and the statistics of every bucket are fetched
+    concurrently. Each row holds queryStats, subcorpStats and ipm
+    (matches per million words in that bucket). The query's own date
+    range filter is replaced by the buckets; examples are not returned.
+    """
+    try:
+        Config.get_rnc_token()
+    except RNCConfigError as e:
+        raise RuntimeError(str(e))
+
+    await ctx.info(
+        f"Building frequency timeline {start_year}-{end_year} "
+        f"for {query.corpus}..."
+    )
+    await log_debug(ctx, "Query", query)
+
+    try:
+        response = await search_service.frequency_timeline(
+            query, start_year, end_year, bucket_size, ctx=ctx)
+    except ValueError as e:
+        raise RuntimeError(f"Query Build Error: {str(e)}")
+    except Exception as e:
+        raise RuntimeError(f"API Execution Error: {str(e)}")
+
+    await log_debug(ctx, "Timeline", response)
+    return response
+
+
+@mcp.tool
+async def compare_corpora(
+    query: SearchQuery,
+    corpora: List[RncCorpusType],  # type: ignore
+    ctx: Context
+) -> CorpusComparisonResponse:
+    """
+    Runs one search against several corpora at once (statistics only) and
+    returns their frequencies side by side. `ipm` (matches per million
+    words) makes corpora of different sizes comparable. The `corpus`
+    field of the query is ignored. A corpus that fails or takes too long
+    gets an `error` row instead of failing the comparison.
+    """
+    try:
+        Config.get_rnc_token()
+    except RNCConfigError as e:
+        raise RuntimeError(str(e))
+
+    codes = [corpus.value for corpus in corpora]
+    await ctx.info(f"Comparing {', '.join(codes)}...")
+    await log_debug(ctx, "Query", query)
+
+    try:
+        response = await search_service.compare_corpora(
+            query, codes, Config.RNC_COMPARE_TIMEOUT, ctx=ctx)
+    except ValueError as e:
+        raise RuntimeError(f"Query Build Error: {str(e)}")
+    except Exception as e:
+        raise RuntimeError(f"API Execution Error: {str(e)}")
+
+    await log_debug(ctx, "Comparison", response)
+    return response
+
+
+@mcp.tool
+async def submit_concordance_job(
+    query: ConcordanceJobRequest, ctx: Context
+) -> JobStatus:
+    """
+    Starts collecting every result page of a lexicographic search in the
+    background, for result sets too large for `concordance_pages`.
+    Returns at once with a `job_id`: poll `job_status` for progress and
+    read the collected documents with `job_results`. Jobs survive server
+    restarts.
+    """
+    try:
+        Config.get_rnc_token()
+    except RNCConfigError as e:
+        raise RuntimeError(str(e))
+
+    await log_debug(ctx, "Query", query)
+
+    try:
+        RNCQueryBuilder.build_payload(query)
+        status = await job_manager.submit(query)
+    except Exception as e:
+        raise RuntimeError(f"Query Build Error: {str(e)}")
+
+    await ctx.info(f"Submitted job {status.job_id}")
+    return status
+
+
+@mcp.tool
+async def job_status(job_id: str, ctx: Context) -> JobStatus:
+    """
+    Reports the progress of a background concordance job: its state
+    (queued, running, completed or failed), pages and documents collected
+    so far, and the error of a failed job.
+    """
+    try:
+        status = await job_manager.status(job_id)
+    except KeyError:
+        raise RuntimeError(f"Unknown job: {job_id}")
+
+    await log_debug(ctx, "Job Status", status)
+    return status
+
+
+@mcp.tool
+async def resume_job(job_id: str, ctx: Context) -> JobStatus:
+    """
+    Queues a failed background concordance job again. It continues from
+    the first page it had not stored; documents collected before the
+    failure are kept.
+    """
+    try:
+        status = await job_manager.resume(job_id)
+    except KeyError:
+        raise RuntimeError(f"Unknown job: {job_id}")
+    except ValueError as e:
+        raise RuntimeError(f"Job Error: {str(e)}")
+
+    await ctx.info(f"Resumed job {job_id}")
+    return status
+
+
+@mcp.tool
+async def job_results(
+    job_id: str, ctx: Context, offset: int = 0, limit: int = 50
+) -> JobResults:
+    """
+    Returns documents collected by a background concordance job, `limit`
+    at a time starting from `offset`. Works while the job is still
+    running; pass the returned `next_offset` to continue reading.
+    """
+    limit = min(limit, Config.RNC_JOB_RESULTS_LIMIT)
+    try:
+        results = await job_manager.results(job_id, offset, limit)
+    except KeyError:
+        raise RuntimeError(f"Unknown job: {job_id}")
+    except ValueError as e:
+        raise RuntimeError(f"Job Error: {str(e)}")
+
+    await log_debug(ctx, "Job Results", results)
+    return results
+
+
+@mcp.tool
+async def export_concordance(
+    query: ExportRequest, ctx: Context
+) -> ExportResponse:
+    """
+    Writes all result pages of a lexicographic search to a file on the
+    server (NDJSON, CSV or Parquet, one row per example) instead of
+    returning them. Returns only the file path, row counts and search
+    statistics, so it suits result sets far too large for `concordance`.
+    """
+    try:
+        Config.get_rnc_token()
+    except RNCConfigError as e:
+        raise RuntimeError(str(e))
+
+    await ctx.info(f"Exporting {query.corpus} to {query.format}...")
+    await log_debug(ctx, "Query", query)
+
+    try:
+        RNCQueryBuilder.build_payload(query)
+    except Exception as e:
+        raise RuntimeError(f"Query Build Error: {str(e)}")
+
+    try:
+        response = await exporter.export(query, ctx=ctx)
+    except ValueError as e:
+        raise RuntimeError(f"Query Build Error: {str(e)}")
+    except Exception as e:
+        raise RuntimeError(f"API Execution Error: {str(e)}")
+
+    await log_debug(ctx, "Export", response)
+    return response
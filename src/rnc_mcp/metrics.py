@@ -0,0 +1,305 @@
+"""In-process metrics rendered in the Prometheus text format."""
+import bisect
+from abc import ABC, abstractmethod
+import functools
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from rnc_mcp.tracing import KIND_INTERNAL, TRACER, Span
+
+LabelValues = Tuple[str, ...]
+
+# Histogram upper bounds in seconds, from in-process stages (build,
+# format) up to slow upstream calls
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    )
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric(ABC):
+    """A named family of series, one per combination of label values."""
+
+    kind = ""
+
+    def __init__(
+        self, name: str, help: str, labelnames: Tuple[str, ...] = ()
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, object]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, "
+                f"got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(
+        self, values: LabelValues, extra: Optional[Tuple[str, str]] = None
+    ) -> str:
+        pairs = list(zip(self.labelnames, values))
+        if extra is not None:
+            pairs.append(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(
+            f'{name}="{_escape(value)}"' for name, value in pairs
+        ) + "}"
+
+    @abstractmethod
+    def samples(self) -> List[str]:
+        """The sample lines of every series."""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Drop every series."""
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples()
+        ]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{self._labels(key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    @contextmanager
+    def track(self, **labels) -> Iterator[None]:
+        """Count the wrapped block while it runs."""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per series: non-cumulative bucket counts (last one is +Inf),
+        # and the sum of observed values
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """Observe the duration of the wrapped block, even if it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            series = sorted(
+                (key, list(counts), self._sums[key])
+                for key, counts in self._counts.items()
+            )
+        lines = []
+        for key, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                le = ("le", _format_value(bound))
+                lines.append(
+                    f"{self.name}_bucket{self._labels(key, le)} {cumulative}")
+            lines.append(
+                f"{self.name}_sum{self._labels(key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{self._labels(key)} {cumulative}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._sums.clear()
+
+
+class MetricsRegistry:
+    """The metrics exported together on the /metrics route."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames=()) -> Counter:
+        return self.register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames=()) -> Gauge:
+        return self.register(Gauge(name, help, labelnames))
+
+    def histogram(
+        self, name: str, help: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.reset()
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "rnc_stage_duration_seconds",
+    "Duration of request stages: query build, upstream call, "
+    "JSON decode and response formatting.",
+    ("stage",)
+)
+UPSTREAM_RESPONSES = REGISTRY.counter(
+    "rnc_upstream_responses_total",
+    "RNC API responses by endpoint and HTTP status "
+    "(status=\"error\" for transport failures).",
+    ("endpoint", "status")
+)
+UPSTREAM_RETRIES = REGISTRY.counter(
+    "rnc_upstream_retries_total",
+    "Retried RNC API requests by endpoint and the status that caused them.",
+    ("endpoint", "status")
+)
+UPSTREAM_IN_FLIGHT = REGISTRY.gauge(
+    "rnc_upstream_in_flight",
+    "RNC API requests currently awaiting a response.",
+    ("endpoint",)
+)
+BREAKER_STATE = REGISTRY.gauge(
+    "rnc_circuit_breaker_state",
+    "Circuit breaker state by endpoint: 0 closed, 1 half-open, 2 open.",
+    ("endpoint",)
+)
+LIMITER_WAITING = REGISTRY.gauge(
+    "rnc_limiter_waiting",
+    "RNC API requests queued for a concurrency slot, by corpus.",
+    ("corpus",)
+)
+LIMITER_MAX_WAITING = REGISTRY.gauge(
+    "rnc_limiter_max_waiting",
+    "Largest number of requests queued at once since startup."
+)
+LIMITER_QUEUE_TIMEOUTS = REGISTRY.counter(
+    "rnc_limiter_queue_timeouts_total",
+    "Requests that failed waiting for a concurrency slot, by corpus.",
+    ("corpus",)
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    "rnc_cache_lookups_total",
+    "Concordance cache lookups by result (hit, miss, or stale when an "
+    "expired entry is served while the API is unavailable).",
+    ("result",)
+)
+
+
+@contextmanager
+def stage(
+    name: str, kind: int = KIND_INTERNAL, **attributes
+) -> Iterator[Optional[Span]]:
+    """
+    Record the wrapped block as a stage latency and, within a sampled
+    trace, as a span (yielded so callers can add attributes).
+    """
+    with TRACER.span(name, kind=kind, **attributes) as span:
+        with STAGE_SECONDS.time(stage=name):
+            yield span
+
+
+def timed(name: str) -> Callable:
+    """Decorator recording a function's duration as a stage."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,96 @@
+"""In-memory cache for generated corpus resources."""
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+# A loader returns the rendered value and whether it is complete.
+# Incomplete values (e.g. some attribute fetches failed) are served but
+# stored as already stale, so the next read refreshes them.
+Loader = Callable[[], Awaitable[Tuple[str, bool]]]
+
+
+class ResourceCache:
+    """
+    TTL cache keyed by corpus code with stale-while-revalidate.
+
+    - Entries younger than `ttl` are served directly.
+    - Entries older than `ttl` but within `ttl + stale_ttl` are served
+      immediately while a single background task refreshes them.
+    - Older or missing entries are loaded synchronously; concurrent
+      readers of the same key share one load.
+
+    A non-positive `ttl` disables caching.
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float = 0.0):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: Dict[str, Tuple[str, float]] = {}
+        self._loads: Dict[str, asyncio.Task] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    async def get(self, key: str, loader: Loader) -> str:
+        if not self.enabled:
+            value, _ = await loader()
+            return value
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = time.monotonic() - stored_at
+            if age < self.ttl:
+                return value
+            if age < self.ttl + self.stale_ttl:
+                self._refresh_in_background(key, loader)
+                return value
+
+        return await asyncio.shield(self._load(key, loader))
+
+    def put(self, key: str, value: str, complete: bool = True) -> None:
+        stored_at = time.monotonic()
+        if not complete:
+            stored_at -= self.ttl
+        self._entries[key] = (value, stored_at)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one entry, or every entry when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def _load(self, key: str, loader: Loader) -> asyncio.Task:
+        task = self._loads.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_load(key, loader))
+            self._loads[key] = task
+            self._tasks.add(task)
+            task.add_done_callback(self._finish_load)
+        return task
+
+    async def _run_load(self, key: str, loader: Loader) -> str:
+        try:
+            value, complete = await loader()
+            self.put(key, value, complete)
+            return value
+        finally:
+            self._loads.pop(key, None)
+
+    def _refresh_in_background(self, key: str, loader: Loader) -> None:
+        if key not in self._loads:
+            self._load(key, loader)
+
+    def _finish_load(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        # Mark the exception as retrieved: readers that awaited the load
+        # already got it, and failed background refreshes keep serving
+        # the stale entry
+        if not task.cancelled():
+            task.exception()
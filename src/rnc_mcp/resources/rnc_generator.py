@@ -1,81 +1,145 @@
+import asyncio
+from typing import Dict, Iterable, Optional, Tuple
 from rnc_mcp.clients.base import CorpusClient
 from rnc_mcp.resources.base import CorpusResourceGenerator
+from rnc_mcp.resources.cache import ResourceCache
 from rnc_mcp.config import Config
 
 
 class RNCResourceGenerator(CorpusResourceGenerator):
     """Generates markdown descriptions for RNC corpora."""
 
-    def __init__(self, client: CorpusClient):
+    ATTR_TYPES = [
+        ("gr", "Grammar Tags (attr: 'gramm')"),
+        ("sem", "Semantic Tags (attr: 'semantic')"),
+        ("syntax", "Syntax Tags (attr: 'syntax')"),
+        ("flags", "Additional Flags (attr: 'flags')")
+    ]
+
+    def __init__(
+        self, client: CorpusClient, cache: Optional[ResourceCache] = None
+    ):
         super().__init__(client)
+        self.cache = cache
 
     async def generate(self, corpus: str) -> str:
         """
         Generates a Markdown description of the corpus configuration,
         including sorting methods and all attribute types.
+        Served from the resource cache when one is configured.
         """
         try:
             Config.get_rnc_token()
 
-            # Fetch Data
-            config_data = await self.client.get_corpus_config(corpus)
+            if self.cache is None:
+                markdown, _ = await self._render(corpus)
+                return markdown
+            return await self.cache.get(
+                corpus, lambda: self._render(corpus)
+            )
 
-            output = [f"# Configuration for {corpus}\n"]
+        except Exception as e:
+            return f"Error loading resource for {corpus}: {str(e)}"
 
-            # Sorting
-            output.append("## Available Sorting Methods")
-            sortings = config_data.get("sortings", [])
-            valid_sorts = [
-                s for s in sortings
-                if "CONCORDANCE" in s.get("applicableTo", [])
-            ]
+    def invalidate(self, corpus: Optional[str] = None) -> None:
+        """Drop the cached resource for a corpus, or for all corpora."""
+        if self.cache is not None:
+            self.cache.invalidate(corpus)
 
-            if not valid_sorts:
-                output.append("_No sorting methods available._")
-            else:
-                for s in valid_sorts:
-                    name = s.get("name")
-                    readable = s.get("humanReadable")
-                    line = f"- `{name}`"
-                    if readable:
-                        line += f" ({readable})"
-                    output.append(line)
-
-            # Fetch all attribute types
-            attr_types = [
-                ("gr", "Grammar Tags (attr: 'gramm')"),
-                ("sem", "Semantic Tags (attr: 'semantic')"),
-                ("syntax", "Syntax Tags (attr: 'syntax')"),
-                ("flags", "Additional Flags (attr: 'flags')")
-            ]
-
-            for attr_type, title in attr_types:
+    async def prewarm(
+        self, corpora: Iterable[str], concurrency: int
+    ) -> Dict[str, bool]:
+        """
+        Loads the resources for all given corpora into the cache, rendering
+        at most `concurrency` corpora at once.
+        Returns whether each corpus was loaded completely.
+        """
+        if self.cache is None:
+            return {}
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def warm(corpus: str) -> bool:
+            async with semaphore:
                 try:
-                    attr_data = await self.client.get_attributes(
-                        corpus, attr_type
-                    )
-                    output.append(f"\n## {title}")
-
-                    vals = attr_data.get("vals", [])
-                    if not vals:
-                        output.append(f"_No {attr_type} tags found._")
-                    else:
-                        for val in vals:
-                            root_options = val.get(
-                                "valOptions",
-                                {}).get(
-                                "v",
-                                {}).get(
-                                "options",
-                                [])
-                            output.append(self._format_options(root_options))
+                    markdown, complete = await self._render(corpus)
                 except Exception:
-                    output.append(f"_No {attr_type} tags available._")
+                    return False
+                self.cache.put(corpus, markdown, complete)
+                return complete
 
-            return "\n".join(output)
+        corpora = list(corpora)
+        results = await asyncio.gather(*[warm(c) for c in corpora])
+        return dict(zip(corpora, results))
 
-        except Exception as e:
-            return f"Error loading resource for {corpus}: {str(e)}"
+    async def _render(self, corpus: str) -> Tuple[str, bool]:
+        """
+        Fetches corpus data and renders the Markdown description.
+        Returns the Markdown and whether every attribute fetch succeeded.
+        """
+        # Fetch config and all attribute types concurrently; attribute
+        # failures are isolated and rendered as a fallback below
+        config_data, *attr_results = await asyncio.gather(
+            self.client.get_corpus_config(corpus),
+            *[
+                self.client.get_attributes(corpus, attr_type)
+                for attr_type, _ in self.ATTR_TYPES
+            ],
+            return_exceptions=True
+        )
+        if isinstance(config_data, Exception):
+            raise config_data
+
+        output = [f"# Configuration for {corpus}\n"]
+
+        # Sorting
+        output.append("## Available Sorting Methods")
+        sortings = config_data.get("sortings", [])
+        valid_sorts = [
+            s for s in sortings
+            if "CONCORDANCE" in s.get("applicableTo", [])
+        ]
+
+        if not valid_sorts:
+            output.append("_No sorting methods available._")
+        else:
+            for s in valid_sorts:
+                name = s.get("name")
+                readable = s.get("humanReadable")
+                line = f"- `{name}`"
+                if readable:
+                    line += f" ({readable})"
+                output.append(line)
+
+        complete = True
+        for (attr_type, title), attr_data in zip(
+            self.ATTR_TYPES, attr_results
+        ):
+            if isinstance(attr_data, Exception):
+                output.append(f"_No {attr_type} tags available._")
+                complete = False
+                continue
+            try:
+                output.append(f"\n## {title}")
+
+                vals = attr_data.get("vals", [])
+                if not vals:
+                    output.append(f"_No {attr_type} tags found._")
+                else:
+                    for val in vals:
+                        root_options = val.get(
+                            "valOptions",
+                            {}).get(
+                            "v",
+                            {}).get(
+                            "options",
+                            [])
+                        output.append(self._format_options(root_options))
+            except Exception:
+                output.append(f"_No {attr_type} tags available._")
+                complete = False
+
+        return "\n".join(output), complete
 
     def _format_options(self, options, level=0) -> str:
         """
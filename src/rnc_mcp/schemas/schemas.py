@@ -168,6 +168,77 @@ class SearchQuery(BaseModel):
         return "\n".join(lines)
 
 
+class MultiPageQuery(SearchQuery):
+    end_page: Optional[int] = Field(
+        None,
+        description=(
+            "Last page to fetch (inclusive), starting from `page`. "
+            "Ignored when `target_examples` is set."
+        )
+    )
+    target_examples: Optional[int] = Field(
+        None,
+        ge=1,
+        description=(
+            "Fetch pages starting from `page` until at least this many "
+            "examples are collected or the results run out."
+        )
+    )
+
+    def __str__(self):
+        lines = [super().__str__()]
+        if self.target_examples is not None:
+            lines.append(f"  Target: {self.target_examples} examples")
+        elif self.end_page is not None:
+            lines.append(f"  Pages: {self.page}..{self.end_page}")
+        return "\n".join(lines)
+
+
+class ConcordanceJobRequest(SearchQuery):
+    end_page: Optional[int] = Field(
+        None,
+        description=(
+            "Last page to collect (inclusive). By default all pages are "
+            "collected, up to the server's page limit per job."
+        )
+    )
+
+    def __str__(self):
+        lines = [super().__str__()]
+        end = self.end_page if self.end_page is not None else "last"
+        lines.append(f"  Job pages: {self.page}..{end}")
+        return "\n".join(lines)
+
+
+class ExportRequest(SearchQuery):
+    format: Literal["ndjson", "csv", "parquet"] = Field(
+        "ndjson",
+        description=(
+            "File format. `parquet` requires the optional pyarrow package."
+        )
+    )
+    end_page: Optional[int] = Field(
+        None,
+        description=(
+            "Last page to export (inclusive). By default all pages are "
+            "exported, up to the server's page limit per export."
+        )
+    )
+    filename: Optional[str] = Field(
+        None,
+        description=(
+            "Name of the file to write in the server's export directory. "
+            "Generated if omitted; the format's extension is added."
+        )
+    )
+
+    def __str__(self):
+        lines = [super().__str__()]
+        end = self.end_page if self.end_page is not None else "last"
+        lines.append(f"  Export: {self.format}, pages {self.page}..{end}")
+        return "\n".join(lines)
+
+
 # Response schemas
 
 class DocMetadata(BaseModel):
@@ -237,3 +308,186 @@ class ConcordanceResponse(BaseModel):
             preview += f"\n  ... and {remaining} more"
 
         return f"{header}\nResults:\n{preview}"
+
+
+class PageError(BaseModel):
+    page: int
+    error: str
+
+    def __str__(self):
+        return f"page {self.page}: {self.error}"
+
+
+class MultiPageConcordanceResponse(ConcordanceResponse):
+    pages_fetched: List[int] = Field(
+        default_factory=list,
+        description="Pages whose results are included."
+    )
+    failed_pages: List[PageError] = Field(
+        default_factory=list,
+        description="Pages that could not be fetched; results are partial."
+    )
+
+    def __str__(self):
+        lines = [super().__str__()]
+        lines.append(f"Pages fetched: {self.pages_fetched}")
+        if self.failed_pages:
+            failed = "; ".join(str(e) for e in self.failed_pages)
+            lines.append(f"Failed pages: {failed}")
+        return "\n".join(lines)
+
+
+class BatchItemResult(BaseModel):
+    index: int = Field(..., description="Position of the query in the batch.")
+    response: Optional[ConcordanceResponse] = None
+    error: Optional[str] = Field(
+        None, description="Why the query failed (response is then null)."
+    )
+
+    def __str__(self):
+        if self.error is not None:
+            return f"#{self.index}: error: {self.error}"
+        return f"#{self.index}: {self.response.stats}"
+
+
+class BatchConcordanceResponse(BaseModel):
+    results: List[BatchItemResult] = Field(
+        ..., description="One result per query, in input order."
+    )
+    succeeded: int
+    failed: int
+
+    def __str__(self):
+        lines = [f"Batch: {self.succeeded} succeeded, {self.failed} failed"]
+        lines.extend(f"  {item}" for item in self.results)
+        return "\n".join(lines)
+
+
+class TimelineBucket(BaseModel):
+    start_year: int
+    end_year: int
+    queryStats: Optional[StatValues] = None
+    subcorpStats: Optional[StatValues] = None
+    ipm: Optional[float] = Field(
+        None,
+        description=(
+            "Matches per million words of the bucket's subcorpus."
+        )
+    )
+    error: Optional[str] = Field(
+        None, description="Why the bucket could not be fetched."
+    )
+
+    def __str__(self):
+        span = f"{self.start_year}-{self.end_year}"
+        if self.error is not None:
+            return f"{span}: error: {self.error}"
+        ipm = f"{self.ipm:.2f}" if self.ipm is not None else "n/a"
+        return f"{span}: {self.queryStats or 'no matches'}, ipm={ipm}"
+
+
+class FrequencyTimelineResponse(BaseModel):
+    buckets: List[TimelineBucket] = Field(
+        ..., description="One row per date bucket, in chronological order."
+    )
+
+    def __str__(self):
+        lines = ["Frequency timeline:"]
+        lines.extend(f"  {bucket}" for bucket in self.buckets)
+        return "\n".join(lines)
+
+
+class CorpusFrequency(BaseModel):
+    corpus: str
+    queryStats: Optional[StatValues] = None
+    corpusStats: Optional[StatValues] = None
+    subcorpStats: Optional[StatValues] = None
+    ipm: Optional[float] = Field(
+        None,
+        description=(
+            "Matches per million words of the searched (sub)corpus."
+        )
+    )
+    error: Optional[str] = Field(
+        None, description="Why the corpus could not be searched."
+    )
+
+    def __str__(self):
+        if self.error is not None:
+            return f"{self.corpus}: error: {self.error}"
+        ipm = f"{self.ipm:.2f}" if self.ipm is not None else "n/a"
+        return f"{self.corpus}: {self.queryStats or 'no matches'}, ipm={ipm}"
+
+
+class CorpusComparisonResponse(BaseModel):
+    corpora: List[CorpusFrequency] = Field(
+        ..., description="One row per corpus, in the requested order."
+    )
+
+    def __str__(self):
+        lines = ["Corpus comparison:"]
+        lines.extend(f"  {row}" for row in self.corpora)
+        return "\n".join(lines)
+
+
+class JobStatus(BaseModel):
+    job_id: str
+    status: Literal["queued", "running", "completed", "failed"]
+    pages_done: int = Field(..., description="Pages collected so far.")
+    total_pages: Optional[int] = Field(
+        None, description="Pages the job will collect, once known."
+    )
+    documents: int = Field(..., description="Documents collected so far.")
+    examples: int = Field(..., description="Examples collected so far.")
+    error: Optional[str] = None
+    created_at: float
+    updated_at: float
+
+    def __str__(self):
+        total = self.total_pages if self.total_pages is not None else "?"
+        line = (
+            f"Job {self.job_id}: {self.status}, "
+            f"pages {self.pages_done}/{total}, "
+            f"{self.documents} docs, {self.examples} examples"
+        )
+        if self.error:
+            line += f", error: {self.error}"
+        return line
+
+
+class JobResults(BaseModel):
+    job: JobStatus
+    stats: Optional[GlobalStats] = None
+    results: List[DocumentItem]
+    offset: int
+    next_offset: Optional[int] = Field(
+        None,
+        description=(
+            "Offset of the next batch of documents, or null if all "
+            "documents collected so far have been returned."
+        )
+    )
+
+    def __str__(self):
+        return (
+            f"{self.job}\nDocuments {self.offset}.."
+            f"{self.offset + len(self.results)} "
+            f"(next offset: {self.next_offset})"
+        )
+
+
+class ExportResponse(BaseModel):
+    path: str = Field(..., description="Absolute path of the written file.")
+    format: str
+    pages_exported: int
+    documents: int
+    rows: int = Field(..., description="Rows written, one per example.")
+    bytes: int = Field(..., description="Size of the written file.")
+    stats: GlobalStats
+
+    def __str__(self):
+        return (
+            f"Exported {self.rows} rows ({self.documents} docs, "
+            f"{self.pages_exported} pages) to {self.path} "
+            f"[{self.format}, {self.bytes} bytes]"
+        )
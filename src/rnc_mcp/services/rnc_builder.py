@@ -1,7 +1,8 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from rnc_mcp.schemas.schemas import (
     SearchQuery, TokenRequest, SubcorpusFilter, DateFilter
 )
+from rnc_mcp.metrics import timed
 
 
 class RNCQueryBuilder:
@@ -134,6 +135,7 @@ class RNCQueryBuilder:
         return conditions
 
     @classmethod
+    @timed("build")
     def build_payload(cls, query: SearchQuery) -> Dict[str, Any]:
         subsection_values = []
 
@@ -196,3 +198,40 @@ class RNCQueryBuilder:
                 }
 
         return payload
+
+    @classmethod
+    def build_date_sharded_payloads(
+        cls, query: SearchQuery, spans: List[Tuple[int, int]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Build one stats-only payload per (start_year, end_year) span.
+        The query's own date range is replaced by each span; all other
+        subcorpus filters are kept. The shared part of the payload is
+        built once.
+        """
+        subcorpus = query.subcorpus
+        if subcorpus is not None:
+            subcorpus = subcorpus.model_copy(update={"date_range": None})
+        base = cls.build_payload(query.model_copy(update={
+            "subcorpus": subcorpus,
+            "return_examples": False
+        }))
+        base_conditions = (
+            base.get("subcorpus", {})
+            .get("sectionValues", [{}])[0]
+            .get("conditionValues", [])
+        )
+
+        payloads = []
+        for start_year, end_year in spans:
+            date_cond = cls._build_date_range_condition(
+                DateFilter(start_year=start_year, end_year=end_year)
+            )
+            conditions = base_conditions + ([date_cond] if date_cond else [])
+            payload = dict(base)
+            if conditions:
+                payload["subcorpus"] = {
+                    "sectionValues": [{"conditionValues": conditions}]
+                }
+            payloads.append(payload)
+        return payloads
@@ -0,0 +1,227 @@
+"""Streaming export of concordance results to local files."""
+import asyncio
+import csv
+import importlib.util
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+from rnc_mcp.schemas.schemas import (
+    DocumentItem, ExportRequest, ExportResponse, GlobalStats, SearchQuery
+)
+from rnc_mcp.services.rnc_search import RNCSearchService
+from rnc_mcp.utils import ProgressReporter
+
+# Columns of every export format; one row per example
+COLUMNS = ("page", "title", "author", "year", "example")
+
+EXTENSIONS = {"ndjson": ".ndjson", "csv": ".csv", "parquet": ".parquet"}
+
+Row = Dict[str, Any]
+
+
+def document_rows(
+    page: int, documents: List[DocumentItem]
+) -> Iterator[Row]:
+    for doc in documents:
+        for example in doc.examples:
+            yield {
+                "page": page,
+                "title": doc.metadata.title,
+                "author": doc.metadata.author,
+                "year": doc.metadata.year,
+                "example": example
+            }
+
+
+class NdjsonWriter:
+    def __init__(self, path: Path):
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, rows: List[Row]) -> None:
+        self._file.writelines(
+            json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CsvWriter:
+    def __init__(self, path: Path):
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=COLUMNS)
+        self._writer.writeheader()
+
+    def write(self, rows: List[Row]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetWriter:
+    """Writes each batch of rows as one Parquet row group."""
+
+    def __init__(self, path: Path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._schema = pa.schema(
+            [("page", pa.int64())]
+            + [(name, pa.string()) for name in COLUMNS[1:]]
+        )
+        self._writer = pq.ParquetWriter(str(path), self._schema)
+
+    def write(self, rows: List[Row]) -> None:
+        if rows:
+            self._writer.write_table(
+                self._pa.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+WRITERS = {"ndjson": NdjsonWriter, "csv": CsvWriter, "parquet": ParquetWriter}
+
+
+class RNCExporter:
+    """
+    Writes every page of a concordance query to a file in `export_dir`
+    and returns only a summary, so large result sets never pass through
+    the MCP response.
+
+    Pages are fetched `page_concurrency` at a time through the search
+    service (so the client's rate limits and retries apply), written and
+    discarded before the next batch is requested: memory use does not
+    grow with the number of pages. The file is written under a temporary
+    name and only renamed into place once the export has succeeded.
+    """
+
+    def __init__(
+        self,
+        service: RNCSearchService,
+        export_dir: Union[str, Path],
+        max_pages: int = 1000,
+        page_concurrency: int = 4
+    ):
+        self.service = service
+        self.export_dir = Path(export_dir)
+        self.max_pages = max(1, max_pages)
+        self.page_concurrency = max(1, page_concurrency)
+
+    async def export(
+        self, request: ExportRequest, ctx: Optional[Any] = None
+    ) -> ExportResponse:
+        if not request.return_examples:
+            raise ValueError(
+                "Exports contain examples; use the concordance tool for "
+                "statistics only"
+            )
+        if request.end_page is not None and request.end_page < request.page:
+            raise ValueError("end_page must not be before page")
+        if (request.format == "parquet"
+                and importlib.util.find_spec("pyarrow") is None):
+            raise ValueError(
+                "Parquet export requires the pyarrow package "
+                "(pip install pyarrow)"
+            )
+
+        path = self._output_path(request)
+        last_allowed = request.page + self.max_pages - 1
+        end_page = min(
+            request.end_page if request.end_page is not None
+            else last_allowed,
+            last_allowed
+        )
+        query = SearchQuery.model_validate(
+            request.model_dump(include=set(SearchQuery.model_fields)))
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(path.name + ".part")
+        writer = WRITERS[request.format](partial)
+        try:
+            summary = await self._write_pages(
+                query, request.page, end_page, writer, ctx)
+            await asyncio.to_thread(writer.close)
+            os.replace(partial, path)
+        except BaseException:
+            writer.close()
+            partial.unlink(missing_ok=True)
+            raise
+
+        return ExportResponse(
+            path=str(path.resolve()),
+            format=request.format,
+            bytes=path.stat().st_size,
+            **summary
+        )
+
+    async def _write_pages(
+        self,
+        query: SearchQuery,
+        page: int,
+        end_page: int,
+        writer: Any,
+        ctx: Optional[Any]
+    ) -> Dict[str, Any]:
+        progress = ProgressReporter(ctx)
+        stats: Optional[GlobalStats] = None
+        pages_exported = documents = rows = 0
+
+        async def fetch(p: int):
+            async with progress.track(f"Page {p}"):
+                return await self.service.search(
+                    query.model_copy(update={"page": p}), cache=False)
+
+        while page <= end_page:
+            # The first page is fetched alone to learn the result size
+            size = self.page_concurrency if stats is not None else 1
+            pages = list(range(page, min(page + size - 1, end_page) + 1))
+            tasks = [asyncio.create_task(fetch(p)) for p in pages]
+            try:
+                responses = await asyncio.gather(*tasks)
+            except BaseException:
+                # A failed page fails the export; stop the rest of the batch
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+            if stats is None:
+                stats = responses[0].stats
+                end_page = min(end_page, stats.total_pages_available - 1)
+                progress.total = max(end_page - page + 1, 1)
+
+            batch: List[Row] = []
+            for p, response in zip(pages, responses):
+                batch.extend(document_rows(p, response.results))
+                documents += len(response.results)
+            await asyncio.to_thread(writer.write, batch)
+            pages_exported += len(pages)
+            rows += len(batch)
+            page = pages[-1] + 1
+
+        return {
+            "pages_exported": pages_exported,
+            "documents": documents,
+            "rows": rows,
+            "stats": stats or GlobalStats(total_pages_available=0)
+        }
+
+    def _output_path(self, request: ExportRequest) -> Path:
+        extension = EXTENSIONS[request.format]
+        name = request.filename
+        if name is None:
+            name = (
+                f"concordance-{request.corpus.value.lower()}-"
+                f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+            )
+        if Path(name).name != name or name in (".", ".."):
+            raise ValueError(
+                "filename must be a plain file name, without directories")
+        if not name.endswith(extension):
+            name += extension
+        return self.export_dir / name
@@ -1,5 +1,6 @@
 from typing import Dict, Any, List, Optional
 from rnc_mcp.schemas.schemas import ConcordanceResponse, DocumentItem, DocMetadata, GlobalStats, StatValues
+from rnc_mcp.metrics import timed
 
 
 class RNCResponseFormatter:
@@ -58,13 +59,11 @@ class RNCResponseFormatter:
 
         return "".join(text_builder)
 
-    @classmethod
-    def format_search_results(
-            cls, raw_response: Dict[str, Any]) -> ConcordanceResponse:
+    @staticmethod
+    def _parse_stats(raw_response: Dict[str, Any]) -> GlobalStats:
         pagination = raw_response.get("pagination", {})
         total_pages = pagination.get("totalPageCount", 0)
 
-        # Stats
         def parse_stats(key: str) -> Optional[StatValues]:
             data = raw_response.get(key)
             if not data:
@@ -74,13 +73,44 @@ class RNCResponseFormatter:
                 wordUsageCount=data.get("wordUsageCount")
             )
 
-        global_stats = GlobalStats(
+        return GlobalStats(
             corpusStats=parse_stats("corpusStats"),
             subcorpStats=parse_stats("subcorpStats"),
             queryStats=parse_stats("queryStats"),
             total_pages_available=total_pages
         )
 
+    @staticmethod
+    def ipm(stats: GlobalStats) -> Optional[float]:
+        """
+        Matches per million words of the searched subcorpus (or of the
+        whole corpus when no subcorpus was selected).
+        """
+        base = stats.subcorpStats or stats.corpusStats
+        if base is None or not base.wordUsageCount:
+            return None
+        matches = 0
+        if stats.queryStats and stats.queryStats.wordUsageCount:
+            matches = stats.queryStats.wordUsageCount
+        return matches * 1_000_000 / base.wordUsageCount
+
+    @classmethod
+    @timed("format")
+    def format_stats_only(
+            cls, raw_response: Dict[str, Any]) -> ConcordanceResponse:
+        """
+        Fast path for statistics-only queries: reads the stats and
+        pagination blocks and never walks the document groups.
+        """
+        return ConcordanceResponse(
+            stats=cls._parse_stats(raw_response), results=[])
+
+    @classmethod
+    @timed("format")
+    def format_search_results(
+            cls, raw_response: Dict[str, Any]) -> ConcordanceResponse:
+        global_stats = cls._parse_stats(raw_response)
+
         results: List[DocumentItem] = []
         groups = raw_response.get("groups", [])
 
@@ -108,3 +138,29 @@ class RNCResponseFormatter:
                             examples=examples))
 
         return ConcordanceResponse(stats=global_stats, results=results)
+
+    @staticmethod
+    def merge_results(
+            responses: List[ConcordanceResponse]) -> ConcordanceResponse:
+        """
+        Combine formatted pages of one query. Stats come from the first
+        page (they describe the whole query); documents are joined in
+        page order. RNC result pages do not overlap, and documents with
+        the same title, author or year are not necessarily the same
+        document, so only exact repeats within one page are dropped.
+        """
+        if not responses:
+            raise ValueError("No responses to merge")
+
+        results: List[DocumentItem] = []
+        for response in responses:
+            seen = set()
+            for doc in response.results:
+                key = doc.model_dump_json()
+                if key in seen:
+                    continue
+                seen.add(key)
+                results.append(doc)
+
+        return ConcordanceResponse(
+            stats=responses[0].stats, results=results)
@@ -0,0 +1,425 @@
+import asyncio
+import logging
+import math
+import time
+from typing import Any, Dict, List, Optional, Union
+from rnc_mcp.clients.base import CorpusClient
+from rnc_mcp.schemas.schemas import (
+    BatchConcordanceResponse, BatchItemResult, ConcordanceResponse,
+    CorpusComparisonResponse, CorpusFrequency, DocumentItem, FrequencyTimelineResponse, MultiPageConcordanceResponse,
+    MultiPageQuery, PageError, SearchQuery, TimelineBucket
+)
+from rnc_mcp.services.rnc_builder import RNCQueryBuilder
+from rnc_mcp.services.rnc_formatter import RNCResponseFormatter
+from rnc_mcp.utils import ProgressReporter
+
+logger = logging.getLogger(__name__)
+
+PageResult = Union[ConcordanceResponse, BaseException]
+RawResult = Union[Dict[str, Any], BaseException]
+
+
+class RNCSearchService:
+    """
+    Searches that need several concordance requests. All requests go
+    through the shared client, so its cache, limiters and retries apply
+    to each of them.
+
+    Each completed request is reported as an MCP progress notification
+    through `ctx`. Cancelling a search (e.g. the client aborts the tool
+    call) cancels its queued and in-flight requests, so an abandoned
+    sweep stops using the API quota.
+    """
+
+    def __init__(
+        self,
+        client: CorpusClient,
+        max_pages: int,
+        concurrency: int = 8,
+        max_batch_size: int = 100
+    ):
+        self.client = client
+        self.max_pages = max(1, max_pages)
+        self.concurrency = max(1, concurrency)
+        self.max_batch_size = max_batch_size
+
+    async def search(
+        self, query: SearchQuery, ctx: Optional[Any] = None,
+        cache: bool = True
+    ) -> ConcordanceResponse:
+        """
+        Runs one query and formats the result. cache=False keeps the
+        result out of the client's concordance cache.
+        """
+        payload = RNCQueryBuilder.build_payload(query)
+        raw = await self.client.execute_concordance(
+            payload, cache=cache, ctx=ctx)
+        if not query.return_examples:
+            return RNCResponseFormatter.format_stats_only(raw)
+        return RNCResponseFormatter.format_search_results(raw)
+
+    async def run_batch(
+        self, queries: List[SearchQuery], ctx: Optional[Any] = None
+    ) -> BatchConcordanceResponse:
+        """
+        Runs independent queries concurrently, at most `concurrency` at a
+        time. Results keep the input order; a failing query yields an
+        error entry instead of failing the batch. Identical queries share
+        one upstream request through the client's cache.
+        """
+        if len(queries) > self.max_batch_size:
+            raise ValueError(
+                f"Batch of {len(queries)} queries exceeds the limit of "
+                f"{self.max_batch_size}"
+            )
+        semaphore = asyncio.Semaphore(self.concurrency)
+        progress = ProgressReporter(ctx, total=len(queries))
+
+        async def run(index: int, query: SearchQuery) -> BatchItemResult:
+            start = time.perf_counter()
+            item = await self._run_item(index, query, semaphore, ctx)
+            await progress.step(
+                f"Query #{index}", time.perf_counter() - start,
+                "failed" if item.error is not None else "done"
+            )
+            return item
+
+        results = await asyncio.gather(
+            *[run(i, query) for i, query in enumerate(queries)])
+        failed = sum(1 for item in results if item.error is not None)
+        if failed:
+            await self._warn(
+                ctx, f"{failed} of {len(results)} batch queries failed")
+        return BatchConcordanceResponse(
+            results=results,
+            succeeded=len(results) - failed,
+            failed=failed
+        )
+
+    async def _run_item(
+        self,
+        index: int,
+        query: SearchQuery,
+        semaphore: asyncio.Semaphore,
+        ctx: Optional[Any]
+    ) -> BatchItemResult:
+        async with semaphore:
+            try:
+                payload = RNCQueryBuilder.build_payload(query)
+            except Exception as e:
+                return BatchItemResult(
+                    index=index, error=f"Query Build Error: {e}")
+            try:
+                raw = await self.client.execute_concordance(payload, ctx=ctx)
+            except Exception as e:
+                return BatchItemResult(
+                    index=index, error=f"API Execution Error: {e}")
+        try:
+            if query.return_examples:
+                response = RNCResponseFormatter.format_search_results(raw)
+            else:
+                response = RNCResponseFormatter.format_stats_only(raw)
+        except Exception as e:
+            return BatchItemResult(
+                index=index, error=f"Response Formatting Error: {e}")
+        return BatchItemResult(index=index, response=response)
+
+    async def fetch_pages(
+        self, query: MultiPageQuery, ctx: Optional[Any] = None
+    ) -> MultiPageConcordanceResponse:
+        """
+        Fetches a page range, or as many pages as needed to collect
+        `target_examples` examples, concurrently and merges them into one
+        response. At most `max_pages` pages are requested; pages that
+        fail are reported instead of failing the whole search.
+        """
+        last_allowed = query.page + self.max_pages - 1
+        progress = ProgressReporter(ctx)
+        if not query.return_examples:
+            # Statistics are the same on every page
+            progress.total = 1
+            results = await self._fetch_many(
+                query, [query.page], ctx, progress)
+        elif query.target_examples is not None:
+            results = await self._fetch_until(
+                query, query.target_examples, last_allowed, ctx, progress)
+        else:
+            end_page = query.end_page
+            if end_page is None:
+                end_page = query.page
+            if end_page < query.page:
+                raise ValueError("end_page must not be before page")
+            pages = list(range(query.page, min(end_page, last_allowed) + 1))
+            progress.total = len(pages)
+            results = await self._fetch_many(query, pages, ctx, progress)
+
+        return await self._combine(results, query.target_examples, ctx)
+
+    async def frequency_timeline(
+        self,
+        query: SearchQuery,
+        start_year: int,
+        end_year: int,
+        bucket_size: int,
+        ctx: Optional[Any] = None
+    ) -> FrequencyTimelineResponse:
+        """
+        Splits [start_year, end_year] into buckets of `bucket_size` years
+        and fetches the query's statistics for every bucket concurrently.
+        Buckets that fail carry an error instead of failing the timeline.
+        """
+        if end_year < start_year:
+            raise ValueError("end_year must not be before start_year")
+        if bucket_size < 1:
+            raise ValueError("bucket_size must be at least 1")
+        spans = [
+            (year, min(year + bucket_size - 1, end_year))
+            for year in range(start_year, end_year + 1, bucket_size)
+        ]
+        if len(spans) > self.max_batch_size:
+            raise ValueError(
+                f"Timeline of {len(spans)} buckets exceeds the limit of "
+                f"{self.max_batch_size}; use a larger bucket_size"
+            )
+
+        payloads = RNCQueryBuilder.build_date_sharded_payloads(query, spans)
+        results = await self._execute_all(
+            payloads, [f"Years {a}-{b}" for a, b in spans], ctx)
+
+        buckets = []
+        for (start, end), raw in zip(spans, results):
+            if isinstance(raw, BaseException):
+                buckets.append(TimelineBucket(
+                    start_year=start, end_year=end, error=str(raw)))
+                continue
+            stats = RNCResponseFormatter.format_stats_only(raw).stats
+            buckets.append(TimelineBucket(
+                start_year=start,
+                end_year=end,
+                queryStats=stats.queryStats,
+                subcorpStats=stats.subcorpStats,
+                ipm=RNCResponseFormatter.ipm(stats)
+            ))
+
+        failed = sum(1 for bucket in buckets if bucket.error is not None)
+        if failed == len(buckets):
+            raise results[0]
+        if failed:
+            await self._warn(
+                ctx, f"{failed} of {len(buckets)} timeline buckets failed")
+        return FrequencyTimelineResponse(buckets=buckets)
+
+    async def compare_corpora(
+        self,
+        query: SearchQuery,
+        corpora: List[str],
+        timeout: float,
+        ctx: Optional[Any] = None
+    ) -> CorpusComparisonResponse:
+        """
+        Runs one query against several corpora concurrently in stats-only
+        mode. Each corpus gets at most `timeout` seconds, so one slow
+        corpus does not hold back the others; corpora that fail or time
+        out carry an error instead of failing the comparison.
+        """
+        corpora = list(dict.fromkeys(corpora))
+        if not corpora:
+            raise ValueError("At least one corpus is required")
+        if len(corpora) > self.max_batch_size:
+            raise ValueError(
+                f"Comparison of {len(corpora)} corpora exceeds the limit "
+                f"of {self.max_batch_size}"
+            )
+
+        payloads = [
+            RNCQueryBuilder.build_payload(query.model_copy(update={
+                "corpus": corpus, "return_examples": False
+            }))
+            for corpus in corpora
+        ]
+        results = await self._execute_all(
+            payloads, [f"Corpus {c}" for c in corpora], ctx, timeout=timeout)
+
+        rows = []
+        for corpus, raw in zip(corpora, results):
+            if isinstance(raw, TimeoutError):
+                rows.append(CorpusFrequency(
+                    corpus=corpus, error=f"Timed out after {timeout:g}s"))
+                continue
+            if isinstance(raw, BaseException):
+                rows.append(CorpusFrequency(corpus=corpus, error=str(raw)))
+                continue
+            stats = RNCResponseFormatter.format_stats_only(raw).stats
+            rows.append(CorpusFrequency(
+                corpus=corpus,
+                queryStats=stats.queryStats,
+                corpusStats=stats.corpusStats,
+                subcorpStats=stats.subcorpStats,
+                ipm=RNCResponseFormatter.ipm(stats)
+            ))
+
+        failed = sum(1 for row in rows if row.error is not None)
+        if failed == len(rows):
+            raise results[0]
+        if failed:
+            await self._warn(
+                ctx, f"{failed} of {len(rows)} corpora could not be searched")
+        return CorpusComparisonResponse(corpora=rows)
+
+    async def _execute_all(
+        self,
+        payloads: List[Dict[str, Any]],
+        labels: List[str],
+        ctx: Optional[Any],
+        timeout: Optional[float] = None
+    ) -> List[RawResult]:
+        """
+        Run payloads concurrently, at most `concurrency` at a time. A
+        positive `timeout` bounds each payload (including its queueing).
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        progress = ProgressReporter(ctx, total=len(payloads))
+
+        async def execute(
+            payload: Dict[str, Any], label: str
+        ) -> Dict[str, Any]:
+            async with progress.track(label):
+                async with asyncio.timeout(
+                    timeout if timeout and timeout > 0 else None
+                ):
+                    async with semaphore:
+                        return await self.client.execute_concordance(
+                            payload, ctx=ctx)
+
+        return await asyncio.gather(
+            *[execute(p, label) for p, label in zip(payloads, labels)],
+            return_exceptions=True
+        )
+
+    @staticmethod
+    async def _warn(ctx: Optional[Any], message: str) -> None:
+        logger.warning(message)
+        if ctx is not None:
+            await ctx.warning(message)
+
+    async def _fetch_until(
+        self,
+        query: SearchQuery,
+        target: int,
+        last_allowed: int,
+        ctx: Optional[Any],
+        progress: ProgressReporter
+    ) -> Dict[int, PageResult]:
+        # The first page tells how many pages exist and how many examples
+        # a page holds; later rounds fetch the estimated remaining pages
+        # concurrently until the target is met or results run out
+        results: Dict[int, PageResult] = {}
+        next_page = query.page
+        last_page: Optional[int] = None
+        while next_page <= last_allowed:
+            fetched = [
+                r for r in results.values()
+                if isinstance(r, ConcordanceResponse)
+            ]
+            if results and not fetched:
+                # The first page failed: the result size is unknown
+                break
+            collected = sum(self._count_examples(r) for r in fetched)
+            if collected >= target:
+                break
+            if fetched:
+                per_page = max(collected / len(fetched), 1.0)
+                batch = math.ceil((target - collected) / per_page)
+            else:
+                batch = 1
+            end = min(next_page + batch - 1, last_allowed)
+            if last_page is not None:
+                end = min(end, last_page)
+            if end < next_page:
+                break
+
+            pages = list(range(next_page, end + 1))
+            progress.total = len(results) + len(pages)
+            results.update(
+                await self._fetch_many(query, pages, ctx, progress))
+            next_page = end + 1
+
+            for page in pages:
+                result = results[page]
+                if last_page is None and isinstance(
+                        result, ConcordanceResponse):
+                    last_page = result.stats.total_pages_available - 1
+        return results
+
+    async def _fetch_many(
+        self,
+        query: SearchQuery,
+        pages: List[int],
+        ctx: Optional[Any],
+        progress: ProgressReporter
+    ) -> Dict[int, PageResult]:
+        async def fetch(page: int) -> ConcordanceResponse:
+            async with progress.track(f"Page {page}"):
+                return await self.search(
+                    query.model_copy(update={"page": page}), ctx)
+
+        results = await asyncio.gather(
+            *[fetch(page) for page in pages], return_exceptions=True)
+        return dict(zip(pages, results))
+
+    async def _combine(
+        self,
+        results: Dict[int, PageResult],
+        target: Optional[int],
+        ctx: Optional[Any]
+    ) -> MultiPageConcordanceResponse:
+        pages = sorted(
+            p for p, r in results.items()
+            if isinstance(r, ConcordanceResponse)
+        )
+        errors = [
+            (p, r) for p, r in sorted(results.items())
+            if not isinstance(r, ConcordanceResponse)
+        ]
+        if not pages:
+            # Nothing to return: surface the first error as is
+            raise errors[0][1]
+
+        failed_pages = [PageError(page=p, error=str(e)) for p, e in errors]
+        if failed_pages:
+            await self._warn(
+                ctx,
+                f"{len(failed_pages)} of {len(results)} pages failed; "
+                "results are partial"
+            )
+
+        merged = RNCResponseFormatter.merge_results(
+            [results[p] for p in pages])
+        documents = merged.results
+        if target is not None:
+            documents = self._truncate(documents, target)
+
+        return MultiPageConcordanceResponse(
+            stats=merged.stats,
+            results=documents,
+            pages_fetched=pages,
+            failed_pages=failed_pages
+        )
+
+    @staticmethod
+    def _count_examples(response: ConcordanceResponse) -> int:
+        return sum(len(doc.examples) for doc in response.results)
+
+    @staticmethod
+    def _truncate(
+        documents: List[DocumentItem], limit: int
+    ) -> List[DocumentItem]:
+        truncated = []
+        for doc in documents:
+            if limit <= 0:
+                break
+            examples = doc.examples[:limit]
+            limit -= len(examples)
+            truncated.append(
+                DocumentItem(metadata=doc.metadata, examples=examples))
+        return truncated
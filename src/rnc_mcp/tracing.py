@@ -0,0 +1,271 @@
+"""Lightweight span tracing exported as OTLP JSON."""
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Union
+
+import httpx
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from rnc_mcp.config import Config
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "rnc-mcp"
+
+# OTLP span kinds and status codes
+KIND_INTERNAL = 1
+KIND_SERVER = 2
+KIND_CLIENT = 3
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_current: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "rnc_current_span", default=None)
+
+
+class Span:
+    """One timed operation of a trace."""
+
+    __slots__ = (
+        "trace", "name", "span_id", "parent_id", "kind", "start_ns",
+        "end_ns", "attributes", "status", "message"
+    )
+
+    def __init__(
+        self,
+        trace: "Trace",
+        name: str,
+        parent_id: Optional[str],
+        kind: int,
+        attributes: Dict[str, Any]
+    ):
+        self.trace = trace
+        self.name = name
+        self.span_id = random.getrandbits(64).to_bytes(8, "big").hex()
+        self.parent_id = parent_id
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes
+        self.status = STATUS_OK
+        self.message = ""
+
+    @property
+    def trace_id(self) -> str:
+        return self.trace.trace_id
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": self.status}
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        if self.message:
+            span["status"]["message"] = self.message
+        return span
+
+
+class Trace:
+    """Spans of one sampled root operation (e.g. a tool call)."""
+
+    def __init__(self):
+        self.trace_id = random.getrandbits(128).to_bytes(16, "big").hex()
+        self.spans: List[Span] = []
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)}
+        for key, value in attributes.items() if value is not None
+    ]
+
+
+def otlp_payload(spans: List[Span]) -> Dict[str, Any]:
+    """Spans as an OTLP/JSON ExportTraceServiceRequest."""
+    return {
+        "resourceSpans": [{
+            "resource": {
+                "attributes": _otlp_attributes({"service.name": SERVICE_NAME})
+            },
+            "scopeSpans": [{
+                "scope": {"name": "rnc_mcp"},
+                "spans": [span.to_otlp() for span in spans]
+            }]
+        }]
+    }
+
+
+class FileExporter:
+    """Appends each trace as one OTLP JSON line to a local file."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def export(self, payload: Dict[str, Any]) -> None:
+        line = json.dumps(payload, ensure_ascii=False) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+
+class OTLPHttpExporter:
+    """Posts each trace to an OTLP/HTTP collector (JSON encoding)."""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        endpoint = endpoint.rstrip("/")
+        if not endpoint.endswith("/v1/traces"):
+            endpoint += "/v1/traces"
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    def export(self, payload: Dict[str, Any]) -> None:
+        httpx.post(
+            self.endpoint, json=payload, timeout=self.timeout
+        ).raise_for_status()
+
+
+class Tracer:
+    """
+    Records nested spans through a context variable, so spans opened in
+    tasks spawned by a traced operation join its trace.
+
+    start_trace() begins a trace for a root operation, sampled with
+    probability `sample_rate`; span() adds a child to the current trace
+    and does nothing (beyond one context variable lookup) when no sampled
+    trace is active. A finished trace is handed to the exporter in a
+    worker thread, off the event loop; export errors are only logged.
+    """
+
+    def __init__(self, exporter: Any = None, sample_rate: float = 0.0):
+        self.exporter = exporter
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self._exports: Set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None and self.sample_rate > 0
+
+    @contextmanager
+    def start_trace(
+        self, name: str, kind: int = KIND_SERVER, **attributes
+    ) -> Iterator[Optional[Span]]:
+        """Begin a (possibly unsampled) trace; yields its root span."""
+        if not self.enabled or random.random() >= self.sample_rate:
+            yield None
+            return
+        root = Span(Trace(), name, None, kind, attributes)
+        try:
+            with self._activate(root):
+                yield root
+        finally:
+            self._finish(root.trace)
+
+    @contextmanager
+    def span(
+        self, name: str, kind: int = KIND_INTERNAL, **attributes
+    ) -> Iterator[Optional[Span]]:
+        """A child of the current span, if a sampled trace is active."""
+        parent = _current.get()
+        if parent is None:
+            yield None
+            return
+        span = Span(parent.trace, name, parent.span_id, kind, attributes)
+        with self._activate(span):
+            yield span
+
+    @contextmanager
+    def _activate(self, span: Span) -> Iterator[None]:
+        token = _current.set(span)
+        try:
+            yield
+        except BaseException as e:
+            span.status = STATUS_ERROR
+            span.message = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            span.trace.spans.append(span)
+            _current.reset(token)
+
+    def _finish(self, trace: Trace) -> None:
+        payload = otlp_payload(trace.spans)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._export(payload)
+            return
+        task = loop.create_task(asyncio.to_thread(self._export, payload))
+        self._exports.add(task)
+        task.add_done_callback(self._exports.discard)
+
+    def _export(self, payload: Dict[str, Any]) -> None:
+        try:
+            self.exporter.export(payload)
+        except Exception as e:
+            logger.warning("Failed to export trace: %s", e)
+
+    async def flush(self) -> None:
+        """Wait for pending exports (e.g. on shutdown)."""
+        await asyncio.gather(*self._exports, return_exceptions=True)
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def tracer_from_env() -> Tracer:
+    """Tracer configured by RNC_TRACE_* (disabled unless configured)."""
+    exporter = None
+    if Config.RNC_TRACE_ENDPOINT:
+        exporter = OTLPHttpExporter(Config.RNC_TRACE_ENDPOINT)
+    elif Config.RNC_TRACE_FILE:
+        exporter = FileExporter(os.path.expanduser(Config.RNC_TRACE_FILE))
+    return Tracer(exporter, Config.RNC_TRACE_SAMPLE_RATE)
+
+
+class ToolTracingMiddleware(Middleware):
+    """Starts one trace per MCP tool call, covering the whole call."""
+
+    def __init__(self, tracer: Tracer):
+        self.tracer = tracer
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        name = context.message.name
+        with self.tracer.start_trace(
+            f"tools/call {name}", **{"mcp.tool.name": name}
+        ) as root:
+            if root is not None:
+                logger.debug("Tool %s: trace %s", name, root.trace_id)
+            return await call_next(context)
+
+
+TRACER = tracer_from_env()
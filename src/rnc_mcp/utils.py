@@ -1,32 +1,134 @@
 import time
 import functools
+import logging
+import reprlib
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+from rnc_mcp.config import Config
+from rnc_mcp.tracing import TRACER
+
+
+logger = logging.getLogger(__name__)
+
+# Bounded repr for nested API payloads: the cost of a preview does not
+# grow with the size of the response
+_preview_repr = reprlib.Repr()
+_preview_repr.maxlevel = 6
+_preview_repr.maxdict = 20
+_preview_repr.maxlist = 10
+_preview_repr.maxstring = 200
+_preview_repr.maxother = 200
+
+
+def debug_enabled() -> bool:
+    """Whether the effective log level lets debug messages through."""
+    level = logging.getLevelName(Config.RNC_LOG_LEVEL)
+    return isinstance(level, int) and level <= logging.DEBUG
+
+
+def preview(value: Any, limit: int) -> str:
+    """Render `value` for logging, truncated to at most `limit` chars."""
+    if isinstance(value, (dict, list, tuple)):
+        text = _preview_repr.repr(value)
+    else:
+        text = str(value)
+    if len(text) > limit:
+        text = f"{text[:limit]}... [truncated {len(text) - limit} chars]"
+    return text
+
+
+async def log_debug(ctx, label: str, value: Any) -> None:
+    """
+    Send a size-capped debug preview of `value` to the client.
+    Does nothing, and does not stringify `value`, unless debug
+    logging is enabled.
+    """
+    if ctx is None or not debug_enabled():
+        return
+    await ctx.debug(
+        f"{label}: {preview(value, Config.RNC_DEBUG_PREVIEW_CHARS)}")
 
 
 def measure_time(func):
     """
     Async decorator that measures execution time and logs it to FastMCP Context.
+    Within a sampled trace, the call is also recorded as a span.
     """
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
         start_time = time.perf_counter()
         try:
-            return await func(*args, **kwargs)
+            with TRACER.span(func.__name__):
+                return await func(*args, **kwargs)
         finally:
-            elapsed = time.perf_counter() - start_time
-            msg = f"Operation '{func.__name__}' completed in {elapsed:.4f}s"
+            if debug_enabled():
+                elapsed = time.perf_counter() - start_time
+                msg = (
+                    f"Operation '{func.__name__}' completed in "
+                    f"{elapsed:.4f}s"
+                )
 
-            # Try to find 'ctx' in keyword arguments
-            ctx = kwargs.get('ctx')
+                # Try to find 'ctx' in keyword arguments
+                ctx = kwargs.get('ctx')
 
-            # If not found, look in positional args (duck typing)
-            if not ctx:
-                for arg in args:
-                    if hasattr(arg, 'debug') and hasattr(arg, 'info'):
-                        ctx = arg
-                        break
+                # If not found, look in positional args (duck typing)
+                if not ctx:
+                    for arg in args:
+                        if hasattr(arg, 'debug') and hasattr(arg, 'info'):
+                            ctx = arg
+                            break
 
-            # Log to context
-            if ctx:
-                await ctx.debug(msg)
+                # Log to context
+                if ctx:
+                    await ctx.debug(msg)
 
     return wrapper
+
+
+class ProgressReporter:
+    """
+    Sends MCP progress notifications through `ctx` as the steps of an
+    operation complete (e.g. each upstream request of a paged search).
+    Every message carries the step's duration and the time elapsed since
+    the operation started. Does nothing without a ctx, and never lets a
+    failed notification break the operation.
+
+    `total` may be raised while the operation runs, when more steps are
+    planned than first known.
+    """
+
+    def __init__(self, ctx, total: Optional[int] = None):
+        self.ctx = ctx
+        self.total = total
+        self.completed = 0
+        self._start = time.perf_counter()
+
+    @asynccontextmanager
+    async def track(self, label: str) -> AsyncIterator[None]:
+        """Report the wrapped step as done (or failed) when it exits."""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            await self.step(label, time.perf_counter() - start, "failed")
+            raise
+        await self.step(label, time.perf_counter() - start)
+
+    async def step(
+        self, label: str, duration: float, status: str = "done"
+    ) -> None:
+        self.completed += 1
+        if self.ctx is None:
+            return
+        elapsed = time.perf_counter() - self._start
+        of_total = f"/{self.total}" if self.total is not None else ""
+        message = (
+            f"{label} {status} in {duration:.2f}s "
+            f"({self.completed}{of_total}, {elapsed:.2f}s elapsed)"
+        )
+        try:
+            await self.ctx.report_progress(
+                self.completed, self.total, message)
+        except Exception as e:
+            logger.debug("Progress notification failed: %s", e)
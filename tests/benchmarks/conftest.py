@@ -0,0 +1,23 @@
+"""Benchmark suite configuration."""
+
+import sys
+
+import pytest
+
+
+def _traced() -> bool:
+    """Whether a tracer such as coverage or a debugger is slowing calls."""
+    if sys.gettrace() is not None:
+        return True
+    monitoring = getattr(sys, "monitoring", None)
+    return monitoring is not None and any(
+        monitoring.get_tool(tool) is not None
+        for tool in (monitoring.COVERAGE_ID, monitoring.DEBUGGER_ID)
+    )
+
+
+@pytest.fixture(autouse=True)
+def _untraced():
+    """Skip timed cases under a tracer, whose overhead voids the budgets."""
+    if _traced():
+        pytest.skip("benchmarks are not timed under coverage or a tracer")
@@ -0,0 +1,80 @@
+"""Benchmarks for RNCQueryBuilder payload construction."""
+
+import pytest
+from rnc_mcp.schemas.schemas import SearchQuery
+from rnc_mcp.services.rnc_builder import RNCQueryBuilder
+from tests.benchmarks.timing import best_of, budget
+from tests.fixtures.e2e_queries import (
+    COMPLEX_QUERY_WITH_SUBCORPUS, SIMPLE_LEMMA_QUERY
+)
+
+# Regression thresholds, a few times the cost measured when they were set
+# (~7us for a one-token query, ~2us per further token; about twice that
+# when the request is validated as well)
+BUILD_BASE = 50e-6
+BUILD_PER_TOKEN = 10e-6
+VALIDATE_BASE = 100e-6
+VALIDATE_PER_TOKEN = 20e-6
+
+
+def long_query(tokens: int) -> dict:
+    """A query searching for a sequence of `tokens` words."""
+    return {
+        "corpus": "MAIN",
+        "tokens": [
+            {"lemma": "дом", "gramm": "S", "dist_min": 1, "dist_max": 3}
+            for _ in range(tokens)
+        ],
+        "subcorpus": {"date_range": {"start_year": 1800, "end_year": 1900}}
+    }
+
+
+def validate_and_build(raw: dict) -> dict:
+    return RNCQueryBuilder.build_payload(SearchQuery(**raw))
+
+
+QUERIES = [
+    pytest.param(SIMPLE_LEMMA_QUERY["query"], id="simple"),
+    pytest.param(COMPLEX_QUERY_WITH_SUBCORPUS["query"], id="subcorpus"),
+] + [
+    pytest.param(long_query(n), id=f"{n}-tokens") for n in (10, 100, 1000)
+]
+
+
+@pytest.mark.benchmark
+class TestBuildPayloadBenchmark:
+    """Per-call CPU cost of building RNC API payloads."""
+
+    @pytest.mark.parametrize("raw", QUERIES)
+    def test_build_within_budget(self, raw):
+        """Building a payload must stay within the per-token budget."""
+        query = SearchQuery(**raw)
+        tokens = len(query.tokens)
+
+        elapsed = best_of(
+            RNCQueryBuilder.build_payload, query,
+            number=max(1, 2000 // tokens)
+        )
+        limit = budget(BUILD_BASE + tokens * BUILD_PER_TOKEN)
+
+        print(
+            f"\n{tokens} tokens: build={elapsed * 1e6:.1f}us "
+            f"(budget {limit * 1e6:.0f}us)"
+        )
+        assert elapsed < limit
+
+    @pytest.mark.parametrize("raw", QUERIES)
+    def test_validate_and_build_within_budget(self, raw):
+        """Validating the request and building must stay within budget."""
+        tokens = len(raw["tokens"])
+
+        elapsed = best_of(
+            validate_and_build, raw, number=max(1, 2000 // tokens)
+        )
+        limit = budget(VALIDATE_BASE + tokens * VALIDATE_PER_TOKEN)
+
+        print(
+            f"\n{tokens} tokens: validate+build={elapsed * 1e6:.1f}us "
+            f"(budget {limit * 1e6:.0f}us)"
+        )
+        assert elapsed < limit
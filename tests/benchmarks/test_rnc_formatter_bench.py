@@ -0,0 +1,86 @@
+"""Benchmarks for RNCResponseFormatter on large responses."""
+
+import pytest
+from rnc_mcp.services.rnc_formatter import RNCResponseFormatter
+from tests.benchmarks.timing import best_of, budget
+from tests.fixtures.synthetic_responses import build_concordance_response
+
+# Regression thresholds for format_search_results, a few times the cost
+# measured when they were set (~5us per snippet, ~0.2us per word)
+FORMAT_BASE = 0.0005
+FORMAT_PER_SNIPPET = 10e-6
+FORMAT_PER_WORD = 1e-6
+
+
+@pytest.mark.benchmark
+class TestStatsOnlyBenchmark:
+    """CPU saved by the stats-only path on large responses."""
+
+    @pytest.mark.parametrize("docs,snippets", [(50, 50), (200, 10)])
+    def test_stats_only_skips_snippet_cost(self, docs, snippets):
+        """Stats-only formatting must not scale with response size."""
+        raw = build_concordance_response(docs, snippets)
+
+        full = best_of(RNCResponseFormatter.format_search_results, raw)
+        fast = best_of(RNCResponseFormatter.format_stats_only, raw)
+
+        print(
+            f"\n{docs} docs x {snippets} snippets: "
+            f"full={full * 1000:.2f}ms stats_only={fast * 1000:.3f}ms "
+            f"saved={(full - fast) * 1000:.2f}ms ({full / fast:.0f}x)"
+        )
+        assert fast * 20 < full
+
+
+@pytest.mark.benchmark
+class TestFormatSearchResultsBenchmark:
+    """Per-call CPU cost of formatting concordance pages."""
+
+    @pytest.mark.parametrize("docs,snippets,words", [
+        (1, 1, 20),
+        (10, 5, 20),
+        (100, 10, 20),
+        (500, 1, 20),
+        (500, 10, 20),
+        (50, 50, 20),
+        (500, 50, 20),
+        (10, 5, 500),
+        (10, 5, 2000),
+    ])
+    def test_format_within_budget(self, docs, snippets, words):
+        """Formatting cost must stay within the per-snippet budget."""
+        raw = build_concordance_response(docs, snippets, words)
+        total = docs * snippets
+
+        elapsed = best_of(
+            RNCResponseFormatter.format_search_results, raw,
+            number=max(1, 1000 // total)
+        )
+        limit = budget(
+            FORMAT_BASE + total * FORMAT_PER_SNIPPET
+            + total * words * FORMAT_PER_WORD
+        )
+
+        print(
+            f"\n{docs} docs x {snippets} snippets x {words} words: "
+            f"{elapsed * 1000:.3f}ms "
+            f"({elapsed / total * 1e6:.1f}us/snippet, "
+            f"budget {limit * 1000:.1f}ms)"
+        )
+        assert elapsed < limit
+
+    def test_cost_is_linear_in_docs(self):
+        """Per-document cost must not grow with the page size."""
+        small = build_concordance_response(50, 10)
+        large = build_concordance_response(500, 10)
+
+        per_doc_small = best_of(
+            RNCResponseFormatter.format_search_results, small) / 50
+        per_doc_large = best_of(
+            RNCResponseFormatter.format_search_results, large) / 500
+
+        print(
+            f"\nper doc: 50 docs={per_doc_small * 1e6:.1f}us "
+            f"500 docs={per_doc_large * 1e6:.1f}us"
+        )
+        assert per_doc_large < per_doc_small * 3
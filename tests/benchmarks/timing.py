@@ -0,0 +1,34 @@
+"""Timing helpers shared by the benchmark suite."""
+
+import gc
+import os
+import time
+
+# Scales every absolute time budget, for slow or shared CI machines
+SLOWDOWN = float(os.getenv("BENCHMARK_SLOWDOWN", "1"))
+
+
+def best_of(func, arg, repeat: int = 5, number: int = 1) -> float:
+    """
+    Return the fastest of `repeat` runs of func(arg), in seconds per call.
+    Each run calls func `number` times with garbage collection paused,
+    as timeit does, so cheap calls are not dominated by timer resolution.
+    """
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                func(arg)
+            timings.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return min(timings)
+
+
+def budget(seconds: float) -> float:
+    """An absolute time budget, scaled by BENCHMARK_SLOWDOWN."""
+    return seconds * SLOWDOWN
@@ -98,6 +98,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "unit: Unit tests (no network)"
     )
+    config.addinivalue_line(
+        "markers", "benchmark: Performance benchmarks (no network)"
+    )
 
 
 # ==============================================================================
@@ -0,0 +1,46 @@
+"""Fake paged RNC API for multi-page search, job and export tests."""
+
+import asyncio
+from typing import (
+    Any, Awaitable, Callable, Collection, Dict, List, Optional, Tuple
+)
+from rnc_mcp.exceptions import RNCAPIError
+from tests.fixtures.synthetic_responses import build_concordance_response
+
+
+def paged_backend(
+    total_pages: int,
+    docs: int = 2,
+    snippets: int = 3,
+    failing: Collection[int] = (),
+    fail_times: Optional[int] = None,
+    gate: Optional[asyncio.Event] = None
+) -> Tuple[Callable[..., Awaitable[Dict[str, Any]]], List[int]]:
+    """
+    execute_concordance side effect serving distinct docs per page, and
+    the list of pages it was asked for.
+
+    Pages at or past `total_pages` are empty. Pages in `failing` raise
+    RNCAPIError (only the first `fail_times` times, if given). With
+    `gate`, pages after the first wait until the event is set.
+    """
+    requested = []
+    failures: Dict[int, int] = {}
+
+    async def execute(payload, **kwargs):
+        page = payload["params"]["pageParams"]["page"]
+        requested.append(page)
+        if gate is not None and page > 0:
+            await gate.wait()
+        if page in failing and (
+                fail_times is None or failures.get(page, 0) < fail_times):
+            failures[page] = failures.get(page, 0) + 1
+            raise RNCAPIError(f"RNC API Error 503: page {page}")
+        raw = build_concordance_response(
+            docs if page < total_pages else 0, snippets)
+        raw["pagination"]["totalPageCount"] = total_pages
+        for doc in raw["groups"][0]["docs"]:
+            doc["info"]["title"] = f"Page {page} {doc['info']['title']}"
+        return raw
+
+    return execute, requested
@@ -0,0 +1,72 @@
+"""Synthetic RNC concordance responses of configurable size.
+
+Used by the benchmark suite to measure formatting cost on responses much
+larger than the hand-written fixtures in mock_responses.py.
+"""
+
+from typing import Any, Dict, List
+
+
+def _words(length: int, hit_every: int = 7) -> List[Dict[str, Any]]:
+    words = []
+    for i in range(length):
+        words.append({
+            "text": f"слово{i}" if i % 2 == 0 else " ",
+            "displayParams": {"hit": True} if i % hit_every == 3 else {}
+        })
+    return words
+
+
+def _doc(index: int, snippets: int, words: int) -> Dict[str, Any]:
+    return {
+        "info": {
+            "title": f"Document {index}",
+            "docExplainInfo": {
+                "items": [
+                    {
+                        "parsingFields": [
+                            {
+                                "name": "author",
+                                "value": [{"valString": {"v": f"Author {index}"}}]
+                            },
+                            {
+                                "name": "created",
+                                "value": [{"valString": {"v": str(1800 + index % 200)}}]
+                            }
+                        ]
+                    }
+                ]
+            }
+        },
+        "snippetGroups": [
+            {
+                "snippets": [
+                    {"sequences": [{"words": _words(words)}]}
+                    for _ in range(snippets)
+                ]
+            }
+        ]
+    }
+
+
+def build_concordance_response(
+    docs: int, snippets_per_doc: int, words_per_snippet: int = 20
+) -> Dict[str, Any]:
+    """Build a concordance response with the given number of documents."""
+    return {
+        "corpusStats": {"textCount": 1000000, "wordUsageCount": 500000000},
+        "subcorpStats": {"textCount": 50000, "wordUsageCount": 25000000},
+        "queryStats": {
+            "textCount": docs,
+            "wordUsageCount": docs * snippets_per_doc
+        },
+        "pagination": {"totalPageCount": 100},
+        "groups": [
+            {
+                "docs": [
+                    _doc(i, snippets_per_doc, words_per_snippet)
+                    for i in range(docs)
+                ]
+            }
+        ]
+    }
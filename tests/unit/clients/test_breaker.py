@@ -0,0 +1,242 @@
+"""Unit tests for the per-endpoint circuit breaker."""
+
+from types import SimpleNamespace
+import httpx
+import pytest
+from rnc_mcp.clients import breaker as breaker_module
+from rnc_mcp.clients.breaker import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, endpoint_breakers
+)
+from rnc_mcp.clients.cache import ConcordanceCache
+from rnc_mcp.clients.rnc_client import RNCClient
+from rnc_mcp.exceptions import (
+    RNCAPIError, RNCCircuitOpenError, RNCQueueTimeoutError
+)
+from tests.fixtures.mock_responses import (
+    CONCORDANCE_SUCCESS, CORPUS_CONFIG_MAIN
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the breaker module."""
+    now = [1000.0]
+    monkeypatch.setattr(
+        breaker_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def server_error():
+    request = httpx.Request("GET", "https://example.org")
+    return httpx.HTTPStatusError(
+        "503", request=request, response=httpx.Response(503, request=request))
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Tests for circuit breaker state transitions."""
+
+    def test_opens_after_consecutive_failures(self, clock):
+        """Test that the threshold of failures opens the circuit."""
+        breaker = CircuitBreaker("concordance", failure_threshold=3)
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state == CLOSED
+
+        breaker.record_failure()
+
+        assert breaker.state == OPEN
+        with pytest.raises(RNCCircuitOpenError) as exc_info:
+            breaker.check()
+        assert isinstance(exc_info.value, RNCAPIError)
+        assert "concordance" in str(exc_info.value)
+        assert breaker.rejected == 1
+
+    def test_success_resets_failure_count(self, clock):
+        """Test that only consecutive failures count."""
+        breaker = CircuitBreaker("config", failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success(0.1)
+        breaker.record_failure()
+
+        assert breaker.state == CLOSED
+
+    def test_slow_responses_count_as_failures(self, clock):
+        """Test that latency SLO violations open the circuit."""
+        breaker = CircuitBreaker(
+            "attrs", failure_threshold=2, latency_slo=1.0)
+        breaker.record_success(0.5)
+        breaker.record_success(2.0)
+        breaker.record_success(3.0)
+
+        assert breaker.state == OPEN
+
+    def test_half_open_probe_closes_circuit(self, clock):
+        """Test that a successful probe restores traffic."""
+        breaker = CircuitBreaker(
+            "concordance", failure_threshold=1, recovery_timeout=30)
+        breaker.record_failure()
+        clock[0] += 31
+
+        breaker.check()
+        assert breaker.state == HALF_OPEN
+        # Only one probe at a time
+        with pytest.raises(RNCCircuitOpenError):
+            breaker.check()
+
+        breaker.record_success(0.1)
+        assert breaker.state == CLOSED
+        breaker.check()
+
+    def test_failed_probe_reopens_circuit(self, clock):
+        """Test that a failed probe opens the circuit again."""
+        breaker = CircuitBreaker(
+            "concordance", failure_threshold=3, recovery_timeout=30)
+        for _ in range(3):
+            breaker.record_failure()
+        clock[0] += 31
+        breaker.check()
+
+        breaker.record_failure()
+
+        assert breaker.state == OPEN
+        assert breaker.retry_in() == 30
+        with pytest.raises(RNCCircuitOpenError):
+            breaker.check()
+
+    def test_non_upstream_errors_are_ignored(self, clock):
+        """Test that client errors and local timeouts do not count."""
+        breaker = CircuitBreaker("concordance", failure_threshold=1)
+        request = httpx.Request("GET", "https://example.org")
+        bad_request = httpx.HTTPStatusError(
+            "400", request=request,
+            response=httpx.Response(400, request=request))
+
+        breaker.record_error(bad_request)
+        breaker.record_error(RNCQueueTimeoutError("queued too long"))
+        assert breaker.state == CLOSED
+
+        breaker.record_error(server_error())
+        assert breaker.state == OPEN
+
+    def test_cancelled_probe_frees_probe_slot(self, clock):
+        """Test that a probe that never reached the API allows another."""
+        breaker = CircuitBreaker(
+            "concordance", failure_threshold=1, recovery_timeout=30)
+        breaker.record_failure()
+        clock[0] += 31
+        breaker.check()
+
+        breaker.record_error(RNCQueueTimeoutError("queued too long"))
+
+        breaker.check()
+        assert breaker.state == HALF_OPEN
+
+    def test_disabled(self, clock):
+        """Test that a non-positive threshold never opens the circuit."""
+        breaker = CircuitBreaker("concordance", failure_threshold=0)
+        for _ in range(10):
+            breaker.record_failure()
+        breaker.check()
+
+    def test_endpoint_breakers(self):
+        """Test that every RNC endpoint gets its own breaker."""
+        breakers = endpoint_breakers(5, 30.0, 10.0)
+        assert set(breakers) == {"concordance", "config", "attrs"}
+        assert breakers["config"].latency_slo == 10.0
+
+
+@pytest.mark.unit
+class TestClientCircuitBreaking:
+    """Tests for RNCClient behavior behind circuit breakers."""
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self, mock_env_token):
+        """Test that requests stop reaching a failing endpoint."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        client = RNCClient(
+            transport=httpx.MockTransport(handler),
+            breakers=endpoint_breakers(2, 30.0, 0.0)
+        )
+        payload = {"corpus": {"type": "MAIN"}}
+
+        for _ in range(2):
+            with pytest.raises(RNCAPIError, match="503"):
+                await client.execute_concordance(payload)
+        with pytest.raises(RNCCircuitOpenError):
+            await client.execute_concordance(payload)
+
+        assert len(calls) == 2
+        assert client.breakers["concordance"].state == OPEN
+        assert client.breakers["config"].state == CLOSED
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_serves_expired_cache(
+            self, mock_env_token, monkeypatch):
+        """Test that expired cached responses are served while open."""
+        fail = []
+
+        def handler(request):
+            if fail:
+                return httpx.Response(503)
+            return httpx.Response(200, json=CONCORDANCE_SUCCESS)
+
+        cache = ConcordanceCache(max_bytes=10**6, ttl=60)
+        client = RNCClient(
+            transport=httpx.MockTransport(handler),
+            concordance_cache=cache,
+            breakers=endpoint_breakers(1, 30.0, 0.0)
+        )
+        payload = {"corpus": {"type": "MAIN"}}
+        await client.execute_concordance(payload)
+
+        # Expire the entry, then take the API down
+        monkeypatch.setattr(cache, "ttl", 0.000001)
+        fail.append(True)
+        with pytest.raises(RNCAPIError):
+            await client.execute_concordance(payload)
+
+        result = await client.execute_concordance(payload)
+
+        assert result == CONCORDANCE_SUCCESS
+        with pytest.raises(RNCCircuitOpenError):
+            await client.execute_concordance(
+                {"corpus": {"type": "PAPER"}})
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_probe_restores_traffic(
+            self, mock_env_token, monkeypatch):
+        """Test that a successful probe closes the circuit."""
+        now = [1000.0]
+        monkeypatch.setattr(
+            breaker_module, "time",
+            SimpleNamespace(monotonic=lambda: now[0]))
+        fail = [True]
+
+        def handler(request):
+            if fail[0]:
+                return httpx.Response(503)
+            return httpx.Response(200, json=CORPUS_CONFIG_MAIN)
+
+        client = RNCClient(
+            transport=httpx.MockTransport(handler),
+            breakers=endpoint_breakers(1, 30.0, 0.0)
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_corpus_config("MAIN")
+        with pytest.raises(RNCCircuitOpenError):
+            await client.get_corpus_config("MAIN")
+
+        fail[0] = False
+        now[0] += 31
+
+        assert await client.get_corpus_config("MAIN") == CORPUS_CONFIG_MAIN
+        assert client.breakers["config"].state == CLOSED
+        await client.aclose()
@@ -0,0 +1,207 @@
+"""Unit tests for the concordance response cache."""
+
+import copy
+import httpx
+import pytest
+from types import SimpleNamespace
+from rnc_mcp.clients.cache import ConcordanceCache, canonical_payload_key
+from rnc_mcp.clients.rnc_client import RNCClient
+from rnc_mcp.services.rnc_builder import RNCQueryBuilder
+from rnc_mcp.schemas.schemas import SearchQuery, TokenRequest
+from tests.fixtures.mock_responses import CONCORDANCE_SUCCESS
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        "rnc_mcp.clients.cache.time",
+        SimpleNamespace(monotonic=lambda: fake.now))
+    return fake
+
+
+@pytest.mark.unit
+class TestCanonicalKey:
+    """Tests for canonical payload hashing."""
+
+    def test_key_ignores_dict_ordering(self):
+        """Test that key order does not change the hash."""
+        a = {"corpus": {"type": "MAIN"}, "params": {"page": 0}}
+        b = {"params": {"page": 0}, "corpus": {"type": "MAIN"}}
+
+        assert canonical_payload_key(a) == canonical_payload_key(b)
+
+    def test_key_ignores_none_values(self):
+        """Test that explicit None values equal missing keys."""
+        a = {"corpus": {"type": "MAIN"}, "sort": None}
+        b = {"corpus": {"type": "MAIN"}}
+
+        assert canonical_payload_key(a) == canonical_payload_key(b)
+
+    def test_key_ignores_condition_order(self):
+        """Test that conditions of one token can be given in any order."""
+        first = SearchQuery(tokens=[TokenRequest(lemma="дом", gramm="S")])
+        payload = RNCQueryBuilder.build_payload(first)
+        reordered = copy.deepcopy(payload)
+        conditions = reordered["lexGramm"]["sectionValues"][0][
+            "subsectionValues"][0]["conditionValues"]
+        conditions.reverse()
+
+        assert canonical_payload_key(payload) == canonical_payload_key(
+            reordered)
+
+    def test_key_keeps_token_order(self):
+        """Test that the token sequence is part of the key."""
+        a = RNCQueryBuilder.build_payload(SearchQuery(tokens=[
+            TokenRequest(lemma="красный"), TokenRequest(lemma="дом")]))
+        b = RNCQueryBuilder.build_payload(SearchQuery(tokens=[
+            TokenRequest(lemma="дом"), TokenRequest(lemma="красный")]))
+
+        assert canonical_payload_key(a) != canonical_payload_key(b)
+
+    def test_key_includes_pagination(self):
+        """Test that different pages have different keys."""
+        tokens = [TokenRequest(lemma="дом")]
+        a = RNCQueryBuilder.build_payload(SearchQuery(tokens=tokens, page=0))
+        b = RNCQueryBuilder.build_payload(SearchQuery(tokens=tokens, page=1))
+
+        assert canonical_payload_key(a) != canonical_payload_key(b)
+
+    def test_defaults_match_explicit_values(self):
+        """Test that default query fields equal their explicit values."""
+        a = SearchQuery(tokens=[TokenRequest(lemma="дом")])
+        b = SearchQuery(
+            corpus="MAIN", tokens=[TokenRequest(lemma="дом", dist_min=1)],
+            page=0, per_page=10, return_examples=True)
+
+        assert canonical_payload_key(
+            RNCQueryBuilder.build_payload(a)
+        ) == canonical_payload_key(RNCQueryBuilder.build_payload(b))
+
+
+@pytest.mark.unit
+class TestConcordanceCache:
+    """Tests for LRU, size bound and TTL behaviour."""
+
+    def test_hit_and_miss_counters(self, clock):
+        """Test that hits and misses are counted."""
+        cache = ConcordanceCache(max_bytes=1000, ttl=60)
+        assert cache.get("a") is None
+        cache.put("a", {"x": 1}, 10)
+        assert cache.get("a") == {"x": 1}
+
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_entries_expire(self, clock):
+        """Test that entries are not served after their TTL."""
+        cache = ConcordanceCache(max_bytes=1000, ttl=60)
+        cache.put("a", {}, 10)
+
+        clock.now += 61
+
+        assert cache.get("a") is None
+
+    def test_evicts_least_recently_used_by_size(self, clock):
+        """Test that the oldest unused entries are evicted when full."""
+        cache = ConcordanceCache(max_bytes=100, ttl=60)
+        cache.put("a", {}, 40)
+        cache.put("b", {}, 40)
+        cache.get("a")
+        cache.put("c", {}, 40)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.size == 80
+        assert cache.evictions == 1
+
+    def test_oversized_entry_is_skipped(self, clock):
+        """Test that a response larger than the budget is not stored."""
+        cache = ConcordanceCache(max_bytes=100, ttl=60)
+        cache.put("a", {}, 200)
+
+        assert len(cache) == 0
+
+    def test_replacing_entry_updates_size(self, clock):
+        """Test that re-storing a key does not double count its size."""
+        cache = ConcordanceCache(max_bytes=100, ttl=60)
+        cache.put("a", {}, 40)
+        cache.put("a", {}, 30)
+
+        assert cache.size == 30
+
+    def test_disabled_cache_stores_nothing(self, clock):
+        """Test that a zero budget disables the cache."""
+        cache = ConcordanceCache(max_bytes=0, ttl=60)
+        cache.put("a", {}, 1)
+
+        assert not cache.enabled
+        assert len(cache) == 0
+
+
+@pytest.mark.unit
+class TestClientCache:
+    """Tests for RNCClient concordance caching."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_payload_skips_upstream(self, mock_env_token):
+        """Test that an identical payload is served from the cache."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json=CONCORDANCE_SUCCESS)
+
+        client = RNCClient(
+            transport=httpx.MockTransport(handler),
+            concordance_cache=ConcordanceCache(max_bytes=10**6, ttl=60))
+        payload = {"corpus": {"type": "MAIN"}, "params": {"page": 0}}
+
+        first = await client.execute_concordance(payload)
+        second = await client.execute_concordance(dict(reversed(
+            list(payload.items()))))
+
+        assert first == second == CONCORDANCE_SUCCESS
+        assert len(calls) == 1
+        assert client.concordance_cache.hits == 1
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cache_bypass(self, mock_env_token):
+        """Test that cache=False neither reads nor fills the cache."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json=CONCORDANCE_SUCCESS)
+
+        client = RNCClient(
+            transport=httpx.MockTransport(handler),
+            concordance_cache=ConcordanceCache(max_bytes=10**6, ttl=60))
+        payload = {"corpus": {"type": "MAIN"}, "params": {"page": 0}}
+
+        await client.execute_concordance(payload, cache=False)
+        assert len(client.concordance_cache) == 0
+
+        await client.execute_concordance(payload)
+        await client.execute_concordance(payload, cache=False)
+
+        assert len(calls) == 3
+        assert client.concordance_cache.hits == 0
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, mock_env_token):
+        """Test that failed requests are retried upstream."""
+        from rnc_mcp.exceptions import RNCAPIError
+        responses = [httpx.Response(500), httpx.Response(
+            200, json=CONCORDANCE_SUCCESS)]
+        client = RNCClient(
+            transport=httpx.MockTransport(lambda r: responses.pop(0)),
+            concordance_cache=ConcordanceCache(max_bytes=10**6, ttl=60))
+
+        with pytest.raises(RNCAPIError):
+            await client.execute_concordance({})
+        assert await client.execute_concordance({}) == CONCORDANCE_SUCCESS
+        await client.aclose()
@@ -0,0 +1,227 @@
+"""Unit tests for the upstream concurrency limiter."""
+
+import asyncio
+import httpx
+import pytest
+from rnc_mcp.clients.limiter import ConcurrencyLimiter
+from rnc_mcp.clients.rnc_client import RNCClient
+from rnc_mcp.exceptions import RNCAPIError, RNCQueueTimeoutError
+from rnc_mcp.schemas.schemas import RncCorpusType
+from tests.fixtures.mock_responses import CONCORDANCE_SUCCESS
+
+
+async def run_tracked(limiter, corpus, active, peak, delay=0.01):
+    """Hold a limiter slot for `delay` seconds, recording concurrency."""
+    async with limiter.acquire(corpus):
+        active[corpus] = active.get(corpus, 0) + 1
+        active["all"] = active.get("all", 0) + 1
+        peak[corpus] = max(peak.get(corpus, 0), active[corpus])
+        peak["all"] = max(peak.get("all", 0), active["all"])
+        await asyncio.sleep(delay)
+        active[corpus] -= 1
+        active["all"] -= 1
+
+
+@pytest.mark.unit
+class TestConcurrencyLimiter:
+    """Tests for global and per-corpus concurrency limits."""
+
+    @pytest.mark.asyncio
+    async def test_global_limit(self):
+        """Test that no more than max_concurrency requests run at once."""
+        limiter = ConcurrencyLimiter(max_concurrency=3)
+        active, peak = {}, {}
+
+        await asyncio.gather(*[
+            run_tracked(limiter, f"C{i}", active, peak) for i in range(10)
+        ])
+
+        assert peak["all"] == 3
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_per_corpus_limit(self):
+        """Test that one corpus cannot exceed its own limit."""
+        limiter = ConcurrencyLimiter(
+            max_concurrency=10, default_per_corpus=2)
+        active, peak = {}, {}
+
+        await asyncio.gather(
+            *[run_tracked(limiter, "MAIN", active, peak) for _ in range(6)],
+            *[run_tracked(limiter, "PAPER", active, peak) for _ in range(6)]
+        )
+
+        assert peak["MAIN"] == 2
+        assert peak["PAPER"] == 2
+        assert peak["all"] == 4
+
+    @pytest.mark.asyncio
+    async def test_per_corpus_override(self):
+        """Test that per_corpus overrides the default corpus limit."""
+        limiter = ConcurrencyLimiter(
+            max_concurrency=10, default_per_corpus=1,
+            per_corpus={"MAIN": 3})
+        active, peak = {}, {}
+
+        await asyncio.gather(
+            *[run_tracked(limiter, "MAIN", active, peak) for _ in range(6)],
+            *[run_tracked(limiter, "PAPER", active, peak) for _ in range(3)]
+        )
+
+        assert peak["MAIN"] == 3
+        assert peak["PAPER"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unlimited(self):
+        """Test that non-positive limits do not queue requests."""
+        limiter = ConcurrencyLimiter(max_concurrency=0, default_per_corpus=0)
+        active, peak = {}, {}
+
+        await asyncio.gather(*[
+            run_tracked(limiter, "MAIN", active, peak) for _ in range(20)
+        ])
+
+        assert peak["MAIN"] == 20
+        assert limiter.timeouts == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout(self):
+        """Test that a request waiting longer than max_wait fails."""
+        limiter = ConcurrencyLimiter(max_concurrency=1, max_wait=0.01)
+        release = asyncio.Event()
+
+        async def hold():
+            async with limiter.acquire("MAIN"):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+
+        with pytest.raises(RNCQueueTimeoutError) as exc_info:
+            async with limiter.acquire("MAIN"):
+                pass
+
+        assert isinstance(exc_info.value, RNCAPIError)
+        assert "within 0.01s" in str(exc_info.value)
+        assert limiter.timeouts == 1
+        assert limiter.waiting == 0
+
+        release.set()
+        await holder
+        # The slot held by the timed-out request was not leaked
+        async with limiter.acquire("MAIN"):
+            assert limiter.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_releases_corpus_slot(self):
+        """Test that a timeout after the corpus slot frees that slot."""
+        limiter = ConcurrencyLimiter(
+            max_concurrency=1, default_per_corpus=1, max_wait=0.01)
+        release = asyncio.Event()
+
+        async def hold():
+            async with limiter.acquire("PAPER"):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+
+        with pytest.raises(RNCQueueTimeoutError):
+            async with limiter.acquire("MAIN"):
+                pass
+
+        release.set()
+        await holder
+        async with limiter.acquire("MAIN"):
+            pass
+
+    @pytest.mark.asyncio
+    async def test_stats_report_queue_depth(self):
+        """Test that stats expose in-flight and waiting counts."""
+        limiter = ConcurrencyLimiter(max_concurrency=1)
+        release = asyncio.Event()
+
+        async def hold():
+            async with limiter.acquire("MAIN"):
+                await release.wait()
+
+        tasks = [asyncio.create_task(hold()) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        stats = limiter.stats()
+        assert stats["in_flight"] == 1
+        assert stats["waiting"] == 2
+        assert stats["in_flight_per_corpus"] == {"MAIN": 1}
+        assert stats["waiting_per_corpus"] == {"MAIN": 2}
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        stats = limiter.stats()
+        assert stats["in_flight"] == 0
+        assert stats["waiting"] == 0
+        assert stats["max_waiting"] == 2
+        assert stats["in_flight_per_corpus"] == {}
+
+
+@pytest.mark.unit
+class TestClientLimiting:
+    """Tests for RNCClient request limiting."""
+
+    @pytest.mark.asyncio
+    async def test_client_requests_respect_limit(self, mock_env_token):
+        """Test that concurrent distinct queries are bounded."""
+        active = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200, json=CONCORDANCE_SUCCESS)
+
+        client = RNCClient(
+            transport=httpx.MockTransport(handler),
+            limiter=ConcurrencyLimiter(
+                max_concurrency=10, default_per_corpus=2)
+        )
+
+        await asyncio.gather(*[
+            client.execute_concordance(
+                {"corpus": {"type": "MAIN"}, "params": {"pageParams": i}})
+            for i in range(6)
+        ])
+
+        assert peak == 2
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_builder_corpus_reported_by_code(self, mock_env_token):
+        """Test that the corpus enum from the builder is named by its code."""
+        release = asyncio.Event()
+
+        async def handler(request):
+            await release.wait()
+            return httpx.Response(200, json=CONCORDANCE_SUCCESS)
+
+        client = RNCClient(
+            transport=httpx.MockTransport(handler),
+            limiter=ConcurrencyLimiter(
+                max_concurrency=10, per_corpus={"MAIN": 1}, max_wait=0.01)
+        )
+        payloads = [
+            {"corpus": {"type": RncCorpusType.MAIN}, "params": {"page": i}}
+            for i in range(2)
+        ]
+
+        holder = asyncio.create_task(client.execute_concordance(payloads[0]))
+        await asyncio.sleep(0)
+        with pytest.raises(RNCQueueTimeoutError) as exc_info:
+            await client.execute_concordance(payloads[1])
+
+        assert "No upstream slot for MAIN request" in str(exc_info.value)
+        release.set()
+        await holder
+        await client.aclose()
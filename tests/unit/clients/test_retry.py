@@ -0,0 +1,276 @@
+"""Unit tests for retries of transient RNC API errors."""
+
+import asyncio
+import email.utils
+import time
+from unittest.mock import AsyncMock, Mock
+import httpx
+import pytest
+from rnc_mcp.clients.limiter import TokenBucket
+from rnc_mcp.clients.retry import RetryPolicy, parse_retry_after
+from rnc_mcp.clients.rnc_client import RNCClient
+from rnc_mcp.exceptions import RNCAPIError, RNCRateLimitError
+from tests.fixtures.mock_responses import CONCORDANCE_SUCCESS
+
+
+def make_client(responses, **kwargs):
+    """Client whose transport answers with `responses` in order."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return responses[min(len(calls), len(responses)) - 1]
+
+    kwargs.setdefault(
+        "retry_policy", RetryPolicy(max_retries=3, backoff=0.001))
+    client = RNCClient(transport=httpx.MockTransport(handler), **kwargs)
+    return client, calls
+
+
+def make_ctx():
+    ctx = Mock()
+    ctx.info = AsyncMock()
+    ctx.warning = AsyncMock()
+    ctx.debug = AsyncMock()
+    return ctx
+
+
+@pytest.mark.unit
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_seconds(self):
+        """Test that a delay in seconds is parsed."""
+        assert parse_retry_after("2") == 2.0
+        assert parse_retry_after(" 1.5 ") == 1.5
+
+    def test_http_date(self):
+        """Test that an HTTP date becomes seconds from now."""
+        header = email.utils.formatdate(time.time() + 10, usegmt=True)
+        assert 8 <= parse_retry_after(header) <= 10
+
+    def test_past_date_is_zero(self):
+        """Test that a date in the past means no delay."""
+        header = email.utils.formatdate(time.time() - 60, usegmt=True)
+        assert parse_retry_after(header) == 0.0
+
+    def test_missing_or_malformed(self):
+        """Test that unusable headers are ignored."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+        assert parse_retry_after("soon") is None
+
+
+@pytest.mark.unit
+class TestRetryPolicy:
+    """Tests for retry decisions and delays."""
+
+    def test_only_transient_statuses_retry(self):
+        """Test that only 429/502/503/504 are retried."""
+        policy = RetryPolicy(max_retries=3)
+        for status in (429, 502, 503, 504):
+            assert policy.delay(0, status) is not None
+        for status in (400, 401, 404, 500):
+            assert policy.delay(0, status) is None
+
+    def test_retries_are_bounded(self):
+        """Test that no delay is returned after max_retries."""
+        policy = RetryPolicy(max_retries=2)
+        assert policy.delay(1, 503) is not None
+        assert policy.delay(2, 503) is None
+
+    def test_backoff_is_jittered_and_capped(self):
+        """Test that backoff stays within the exponential window."""
+        policy = RetryPolicy(max_retries=10, backoff=1.0, max_delay=5.0)
+        for _ in range(50):
+            assert 0 <= policy.delay(1, 503) <= 2.0
+            assert 0 <= policy.delay(8, 503) <= 5.0
+
+    def test_retry_after_is_honored(self):
+        """Test that Retry-After is a lower bound on the delay."""
+        policy = RetryPolicy(max_retries=3, backoff=0.5)
+        for _ in range(50):
+            assert 3.0 <= policy.delay(0, 429, "3") <= 3.5
+
+    def test_retry_after_beyond_max_delay_gives_up(self):
+        """Test that an overly long Retry-After is not waited for."""
+        policy = RetryPolicy(max_retries=3, max_delay=10.0)
+        assert policy.delay(0, 429, "3600") is None
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Tests for the token-bucket rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_immediate(self):
+        """Test that up to `burst` requests need no wait."""
+        bucket = TokenBucket(rate=1, burst=5)
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        assert time.monotonic() - start < 0.1
+        assert bucket.throttled == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_is_enforced(self):
+        """Test that requests beyond the burst wait for tokens."""
+        bucket = TokenBucket(rate=100, burst=1)
+        start = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        assert time.monotonic() - start >= 0.045
+        assert bucket.throttled >= 5
+
+    @pytest.mark.asyncio
+    async def test_pause_blocks_tokens(self):
+        """Test that pause() delays the next token."""
+        bucket = TokenBucket(rate=1000, burst=10)
+        bucket.pause(0.05)
+        start = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - start >= 0.045
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        """Test that a non-positive rate never waits."""
+        bucket = TokenBucket(rate=0)
+        for _ in range(100):
+            await bucket.acquire()
+        assert not bucket.enabled
+
+
+@pytest.mark.unit
+class TestClientRetries:
+    """Tests for RNCClient retry behavior."""
+
+    @pytest.mark.asyncio
+    async def test_transient_error_is_retried(self, mock_env_token):
+        """Test that a 503 followed by success returns the result."""
+        client, calls = make_client([
+            httpx.Response(503),
+            httpx.Response(502),
+            httpx.Response(200, json=CONCORDANCE_SUCCESS)
+        ])
+
+        result = await client.execute_concordance({"corpus": {"type": "MAIN"}})
+
+        assert result == CONCORDANCE_SUCCESS
+        assert len(calls) == 3
+        assert client.retries == 2
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_retries_reported_to_ctx(self, mock_env_token):
+        """Test that every retry and the recovery are logged to ctx."""
+        client, _ = make_client([
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json=CONCORDANCE_SUCCESS)
+        ])
+        ctx = make_ctx()
+
+        await client.execute_concordance(
+            {"corpus": {"type": "MAIN"}}, ctx=ctx)
+
+        warning = ctx.warning.await_args.args[0]
+        assert "429" in warning and "retry 1/3" in warning
+        assert any(
+            "after 1 retry" in call.args[0]
+            for call in ctx.info.await_args_list)
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_coalesced_waiters_get_own_notices(self, mock_env_token):
+        """Test that a failing ctx does not fail coalesced callers."""
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.01)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return httpx.Response(200, json=CONCORDANCE_SUCCESS)
+
+        calls = []
+        client = RNCClient(
+            transport=httpx.MockTransport(handler),
+            retry_policy=RetryPolicy(max_retries=3, backoff=0.001))
+        closed = make_ctx()
+        closed.warning.side_effect = RuntimeError("session closed")
+        closed.info.side_effect = RuntimeError("session closed")
+        other = make_ctx()
+        payload = {"corpus": {"type": "MAIN"}}
+
+        results = await asyncio.gather(
+            client.execute_concordance(payload, ctx=closed),
+            client.execute_concordance(payload, ctx=other),
+            client.execute_concordance(payload))
+
+        assert results == [CONCORDANCE_SUCCESS] * 3
+        assert len(calls) == 2
+        assert "retry 1/3" in other.warning.await_args.args[0]
+        assert "after 1 retry" in other.info.await_args.args[0]
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_persistent_429_raises_rate_limit_error(
+            self, mock_env_token):
+        """Test that exhausted 429 retries raise RNCRateLimitError."""
+        client, calls = make_client(
+            [httpx.Response(429, headers={"Retry-After": "0"})])
+
+        with pytest.raises(RNCRateLimitError) as exc_info:
+            await client.execute_concordance({"corpus": {"type": "MAIN"}})
+
+        assert isinstance(exc_info.value, RNCAPIError)
+        assert len(calls) == 4
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_long_retry_after_fails_fast(self, mock_env_token):
+        """Test that a Retry-After beyond max_delay is not waited for."""
+        client, calls = make_client(
+            [httpx.Response(429, headers={"Retry-After": "3600"})])
+
+        with pytest.raises(RNCRateLimitError):
+            await client.execute_concordance({"corpus": {"type": "MAIN"}})
+
+        assert len(calls) == 1
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self, mock_env_token):
+        """Test that a 400 fails immediately."""
+        client, calls = make_client([httpx.Response(400, text="bad")])
+
+        with pytest.raises(RNCAPIError, match="400"):
+            await client.execute_concordance({"corpus": {"type": "MAIN"}})
+
+        assert len(calls) == 1
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_429_pauses_rate_limiter(self, mock_env_token):
+        """Test that a throttled response pauses the shared bucket."""
+        bucket = TokenBucket(rate=1000, burst=10)
+        bucket.pause = Mock(wraps=bucket.pause)
+        client, _ = make_client([
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json=CONCORDANCE_SUCCESS)
+        ], rate_limiter=bucket)
+
+        await client.execute_concordance({"corpus": {"type": "MAIN"}})
+
+        bucket.pause.assert_called_once()
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_without_policy_errors_are_not_retried(
+            self, mock_env_token):
+        """Test that a client without RetryPolicy keeps old behavior."""
+        client, calls = make_client(
+            [httpx.Response(503)], retry_policy=None)
+
+        with pytest.raises(RNCAPIError, match="503"):
+            await client.execute_concordance({"corpus": {"type": "MAIN"}})
+
+        assert len(calls) == 1
+        await client.aclose()
@@ -0,0 +1,188 @@
+"""Unit tests for RNCClient."""
+
+import json
+import httpx
+import pytest
+from rnc_mcp.clients.rnc_client import RNCClient
+from rnc_mcp.exceptions import RNCAuthError, RNCAPIError
+from tests.fixtures.mock_responses import (
+    CONCORDANCE_SUCCESS,
+    CORPUS_CONFIG_MAIN,
+    ATTRIBUTES_GRAMMAR,
+)
+
+
+def make_transport(handler, calls=None):
+    """Build a MockTransport that records every request it serves."""
+    def record(request: httpx.Request) -> httpx.Response:
+        if calls is not None:
+            calls.append(request)
+        return handler(request)
+    return httpx.MockTransport(record)
+
+
+def rnc_handler(request: httpx.Request) -> httpx.Response:
+    """Route requests to canned RNC responses."""
+    if request.url.path.endswith("/lex-gramm/concordance"):
+        return httpx.Response(200, json=CONCORDANCE_SUCCESS)
+    if request.url.path.endswith("/config/"):
+        return httpx.Response(200, json=CORPUS_CONFIG_MAIN)
+    if "/attrs/" in request.url.path:
+        return httpx.Response(200, json=ATTRIBUTES_GRAMMAR)
+    return httpx.Response(404)
+
+
+@pytest.mark.unit
+class TestConnectionPool:
+    """Tests for the shared connection pool lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_requests_reuse_single_http_client(self, mock_env_token):
+        """Test that consecutive requests share one pooled client."""
+        client = RNCClient(transport=make_transport(rnc_handler))
+        await client.open()
+        pool = client._http
+
+        await client.execute_concordance({"corpus": {"type": "MAIN"}})
+        await client.get_corpus_config("MAIN")
+        await client.get_attributes("MAIN", "gr")
+
+        assert client._http is pool
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_lazy_open_on_first_request(self, mock_env_token):
+        """Test that a request without open() creates the pool lazily."""
+        client = RNCClient(transport=make_transport(rnc_handler))
+        assert not client.is_open
+
+        await client.get_corpus_config("MAIN")
+
+        assert client.is_open
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_pool(self, mock_env_token):
+        """Test that the async context manager closes the pool on exit."""
+        async with RNCClient(transport=make_transport(rnc_handler)) as client:
+            assert client.is_open
+
+        assert not client.is_open
+
+    @pytest.mark.asyncio
+    async def test_reopen_after_close(self, mock_env_token):
+        """Test that a closed client can be reopened."""
+        client = RNCClient(transport=make_transport(rnc_handler))
+        await client.open()
+        await client.aclose()
+        await client.open()
+
+        assert client.is_open
+        await client.aclose()
+
+    def test_pool_limits_from_config(self, monkeypatch):
+        """Test that pool limits are read from Config."""
+        from rnc_mcp.config import Config
+        monkeypatch.setattr(Config, "RNC_HTTP_MAX_CONNECTIONS", 7)
+        monkeypatch.setattr(Config, "RNC_HTTP_KEEPALIVE_EXPIRY", 12.5)
+
+        client = RNCClient()
+
+        assert client.limits.max_connections == 7
+        assert client.limits.keepalive_expiry == 12.5
+
+
+@pytest.mark.unit
+class TestRequests:
+    """Tests for request construction and error mapping."""
+
+    @pytest.mark.asyncio
+    async def test_concordance_posts_payload(self, mock_env_token):
+        """Test that concordance sends the payload with auth headers."""
+        calls = []
+        client = RNCClient(transport=make_transport(rnc_handler, calls))
+        payload = {"corpus": {"type": "MAIN"}}
+
+        result = await client.execute_concordance(payload)
+
+        assert result == CONCORDANCE_SUCCESS
+        assert calls[0].method == "POST"
+        assert json.loads(calls[0].content) == payload
+        assert calls[0].headers["Authorization"] == f"Bearer {mock_env_token}"
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_attributes_request_params(self, mock_env_token):
+        """Test that attribute requests encode the corpus type."""
+        calls = []
+        client = RNCClient(transport=make_transport(rnc_handler, calls))
+
+        await client.get_attributes("POETIC", "sem")
+
+        assert calls[0].url.path.endswith("/attrs/sem")
+        assert json.loads(calls[0].url.params["corpus"]) == {"type": "POETIC"}
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_concordance_401_raises_auth_error(self, mock_env_token):
+        """Test that 401 is mapped to RNCAuthError."""
+        client = RNCClient(
+            transport=make_transport(lambda r: httpx.Response(401)))
+
+        with pytest.raises(RNCAuthError):
+            await client.execute_concordance({})
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_concordance_http_error_raises_api_error(
+            self, mock_env_token):
+        """Test that other HTTP errors are mapped to RNCAPIError."""
+        client = RNCClient(transport=make_transport(
+            lambda r: httpx.Response(500, text="boom")))
+
+        with pytest.raises(RNCAPIError) as exc_info:
+            await client.execute_concordance({})
+
+        assert "500" in str(exc_info.value)
+        assert "boom" in str(exc_info.value)
+        await client.aclose()
+
+
+@pytest.mark.unit
+class TestHTTP2:
+    """Tests for the opt-in HTTP/2 mode."""
+
+    def test_http2_disabled_by_default(self):
+        """Test that HTTP/1.1 is used unless HTTP/2 is enabled."""
+        from rnc_mcp.config import Config
+        assert Config.RNC_HTTP2 is False
+
+    @pytest.mark.asyncio
+    async def test_http2_without_h2_package_raises(self, monkeypatch):
+        """Test that enabling HTTP/2 without 'h2' is a config error."""
+        from rnc_mcp.config import Config
+        from rnc_mcp.exceptions import RNCConfigError
+        monkeypatch.setattr(Config, "RNC_HTTP2", True)
+        monkeypatch.setattr(
+            "rnc_mcp.clients.rnc_client.importlib.util.find_spec",
+            lambda name: None)
+
+        client = RNCClient()
+
+        with pytest.raises(RNCConfigError) as exc_info:
+            await client.open()
+
+        assert "httpx[http2]" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_http2_enabled_opens_pool(self, monkeypatch):
+        """Test that the pool opens in HTTP/2 mode when 'h2' is present."""
+        pytest.importorskip("h2")
+        from rnc_mcp.config import Config
+        monkeypatch.setattr(Config, "RNC_HTTP2", True)
+
+        client = RNCClient()
+        await client.open()
+
+        assert client.is_open
+        await client.aclose()
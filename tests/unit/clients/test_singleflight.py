@@ -0,0 +1,162 @@
+"""Unit tests for SingleFlight request coalescing."""
+
+import asyncio
+import httpx
+import pytest
+from rnc_mcp.clients.rnc_client import RNCClient
+from rnc_mcp.clients.singleflight import SingleFlight
+from tests.fixtures.mock_responses import CONCORDANCE_SUCCESS
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Tests for merging identical in-flight calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test that concurrent callers of one key run fn once."""
+        flight = SingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(
+            *[flight.do("k", fn) for _ in range(5)])
+
+        assert results == ["result"] * 5
+        assert len(calls) == 1
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        """Test that distinct keys are not merged."""
+        flight = SingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+
+        await asyncio.gather(flight.do("a", fn), flight.do("b", fn))
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_fans_out_to_all_waiters(self):
+        """Test that every waiter receives the shared exception."""
+        flight = SingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", fn), flight.do("k", fn), return_exceptions=True)
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(self):
+        """Test that one waiter leaving keeps the call alive for others."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fn():
+            await release.wait()
+            return "result"
+
+        leaving = asyncio.create_task(flight.do("k", fn))
+        staying = asyncio.create_task(flight.do("k", fn))
+        await asyncio.sleep(0)
+        leaving.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await staying == "result"
+        assert leaving.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_last_waiter_leaving_cancels_call(self):
+        """Test that the shared call stops once nobody waits for it."""
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def fn():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        waiter = asyncio.create_task(flight.do("k", fn))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        await asyncio.sleep(0)
+
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_caller_after_cancellation_starts_fresh_call(self):
+        """Test that a caller right after the last waiter left is served."""
+        flight = SingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        waiter = asyncio.create_task(flight.do("k", fn))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        result = await flight.do("k", fn)
+
+        assert result == "result"
+        assert waiter.cancelled()
+        assert len(calls) == 2
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_new_call_after_completion(self):
+        """Test that a finished key starts a fresh call."""
+        flight = SingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+
+        await flight.do("k", fn)
+        await flight.do("k", fn)
+
+        assert len(calls) == 2
+
+
+@pytest.mark.unit
+class TestClientCoalescing:
+    """Tests for RNCClient request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_payloads_coalesce(
+            self, mock_env_token):
+        """Test that identical concurrent queries make one request."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=CONCORDANCE_SUCCESS)
+
+        client = RNCClient(transport=httpx.MockTransport(handler))
+        payload = {"corpus": {"type": "MAIN"}}
+
+        results = await asyncio.gather(
+            *[client.execute_concordance(payload) for _ in range(5)])
+
+        assert all(r == CONCORDANCE_SUCCESS for r in results)
+        assert len(calls) == 1
+        await client.aclose()
@@ -0,0 +1,245 @@
+"""Unit tests for SnapshotStore and snapshot-backed RNCClient requests."""
+
+import asyncio
+import json
+import threading
+import httpx
+import pytest
+from rnc_mcp.clients import snapshot
+from rnc_mcp.clients.rnc_client import RNCClient
+from rnc_mcp.clients.snapshot import SnapshotStore, SNAPSHOT_VERSION
+from rnc_mcp.config import Config
+from tests.fixtures.mock_responses import (
+    CORPUS_CONFIG_MAIN,
+    ATTRIBUTES_GRAMMAR,
+)
+
+BASE_URL = "https://example.test/api/v1"
+
+
+def counting_transport(status=200):
+    """MockTransport serving config/attrs and counting requests."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if status != 200:
+            return httpx.Response(status)
+        if request.url.path.endswith("/config/"):
+            return httpx.Response(200, json=CORPUS_CONFIG_MAIN)
+        return httpx.Response(200, json=ATTRIBUTES_GRAMMAR)
+    return httpx.MockTransport(handler), calls
+
+
+@pytest.mark.unit
+class TestSnapshotStore:
+    """Tests for snapshot persistence."""
+
+    def test_roundtrip(self, tmp_path):
+        """Test that saved entries are loaded by a new store."""
+        store = SnapshotStore(tmp_path, BASE_URL)
+        store.put("config:MAIN", CORPUS_CONFIG_MAIN)
+        store.save()
+
+        loaded = SnapshotStore(tmp_path, BASE_URL)
+        loaded.load()
+
+        data, fetched_at = loaded.get("config:MAIN")
+        assert data == CORPUS_CONFIG_MAIN
+        assert fetched_at > 0
+
+    def test_missing_file_is_empty(self, tmp_path):
+        """Test that loading without a file leaves the store empty."""
+        store = SnapshotStore(tmp_path / "missing", BASE_URL)
+        store.load()
+
+        assert len(store) == 0
+
+    def test_version_mismatch_is_ignored(self, tmp_path):
+        """Test that snapshots from another layout version are ignored."""
+        (tmp_path / SnapshotStore.FILENAME).write_text(json.dumps({
+            "version": SNAPSHOT_VERSION + 1,
+            "base_url": BASE_URL,
+            "entries": {"config:MAIN": {"fetched_at": 1, "data": {}}}
+        }))
+        store = SnapshotStore(tmp_path, BASE_URL)
+        store.load()
+
+        assert store.get("config:MAIN") is None
+
+    def test_base_url_mismatch_is_ignored(self, tmp_path):
+        """Test that snapshots of another API endpoint are ignored."""
+        store = SnapshotStore(tmp_path, BASE_URL)
+        store.put("config:MAIN", CORPUS_CONFIG_MAIN)
+        store.save()
+
+        other = SnapshotStore(tmp_path, "http://127.0.0.1:9000/api/v1")
+        other.load()
+
+        assert len(other) == 0
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        """Test that an unreadable snapshot does not raise."""
+        (tmp_path / SnapshotStore.FILENAME).write_text("{not json")
+        store = SnapshotStore(tmp_path, BASE_URL)
+        store.load()
+
+        assert len(store) == 0
+
+    def test_save_leaves_no_temp_file(self, tmp_path):
+        """Test that the atomic write cleans up its temporary file."""
+        store = SnapshotStore(tmp_path, BASE_URL)
+        store.put("config:MAIN", {})
+        store.save()
+
+        assert [p.name for p in tmp_path.iterdir()] == [
+            SnapshotStore.FILENAME]
+        assert not store.dirty
+
+    def test_failed_write_stays_dirty(self, tmp_path, monkeypatch):
+        """Test that a failed write keeps the changes pending."""
+        store = SnapshotStore(tmp_path, BASE_URL)
+        store.put("config:MAIN", {})
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(snapshot.os, "replace", fail)
+        with pytest.raises(OSError):
+            store.save()
+
+        assert store.dirty
+        assert list(tmp_path.iterdir()) == []
+
+        monkeypatch.undo()
+        store.save()
+        assert not store.dirty
+
+    def test_changes_during_write_stay_dirty(self, tmp_path):
+        """Test that an update stored after dump() is not marked saved."""
+        store = SnapshotStore(tmp_path, BASE_URL)
+        store.put("config:MAIN", {})
+        dumped = store.dump()
+        store.put("config:PAPER", {})
+        store.write(*dumped)
+
+        assert store.dirty
+
+
+@pytest.mark.unit
+class TestClientSnapshot:
+    """Tests for RNCClient config/attrs requests backed by a snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_first_fetch_is_persisted(
+            self, tmp_path, mock_env_token, monkeypatch):
+        """Test that fetched configs are written to the snapshot."""
+        monkeypatch.setattr(Config, "RNC_BASE_URL", BASE_URL)
+        transport, calls = counting_transport()
+        client = RNCClient(
+            transport=transport, snapshot=SnapshotStore(tmp_path, BASE_URL))
+
+        async with client:
+            await client.get_corpus_config("MAIN")
+            await client.get_attributes("MAIN", "gr")
+
+        loaded = SnapshotStore(tmp_path, BASE_URL)
+        loaded.load()
+        assert loaded.get("config:MAIN")[0] == CORPUS_CONFIG_MAIN
+        assert loaded.get("attrs:MAIN:gr")[0] == ATTRIBUTES_GRAMMAR
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_restart_serves_from_snapshot(
+            self, tmp_path, mock_env_token, monkeypatch):
+        """Test that a restarted client needs no upstream calls."""
+        monkeypatch.setattr(Config, "RNC_BASE_URL", BASE_URL)
+        store = SnapshotStore(tmp_path, BASE_URL)
+        store.put("config:MAIN", CORPUS_CONFIG_MAIN)
+        store.save()
+
+        transport, calls = counting_transport()
+        async with RNCClient(
+            transport=transport, snapshot=SnapshotStore(tmp_path, BASE_URL)
+        ) as client:
+            result = await client.get_corpus_config("MAIN")
+
+        assert result == CORPUS_CONFIG_MAIN
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_lazy_load_runs_off_event_loop(
+            self, tmp_path, mock_env_token, monkeypatch):
+        """Test that a client used without open() loads in a thread."""
+        monkeypatch.setattr(Config, "RNC_BASE_URL", BASE_URL)
+        store = SnapshotStore(tmp_path, BASE_URL)
+        store.put("config:MAIN", CORPUS_CONFIG_MAIN)
+        store.save()
+
+        snapshot = SnapshotStore(tmp_path, BASE_URL)
+        threads = []
+        load = snapshot.load
+
+        def tracked_load():
+            threads.append(threading.current_thread())
+            load()
+
+        monkeypatch.setattr(snapshot, "load", tracked_load)
+        transport, calls = counting_transport()
+        client = RNCClient(transport=transport, snapshot=snapshot)
+
+        results = await asyncio.gather(
+            client.get_corpus_config("MAIN"),
+            client.get_corpus_config("MAIN"))
+        await client.aclose()
+
+        assert results == [CORPUS_CONFIG_MAIN] * 2
+        assert calls == []
+        assert len(threads) == 1
+        assert threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_refreshed_in_background(
+            self, tmp_path, mock_env_token, monkeypatch):
+        """Test that old entries are served and refreshed in background."""
+        monkeypatch.setattr(Config, "RNC_BASE_URL", BASE_URL)
+        monkeypatch.setattr(Config, "RNC_SNAPSHOT_REFRESH_INTERVAL", 0.0)
+        store = SnapshotStore(tmp_path, BASE_URL)
+        store.put("config:MAIN", {"sortings": []})
+        store.save()
+
+        transport, calls = counting_transport()
+        async with RNCClient(
+            transport=transport, snapshot=SnapshotStore(tmp_path, BASE_URL)
+        ) as client:
+            first = await client.get_corpus_config("MAIN")
+            while client._refreshes:
+                await asyncio.sleep(0)
+            second = await client.get_corpus_config("MAIN")
+
+        assert first == {"sortings": []}
+        assert second == CORPUS_CONFIG_MAIN
+        assert len(calls) >= 1
+
+    @pytest.mark.asyncio
+    async def test_snapshot_served_when_api_unreachable(
+            self, tmp_path, mock_env_token, monkeypatch, caplog):
+        """Test that failed refreshes keep serving the snapshot."""
+        monkeypatch.setattr(Config, "RNC_BASE_URL", BASE_URL)
+        monkeypatch.setattr(Config, "RNC_SNAPSHOT_REFRESH_INTERVAL", 0.0)
+        store = SnapshotStore(tmp_path, BASE_URL)
+        store.put("attrs:MAIN:gr", ATTRIBUTES_GRAMMAR)
+        store.save()
+
+        transport, _ = counting_transport(status=503)
+        async with RNCClient(
+            transport=transport, snapshot=SnapshotStore(tmp_path, BASE_URL)
+        ) as client:
+            first = await client.get_attributes("MAIN", "gr")
+            while client._refreshes:
+                await asyncio.sleep(0)
+            second = await client.get_attributes("MAIN", "gr")
+
+        assert first == second == ATTRIBUTES_GRAMMAR
+        assert "Failed to refresh RNC snapshot entry attrs:MAIN:gr" in (
+            caplog.text)
@@ -0,0 +1,243 @@
+"""Unit tests for background concordance jobs."""
+
+import asyncio
+import pytest
+from rnc_mcp.jobs.manager import JobManager
+from rnc_mcp.jobs.store import JobStore
+from rnc_mcp.schemas.schemas import ConcordanceJobRequest, TokenRequest
+from rnc_mcp.services.rnc_search import RNCSearchService
+from tests.fixtures.paged_backend import paged_backend
+
+
+def make_request(**kwargs):
+    return ConcordanceJobRequest(
+        tokens=[TokenRequest(lemma="дом")], per_page=2, **kwargs)
+
+
+async def wait_for(manager, job_id, statuses=("completed", "failed")):
+    for _ in range(500):
+        status = await manager.status(job_id)
+        if status.status in statuses:
+            return status
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish: {status}")
+
+
+@pytest.fixture
+def make_manager(mock_rnc_client, tmp_path):
+    managers = []
+
+    def factory(**kwargs):
+        manager = JobManager(
+            RNCSearchService(mock_rnc_client, max_pages=20),
+            JobStore(tmp_path / "jobs.sqlite3"),
+            **kwargs
+        )
+        managers.append(manager)
+        return manager
+
+    yield factory
+    for manager in managers:
+        manager.store.close()
+
+
+@pytest.mark.unit
+class TestJobManager:
+    """Tests for running, persisting and resuming jobs."""
+
+    @pytest.mark.asyncio
+    async def test_job_collects_all_pages(
+            self, mock_rnc_client, make_manager):
+        """Test that a job collects every page of the result set."""
+        execute, requested = paged_backend(total_pages=7)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        manager = make_manager(page_concurrency=3)
+        await manager.start()
+
+        submitted = await manager.submit(make_request())
+        assert submitted.status == "queued"
+        status = await wait_for(manager, submitted.job_id)
+        await manager.stop()
+
+        assert status.status == "completed"
+        assert status.pages_done == 7
+        assert status.total_pages == 7
+        assert status.documents == 14
+        assert sorted(requested) == list(range(7))
+        # Job pages bypass the shared concordance cache
+        assert all(
+            call.kwargs["cache"] is False
+            for call in mock_rnc_client.execute_concordance.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_page_range_and_cap(self, mock_rnc_client, make_manager):
+        """Test that end_page and max_pages bound the collected pages."""
+        execute, requested = paged_backend(total_pages=100)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        manager = make_manager(max_pages=4)
+        await manager.start()
+
+        ranged = await manager.submit(make_request(page=2, end_page=3))
+        capped = await manager.submit(make_request(page=10))
+        ranged = await wait_for(manager, ranged.job_id)
+        capped = await wait_for(manager, capped.job_id)
+        await manager.stop()
+
+        assert ranged.pages_done == 2
+        assert ranged.total_pages == 2
+        assert capped.pages_done == 4
+        assert sorted(requested) == [2, 3, 10, 11, 12, 13]
+
+    @pytest.mark.asyncio
+    async def test_stats_only_rejected(self, make_manager):
+        """Test that a job without examples is refused."""
+        manager = make_manager()
+
+        with pytest.raises(ValueError):
+            await manager.submit(make_request(return_examples=False))
+
+    @pytest.mark.asyncio
+    async def test_failure_marks_job_failed(
+            self, mock_rnc_client, make_manager):
+        """Test that an upstream error fails the job, keeping progress."""
+        execute, _ = paged_backend(total_pages=5, failing={2})
+        mock_rnc_client.execute_concordance.side_effect = execute
+        manager = make_manager(page_concurrency=1, page_retries=0)
+        await manager.start()
+
+        submitted = await manager.submit(make_request())
+        status = await wait_for(manager, submitted.job_id)
+        await manager.stop()
+
+        assert status.status == "failed"
+        assert "503" in status.error
+        assert status.pages_done == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_page_is_retried(
+            self, mock_rnc_client, make_manager):
+        """Test that a transient page failure does not fail the job."""
+        execute, requested = paged_backend(
+            total_pages=5, failing={2}, fail_times=2)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        manager = make_manager(
+            page_concurrency=2, page_retries=2, retry_delay=0)
+        await manager.start()
+
+        submitted = await manager.submit(make_request())
+        status = await wait_for(manager, submitted.job_id)
+        await manager.stop()
+
+        assert status.status == "completed"
+        assert status.pages_done == 5
+        assert status.documents == 10
+        assert requested.count(2) == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_job_resumes(self, mock_rnc_client, make_manager):
+        """Test that a failed job continues from its first missing page."""
+        failing = {3}
+        execute, requested = paged_backend(total_pages=5, failing=failing)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        manager = make_manager(page_concurrency=3, page_retries=0)
+        await manager.start()
+
+        submitted = await manager.submit(make_request())
+        failed = await wait_for(manager, submitted.job_id)
+        # Pages fetched before the failed one are kept
+        assert failed.status == "failed"
+        assert failed.pages_done == 3
+
+        failing.clear()
+        requested.clear()
+        resumed = await manager.resume(submitted.job_id)
+        assert resumed.status == "queued"
+        assert resumed.error is None
+        status = await wait_for(manager, submitted.job_id)
+        await manager.stop()
+
+        assert status.status == "completed"
+        assert status.pages_done == 5
+        assert status.documents == 10
+        assert sorted(requested) == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_only_failed_jobs_resume(
+            self, mock_rnc_client, make_manager):
+        """Test that resuming an unfailed job is refused."""
+        execute, _ = paged_backend(total_pages=1)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        manager = make_manager()
+        await manager.start()
+
+        submitted = await manager.submit(make_request())
+        await wait_for(manager, submitted.job_id)
+
+        with pytest.raises(ValueError):
+            await manager.resume(submitted.job_id)
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_job_resumes_after_restart(
+            self, mock_rnc_client, make_manager):
+        """Test that an interrupted job continues after its stored pages."""
+        gate = asyncio.Event()
+        execute, requested = paged_backend(total_pages=4, gate=gate)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        manager = make_manager(page_concurrency=2)
+        await manager.start()
+
+        submitted = await manager.submit(make_request())
+        for _ in range(500):
+            if (await manager.status(submitted.job_id)).pages_done == 1:
+                break
+            await asyncio.sleep(0.01)
+        await manager.stop()
+
+        interrupted = await manager.status(submitted.job_id)
+        assert interrupted.status == "running"
+        assert interrupted.pages_done == 1
+
+        gate.set()
+        requested.clear()
+        restarted = make_manager(page_concurrency=2)
+        await restarted.start()
+        status = await wait_for(restarted, submitted.job_id)
+        await restarted.stop()
+
+        assert status.status == "completed"
+        assert status.pages_done == 4
+        assert status.documents == 8
+        assert sorted(requested) == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_results_are_paged(self, mock_rnc_client, make_manager):
+        """Test that results are read in batches with next_offset."""
+        execute, _ = paged_backend(total_pages=3)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        manager = make_manager()
+        await manager.start()
+
+        submitted = await manager.submit(make_request())
+        await wait_for(manager, submitted.job_id)
+
+        first = await manager.results(submitted.job_id, 0, 4)
+        last = await manager.results(submitted.job_id, first.next_offset, 4)
+        await manager.stop()
+
+        assert first.next_offset == 4
+        assert first.results[0].metadata.title.startswith("Page 0")
+        assert first.stats.total_pages_available == 3
+        assert len(last.results) == 2
+        assert last.results[-1].metadata.title.startswith("Page 2")
+        assert last.next_offset is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_job(self, make_manager):
+        """Test that an unknown job id raises KeyError."""
+        manager = make_manager()
+
+        with pytest.raises(KeyError):
+            await manager.status("missing")
+        with pytest.raises(KeyError):
+            await manager.results("missing")
@@ -0,0 +1,109 @@
+"""Unit tests for the SQLite job store."""
+
+import pytest
+from rnc_mcp.jobs.store import COMPLETED, FAILED, QUEUED, RUNNING, JobStore
+
+
+def make_docs(count, page):
+    return [
+        {"metadata": {"title": f"Page {page} doc {i}"},
+         "examples": ["a", "b"]}
+        for i in range(count)
+    ]
+
+
+@pytest.mark.unit
+class TestJobStore:
+    """Tests for job persistence."""
+
+    def test_file_created_with_first_job(self, tmp_path):
+        """Test that the database file is only created when needed."""
+        path = tmp_path / "jobs" / "jobs.sqlite3"
+        store = JobStore(path)
+        assert not store.exists()
+
+        assert store.get("missing") is None
+        assert store.unfinished() == []
+        assert store.documents("missing", 0, 10) == []
+        assert not store.exists()
+
+        store.create("job1", "{}", 0, 9)
+
+        assert store.exists()
+        store.close()
+
+    def test_create_and_get(self, tmp_path):
+        """Test that a new job is queued at its first page."""
+        store = JobStore(tmp_path / "jobs.sqlite3")
+
+        job = store.create("job1", '{"q": 1}', 3, 9)
+
+        assert job["status"] == QUEUED
+        assert job["next_page"] == 3
+        assert job["end_page"] == 9
+        assert job["total_pages"] is None
+        assert store.get("job1") == job
+        assert store.get("missing") is None
+        store.close()
+
+    def test_save_pages_advances_job(self, tmp_path):
+        """Test that saving pages stores documents and counters."""
+        store = JobStore(tmp_path / "jobs.sqlite3")
+        store.create("job1", "{}", 0, 9)
+
+        store.save_pages("job1", [(0, make_docs(2, 0))], 5, {"total": 1})
+        store.save_pages(
+            "job1", [(1, make_docs(3, 1)), (2, make_docs(1, 2))], 5,
+            {"total": 2})
+
+        job = store.get("job1")
+        assert job["next_page"] == 3
+        assert job["pages_done"] == 3
+        assert job["total_pages"] == 5
+        assert job["documents"] == 6
+        assert job["examples"] == 12
+        # Stats are kept from the first page
+        assert job["stats"] == {"total": 1}
+        store.close()
+
+    def test_failed_save_is_rolled_back(self, tmp_path):
+        """Test that a page is stored completely or not at all."""
+        store = JobStore(tmp_path / "jobs.sqlite3")
+        store.create("job1", "{}", 0, 9)
+
+        with pytest.raises(TypeError):
+            store.save_pages("job1", [(0, [{"bad": object()}])], 5)
+
+        job = store.get("job1")
+        assert job["next_page"] == 0
+        assert job["documents"] == 0
+        assert store.documents("job1", 0, 10) == []
+        store.close()
+
+    def test_documents_are_paged_in_order(self, tmp_path):
+        """Test that documents are read back in insertion order."""
+        store = JobStore(tmp_path / "jobs.sqlite3")
+        store.create("job1", "{}", 0, 9)
+        store.save_pages("job1", [(0, make_docs(3, 0))], 2)
+        store.save_pages("job1", [(1, make_docs(3, 1))], 2)
+
+        docs = store.documents("job1", 2, 3)
+
+        assert [d["metadata"]["title"] for d in docs] == [
+            "Page 0 doc 2", "Page 1 doc 0", "Page 1 doc 1"
+        ]
+        store.close()
+
+    def test_unfinished_survives_reopen(self, tmp_path):
+        """Test that queued and running jobs are found after a restart."""
+        path = tmp_path / "jobs.sqlite3"
+        store = JobStore(path)
+        for job_id, status in [("a", QUEUED), ("b", RUNNING),
+                               ("c", COMPLETED), ("d", FAILED)]:
+            store.create(job_id, "{}", 0, 9)
+            store.set_status(job_id, status)
+        store.close()
+
+        reopened = JobStore(path)
+        assert reopened.unfinished() == ["a", "b"]
+        reopened.close()
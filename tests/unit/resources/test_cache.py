@@ -0,0 +1,215 @@
+"""Unit tests for ResourceCache."""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from rnc_mcp.resources.cache import ResourceCache
+from rnc_mcp.resources.rnc_generator import RNCResourceGenerator
+from tests.fixtures.mock_responses import (
+    CORPUS_CONFIG_MAIN,
+    ATTRIBUTES_GRAMMAR,
+)
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(
+        "rnc_mcp.resources.cache.time", SimpleNamespace(monotonic=fake))
+    return fake
+
+
+def counting_loader(values=None):
+    """Loader returning 'v1', 'v2', ... and counting its calls."""
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        if values is not None:
+            return values[len(calls) - 1]
+        return f"v{len(calls)}", True
+    return loader, calls
+
+
+@pytest.mark.unit
+class TestResourceCache:
+    """Tests for TTL and stale-while-revalidate behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_served_from_memory(self, clock):
+        """Test that a fresh entry does not call the loader again."""
+        cache = ResourceCache(ttl=60)
+        loader, calls = counting_loader()
+
+        assert await cache.get("MAIN", loader) == "v1"
+        clock.now += 30
+        assert await cache.get("MAIN", loader) == "v1"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing(self, clock):
+        """Test that a stale entry is returned and refreshed in background."""
+        cache = ResourceCache(ttl=60, stale_ttl=600)
+        loader, calls = counting_loader()
+        await cache.get("MAIN", loader)
+
+        clock.now += 120
+        assert await cache.get("MAIN", loader) == "v1"
+        await asyncio.sleep(0)
+
+        assert len(calls) == 2
+        assert await cache.get("MAIN", loader) == "v2"
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_reloaded_synchronously(self, clock):
+        """Test that entries past the stale window are reloaded inline."""
+        cache = ResourceCache(ttl=60, stale_ttl=60)
+        loader, calls = counting_loader()
+        await cache.get("MAIN", loader)
+
+        clock.now += 500
+        assert await cache.get("MAIN", loader) == "v2"
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_entry(self, clock):
+        """Test that a failing background refresh keeps the old value."""
+        cache = ResourceCache(ttl=60, stale_ttl=600)
+        loader, _ = counting_loader()
+        await cache.get("MAIN", loader)
+
+        async def failing():
+            raise Exception("API Error")
+
+        clock.now += 120
+        assert await cache.get("MAIN", failing) == "v1"
+        await asyncio.sleep(0)
+        assert await cache.get("MAIN", failing) == "v1"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self, clock):
+        """Test that concurrent readers of a missing key load it once."""
+        cache = ResourceCache(ttl=60)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value", True
+
+        results = await asyncio.gather(
+            *[cache.get("MAIN", loader) for _ in range(10)])
+
+        assert results == ["value"] * 10
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_incomplete_value_is_stored_stale(self, clock):
+        """Test that incomplete values are refreshed on the next read."""
+        cache = ResourceCache(ttl=60, stale_ttl=600)
+        loader, calls = counting_loader(
+            values=[("partial", False), ("full", True)])
+
+        assert await cache.get("MAIN", loader) == "partial"
+        assert await cache.get("MAIN", loader) == "partial"
+        await asyncio.sleep(0)
+
+        assert await cache.get("MAIN", loader) == "full"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_single_key(self, clock):
+        """Test that invalidate(key) drops only that entry."""
+        cache = ResourceCache(ttl=60)
+        loader, _ = counting_loader()
+        await cache.get("MAIN", loader)
+        await cache.get("PAPER", loader)
+
+        cache.invalidate("MAIN")
+
+        assert "MAIN" not in cache
+        assert "PAPER" in cache
+
+    @pytest.mark.asyncio
+    async def test_invalidate_all(self, clock):
+        """Test that invalidate() drops every entry."""
+        cache = ResourceCache(ttl=60)
+        loader, _ = counting_loader()
+        await cache.get("MAIN", loader)
+
+        cache.invalidate()
+
+        assert "MAIN" not in cache
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_loads(self, clock):
+        """Test that a non-positive TTL disables caching."""
+        cache = ResourceCache(ttl=0)
+        loader, calls = counting_loader()
+
+        await cache.get("MAIN", loader)
+        await cache.get("MAIN", loader)
+
+        assert len(calls) == 2
+        assert "MAIN" not in cache
+
+
+@pytest.mark.unit
+class TestCachedGenerator:
+    """Tests for RNCResourceGenerator with a cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_hit_cache(
+            self, mock_rnc_client, mock_env_token):
+        """Test that a second read does not call the client again."""
+        mock_rnc_client.get_corpus_config.return_value = CORPUS_CONFIG_MAIN
+        mock_rnc_client.get_attributes.return_value = ATTRIBUTES_GRAMMAR
+        generator = RNCResourceGenerator(
+            mock_rnc_client, cache=ResourceCache(ttl=60))
+
+        first = await generator.generate("MAIN")
+        second = await generator.generate("MAIN")
+
+        assert first == second
+        assert mock_rnc_client.get_corpus_config.await_count == 1
+        assert mock_rnc_client.get_attributes.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(
+            self, mock_rnc_client, mock_env_token):
+        """Test that a failed config fetch is retried on the next read."""
+        mock_rnc_client.get_corpus_config.side_effect = [
+            Exception("Network error"), CORPUS_CONFIG_MAIN]
+        mock_rnc_client.get_attributes.return_value = ATTRIBUTES_GRAMMAR
+        generator = RNCResourceGenerator(
+            mock_rnc_client, cache=ResourceCache(ttl=60))
+
+        first = await generator.generate("MAIN")
+        second = await generator.generate("MAIN")
+
+        assert "Error loading resource" in first
+        assert "# Configuration for MAIN" in second
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_reload(
+            self, mock_rnc_client, mock_env_token):
+        """Test that invalidate() makes the next read refetch."""
+        mock_rnc_client.get_corpus_config.return_value = CORPUS_CONFIG_MAIN
+        mock_rnc_client.get_attributes.return_value = ATTRIBUTES_GRAMMAR
+        generator = RNCResourceGenerator(
+            mock_rnc_client, cache=ResourceCache(ttl=60))
+
+        await generator.generate("MAIN")
+        generator.invalidate("MAIN")
+        await generator.generate("MAIN")
+
+        assert mock_rnc_client.get_corpus_config.await_count == 2
@@ -1,5 +1,6 @@
 """Unit tests for CorpusResourceGenerator."""
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock
 from rnc_mcp.resources.rnc_generator import RNCResourceGenerator
@@ -200,3 +201,145 @@ class TestErrorHandling:
         # Should not raise
         result = await generator.generate("MAIN")
         assert isinstance(result, str)
+
+
+@pytest.mark.unit
+class TestConcurrentFetching:
+    """Tests for concurrent config and attribute fetching."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_run_concurrently(
+            self, mock_rnc_client, mock_env_token):
+        """Test that config and attribute requests overlap in time."""
+        in_flight = 0
+        peak = 0
+
+        async def slow(*args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return CORPUS_CONFIG_MAIN if len(args) == 1 else ATTRIBUTES_GRAMMAR
+
+        mock_rnc_client.get_corpus_config.side_effect = slow
+        mock_rnc_client.get_attributes.side_effect = slow
+
+        generator = RNCResourceGenerator(mock_rnc_client)
+        await generator.generate("MAIN")
+
+        assert peak == 5
+
+    @pytest.mark.asyncio
+    async def test_single_attribute_failure_is_isolated(
+            self, mock_rnc_client, mock_env_token):
+        """Test that one failed attribute fetch does not affect others."""
+        async def attributes(corpus, attr_type):
+            if attr_type == "sem":
+                raise Exception("API Error")
+            return ATTRIBUTES_GRAMMAR
+
+        mock_rnc_client.get_corpus_config.return_value = CORPUS_CONFIG_MAIN
+        mock_rnc_client.get_attributes.side_effect = attributes
+
+        generator = RNCResourceGenerator(mock_rnc_client)
+        result = await generator.generate("MAIN")
+
+        assert "_No sem tags available._" in result
+        assert "## Semantic Tags" not in result
+        assert "## Grammar Tags" in result
+        assert "## Syntax Tags" in result
+        assert "## Additional Flags" in result
+
+    @pytest.mark.asyncio
+    async def test_sections_keep_declared_order(
+            self, mock_rnc_client, mock_env_token):
+        """Test that sections are rendered in ATTR_TYPES order."""
+        mock_rnc_client.get_corpus_config.return_value = CORPUS_CONFIG_MAIN
+        mock_rnc_client.get_attributes.return_value = ATTRIBUTES_EMPTY
+
+        generator = RNCResourceGenerator(mock_rnc_client)
+        result = await generator.generate("MAIN")
+
+        positions = [
+            result.index(title)
+            for _, title in RNCResourceGenerator.ATTR_TYPES
+        ]
+        assert positions == sorted(positions)
+
+
+@pytest.mark.unit
+class TestPrewarm:
+    """Tests for startup prewarm of corpus resources."""
+
+    @pytest.mark.asyncio
+    async def test_prewarm_populates_cache(
+            self, mock_rnc_client, mock_env_token):
+        """Test that prewarm loads every corpus into the cache."""
+        from rnc_mcp.resources.cache import ResourceCache
+        mock_rnc_client.get_corpus_config.return_value = CORPUS_CONFIG_MAIN
+        mock_rnc_client.get_attributes.return_value = ATTRIBUTES_GRAMMAR
+        cache = ResourceCache(ttl=60)
+        generator = RNCResourceGenerator(mock_rnc_client, cache=cache)
+
+        status = await generator.prewarm(["MAIN", "PAPER"], concurrency=2)
+
+        assert status == {"MAIN": True, "PAPER": True}
+        assert "MAIN" in cache and "PAPER" in cache
+        await generator.generate("MAIN")
+        assert mock_rnc_client.get_corpus_config.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_prewarm_respects_concurrency_limit(
+            self, mock_rnc_client, mock_env_token):
+        """Test that at most `concurrency` corpora are rendered at once."""
+        from rnc_mcp.resources.cache import ResourceCache
+        in_flight = 0
+        peak = 0
+
+        async def config(corpus):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return CORPUS_CONFIG_MAIN
+
+        mock_rnc_client.get_corpus_config.side_effect = config
+        mock_rnc_client.get_attributes.return_value = ATTRIBUTES_EMPTY
+        generator = RNCResourceGenerator(
+            mock_rnc_client, cache=ResourceCache(ttl=60))
+
+        await generator.prewarm([f"C{i}" for i in range(8)], concurrency=3)
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_prewarm_reports_failures(
+            self, mock_rnc_client, mock_env_token):
+        """Test that failed corpora are reported and not cached."""
+        from rnc_mcp.resources.cache import ResourceCache
+
+        async def config(corpus):
+            if corpus == "PAPER":
+                raise Exception("Network error")
+            return CORPUS_CONFIG_MAIN
+
+        mock_rnc_client.get_corpus_config.side_effect = config
+        mock_rnc_client.get_attributes.return_value = ATTRIBUTES_GRAMMAR
+        cache = ResourceCache(ttl=60)
+        generator = RNCResourceGenerator(mock_rnc_client, cache=cache)
+
+        status = await generator.prewarm(["MAIN", "PAPER"], concurrency=2)
+
+        assert status == {"MAIN": True, "PAPER": False}
+        assert "PAPER" not in cache
+
+    @pytest.mark.asyncio
+    async def test_prewarm_without_cache_is_noop(
+            self, mock_rnc_client, mock_env_token):
+        """Test that prewarm does nothing when no cache is configured."""
+        generator = RNCResourceGenerator(mock_rnc_client)
+
+        assert await generator.prewarm(["MAIN"], concurrency=1) == {}
+        mock_rnc_client.get_corpus_config.assert_not_awaited()
@@ -464,3 +464,67 @@ class TestFullPayloadBuilding:
         # Check subcorpus conditions
         subcorpus_conds = payload["subcorpus"]["sectionValues"][0]["conditionValues"]
         assert len(subcorpus_conds) >= 2
+
+
+@pytest.mark.unit
+class TestDateShardedPayloads:
+    """Tests for build_date_sharded_payloads method."""
+
+    def test_one_payload_per_span(self):
+        """Test that every span gets its own date condition."""
+        query = SearchQuery(tokens=[TokenRequest(lemma="дом")])
+
+        payloads = RNCQueryBuilder.build_date_sharded_payloads(
+            query, [(1900, 1909), (1910, 1919)])
+
+        assert len(payloads) == 2
+        for payload, (start, end) in zip(
+                payloads, [(1900, 1909), (1910, 1919)]):
+            conditions = payload["subcorpus"]["sectionValues"][0][
+                "conditionValues"]
+            assert conditions == [
+                RNCQueryBuilder._build_date_range_condition(
+                    DateFilter(start_year=start, end_year=end))
+            ]
+
+    def test_payloads_are_stats_only(self):
+        """Test that shards request no examples."""
+        query = SearchQuery(
+            tokens=[TokenRequest(lemma="дом")], page=3, per_page=50)
+
+        payload, = RNCQueryBuilder.build_date_sharded_payloads(
+            query, [(1900, 1909)])
+
+        page_params = payload["params"]["pageParams"]
+        assert page_params["page"] == 0
+        assert page_params["docsPerPage"] == 1
+
+    def test_other_filters_kept_and_date_replaced(self):
+        """Test that non-date filters apply to every shard."""
+        query = SearchQuery(
+            tokens=[TokenRequest(lemma="дом")],
+            subcorpus=SubcorpusFilter(
+                author="Пушкин",
+                date_range=DateFilter(start_year=1800, end_year=1837)
+            )
+        )
+
+        payload, = RNCQueryBuilder.build_date_sharded_payloads(
+            query, [(1820, 1829)])
+
+        conditions = payload["subcorpus"]["sectionValues"][0][
+            "conditionValues"]
+        assert {"fieldName": "author", "text": {"v": "Пушкин"}} in conditions
+        dates = [c for c in conditions if c["fieldName"] == "created"]
+        assert len(dates) == 1
+        assert dates[0]["dateRange"]["begin"]["year"] == 1820
+
+    def test_shards_share_query_part(self):
+        """Test that shards differ only in their subcorpus."""
+        query = SearchQuery(tokens=[TokenRequest(lemma="дом")])
+
+        first, second = RNCQueryBuilder.build_date_sharded_payloads(
+            query, [(1900, 1909), (1910, 1919)])
+
+        assert first["lexGramm"] == second["lexGramm"]
+        assert first["subcorpus"] != second["subcorpus"]
@@ -0,0 +1,180 @@
+"""Unit tests for streaming concordance exports."""
+
+import asyncio
+import csv
+import importlib.util
+import json
+import pytest
+from rnc_mcp.exceptions import RNCAPIError
+from rnc_mcp.schemas.schemas import ExportRequest, TokenRequest
+from rnc_mcp.services import rnc_exporter
+from rnc_mcp.services.rnc_exporter import RNCExporter
+from rnc_mcp.services.rnc_search import RNCSearchService
+from tests.fixtures.paged_backend import paged_backend
+
+
+def make_request(**kwargs):
+    return ExportRequest(
+        tokens=[TokenRequest(lemma="дом")], per_page=2, **kwargs)
+
+
+@pytest.fixture
+def make_exporter(mock_rnc_client, tmp_path):
+    def factory(**kwargs):
+        return RNCExporter(
+            RNCSearchService(mock_rnc_client, max_pages=20),
+            tmp_path / "exports",
+            **kwargs
+        )
+    return factory
+
+
+@pytest.mark.unit
+class TestExport:
+    """Tests for writing concordance pages to files."""
+
+    @pytest.mark.asyncio
+    async def test_ndjson_export(self, mock_rnc_client, make_exporter):
+        """Test that every example of every page becomes one line."""
+        execute, requested = paged_backend(total_pages=5)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        exporter = make_exporter(page_concurrency=2)
+
+        response = await exporter.export(make_request(filename="dom"))
+
+        assert response.path.endswith("dom.ndjson")
+        assert sorted(requested) == [0, 1, 2, 3, 4]
+        assert response.pages_exported == 5
+        assert response.documents == 10
+        assert response.rows == 30
+        assert response.stats.total_pages_available == 5
+
+        with open(response.path, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+        assert len(rows) == 30
+        assert response.bytes > 0
+        assert set(rows[0]) == set(rnc_exporter.COLUMNS)
+        assert rows[0]["page"] == 0
+        assert rows[-1]["page"] == 4
+        assert rows[-1]["title"].startswith("Page 4")
+        # Export pages bypass the shared concordance cache
+        assert all(
+            call.kwargs["cache"] is False
+            for call in mock_rnc_client.execute_concordance.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_csv_export(self, mock_rnc_client, make_exporter):
+        """Test that CSV exports have a header and one row per example."""
+        execute, _ = paged_backend(total_pages=2)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        exporter = make_exporter()
+
+        response = await exporter.export(
+            make_request(format="csv", filename="dom.csv"))
+
+        assert response.path.endswith("dom.csv")
+        with open(response.path, encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == response.rows == 12
+        assert rows[0]["page"] == "0"
+        assert rows[0]["example"]
+
+    @pytest.mark.asyncio
+    async def test_page_range_and_cap(self, mock_rnc_client, make_exporter):
+        """Test that end_page and max_pages bound the exported pages."""
+        execute, requested = paged_backend(total_pages=100)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        exporter = make_exporter(max_pages=3)
+
+        ranged = await exporter.export(make_request(page=5, end_page=6))
+        capped = await exporter.export(make_request(page=10))
+
+        assert ranged.pages_exported == 2
+        assert capped.pages_exported == 3
+        assert sorted(requested) == [5, 6, 10, 11, 12]
+
+    @pytest.mark.asyncio
+    async def test_pages_are_written_in_batches(
+            self, mock_rnc_client, make_exporter, monkeypatch):
+        """Test that no more than page_concurrency pages are held."""
+        execute, requested = paged_backend(total_pages=7)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        exporter = make_exporter(page_concurrency=3)
+        written = []
+        original = rnc_exporter.NdjsonWriter.write
+
+        def write(self, rows):
+            written.append((len(requested), {row["page"] for row in rows}))
+            original(self, rows)
+
+        monkeypatch.setattr(rnc_exporter.NdjsonWriter, "write", write)
+
+        await exporter.export(make_request())
+
+        assert written == [
+            (1, {0}), (4, {1, 2, 3}), (7, {4, 5, 6})
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failure_removes_partial_file(
+            self, mock_rnc_client, make_exporter, tmp_path):
+        """Test that a failed export leaves no file behind."""
+        execute, _ = paged_backend(total_pages=5, failing={3})
+        mock_rnc_client.execute_concordance.side_effect = execute
+        exporter = make_exporter(page_concurrency=1)
+
+        with pytest.raises(RNCAPIError):
+            await exporter.export(make_request(filename="dom"))
+
+        assert list((tmp_path / "exports").iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_pending_pages(
+            self, mock_rnc_client, make_exporter):
+        """Test that a failed page stops the other pages of its batch."""
+        execute, _ = paged_backend(total_pages=5)
+        cancelled = []
+
+        async def side_effect(payload, **kwargs):
+            page = payload["params"]["pageParams"]["page"]
+            if page == 1:
+                raise RNCAPIError("RNC API Error 503: page 1")
+            if page > 1:
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(page)
+                    raise
+            return await execute(payload, **kwargs)
+
+        mock_rnc_client.execute_concordance.side_effect = side_effect
+        exporter = make_exporter(page_concurrency=3)
+
+        with pytest.raises(RNCAPIError):
+            await exporter.export(make_request())
+
+        assert sorted(cancelled) == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_invalid_requests(self, make_exporter):
+        """Test that unusable requests are rejected before any request."""
+        exporter = make_exporter()
+
+        with pytest.raises(ValueError):
+            await exporter.export(make_request(return_examples=False))
+        with pytest.raises(ValueError):
+            await exporter.export(make_request(filename="../escape"))
+        with pytest.raises(ValueError):
+            await exporter.export(make_request(page=3, end_page=1))
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(
+        importlib.util.find_spec("pyarrow") is not None,
+        reason="pyarrow is installed"
+    )
+    async def test_parquet_requires_pyarrow(self, make_exporter):
+        """Test that Parquet export without pyarrow fails clearly."""
+        exporter = make_exporter()
+
+        with pytest.raises(ValueError, match="pyarrow"):
+            await exporter.export(make_request(format="parquet"))
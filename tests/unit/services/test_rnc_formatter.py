@@ -2,7 +2,9 @@
 
 import pytest
 from rnc_mcp.services.rnc_formatter import RNCResponseFormatter
-from rnc_mcp.schemas.schemas import ConcordanceResponse, DocMetadata
+from rnc_mcp.schemas.schemas import (
+    ConcordanceResponse, DocMetadata, DocumentItem, GlobalStats, StatValues
+)
 from tests.fixtures.mock_responses import (
     CONCORDANCE_SUCCESS,
     CONCORDANCE_EMPTY,
@@ -324,6 +326,150 @@ class TestStatsParsing:
         assert response.stats.total_pages_available == 0
 
 
+@pytest.mark.unit
+class TestStatsOnlyFormatting:
+    """Tests for the format_stats_only fast path."""
+
+    def test_stats_match_full_formatting(self):
+        """Test that stats equal those of format_search_results."""
+        fast = RNCResponseFormatter.format_stats_only(
+            CONCORDANCE_MULTIPLE_DOCS)
+        full = RNCResponseFormatter.format_search_results(
+            CONCORDANCE_MULTIPLE_DOCS)
+
+        assert fast.stats == full.stats
+
+    def test_results_are_empty(self):
+        """Test that no documents are returned."""
+        response = RNCResponseFormatter.format_stats_only(
+            CONCORDANCE_SUCCESS)
+
+        assert response.results == []
+        assert response.stats.total_pages_available == 15
+
+    def test_groups_are_never_walked(self):
+        """Test that malformed groups do not affect the fast path."""
+        raw_response = dict(CONCORDANCE_SUCCESS, groups="not a list")
+
+        response = RNCResponseFormatter.format_stats_only(raw_response)
+
+        assert response.stats.queryStats.textCount == 150
+
+
+@pytest.mark.unit
+class TestIpm:
+    """Tests for ipm normalization."""
+
+    def test_relative_to_subcorpus(self):
+        """Test that ipm uses the subcorpus size when present."""
+        stats = GlobalStats(
+            corpusStats=StatValues(wordUsageCount=100_000_000),
+            subcorpStats=StatValues(wordUsageCount=2_000_000),
+            queryStats=StatValues(wordUsageCount=50),
+            total_pages_available=1
+        )
+
+        assert RNCResponseFormatter.ipm(stats) == 25.0
+
+    def test_falls_back_to_corpus(self):
+        """Test that ipm uses the corpus size without a subcorpus."""
+        stats = GlobalStats(
+            corpusStats=StatValues(wordUsageCount=4_000_000),
+            queryStats=StatValues(wordUsageCount=10),
+            total_pages_available=1
+        )
+
+        assert RNCResponseFormatter.ipm(stats) == 2.5
+
+    def test_no_matches_is_zero(self):
+        """Test that a query without matches has ipm 0."""
+        stats = GlobalStats(
+            subcorpStats=StatValues(wordUsageCount=1000),
+            total_pages_available=0
+        )
+
+        assert RNCResponseFormatter.ipm(stats) == 0.0
+
+    def test_unknown_size_is_none(self):
+        """Test that ipm is undefined without a reference size."""
+        stats = GlobalStats(
+            subcorpStats=StatValues(wordUsageCount=0),
+            queryStats=StatValues(wordUsageCount=5),
+            total_pages_available=1
+        )
+
+        assert RNCResponseFormatter.ipm(stats) is None
+
+
+def make_page(total_pages, *docs):
+    """ConcordanceResponse with (title, examples) documents."""
+    return ConcordanceResponse(
+        stats=GlobalStats(total_pages_available=total_pages),
+        results=[
+            DocumentItem(metadata=DocMetadata(title=title), examples=examples)
+            for title, examples in docs
+        ]
+    )
+
+
+@pytest.mark.unit
+class TestMergeResults:
+    """Tests for merging formatted result pages."""
+
+    def test_documents_concatenated_in_page_order(self):
+        """Test that distinct documents keep their page order."""
+        merged = RNCResponseFormatter.merge_results([
+            make_page(3, ("A", ["a1"])),
+            make_page(3, ("B", ["b1"]), ("C", ["c1"]))
+        ])
+
+        assert [d.metadata.title for d in merged.results] == ["A", "B", "C"]
+
+    def test_same_metadata_is_not_merged(self):
+        """Test that documents sharing title/author/year stay separate."""
+        merged = RNCResponseFormatter.merge_results([
+            make_page(2, ("Unknown Title", ["a"]), ("Unknown Title", ["b"])),
+            make_page(2, ("Unknown Title", ["c"]), ("Unknown Title", ["a"]))
+        ])
+
+        assert [d.examples for d in merged.results] == [
+            ["a"], ["b"], ["c"], ["a"]
+        ]
+
+    def test_exact_repeats_within_a_page_dropped(self):
+        """Test that only identical documents on one page are dropped."""
+        merged = RNCResponseFormatter.merge_results([
+            make_page(2, ("A", ["a1", "a1"]), ("A", ["a1", "a1"])),
+            make_page(2, ("A", ["a1", "a1"]))
+        ])
+
+        assert [d.examples for d in merged.results] == [
+            ["a1", "a1"], ["a1", "a1"]
+        ]
+
+    def test_stats_from_first_page(self):
+        """Test that the merged stats are those of the first page."""
+        merged = RNCResponseFormatter.merge_results([
+            make_page(7, ("A", ["a1"])),
+            make_page(0)
+        ])
+
+        assert merged.stats.total_pages_available == 7
+
+    def test_inputs_not_modified(self):
+        """Test that merging does not mutate the input pages."""
+        first = make_page(2, ("A", ["a1"]))
+        RNCResponseFormatter.merge_results(
+            [first, make_page(2, ("A", ["a2"]))])
+
+        assert first.results[0].examples == ["a1"]
+
+    def test_empty_input_raises(self):
+        """Test that merging nothing is an error."""
+        with pytest.raises(ValueError):
+            RNCResponseFormatter.merge_results([])
+
+
 @pytest.mark.unit
 class TestFullResponseFormatting:
     """Tests for format_search_results method."""
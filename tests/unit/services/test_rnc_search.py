@@ -0,0 +1,563 @@
+"""Unit tests for RNCSearchService multi-request searches."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+from rnc_mcp.exceptions import RNCAPIError
+from rnc_mcp.schemas.schemas import (
+    MultiPageQuery, SearchQuery, TokenRequest
+)
+from rnc_mcp.services.rnc_search import RNCSearchService
+from tests.fixtures.paged_backend import paged_backend
+from tests.fixtures.synthetic_responses import build_concordance_response
+
+
+def make_query(**kwargs):
+    return MultiPageQuery(
+        tokens=[TokenRequest(lemma="дом")], per_page=2, **kwargs)
+
+
+@pytest.mark.unit
+class TestPageRange:
+    """Tests for fetching an explicit page range."""
+
+    @pytest.mark.asyncio
+    async def test_range_is_fetched_and_merged(self, mock_rnc_client):
+        """Test that every page in the range is merged in order."""
+        execute, requested = paged_backend(total_pages=10)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+
+        response = await service.fetch_pages(make_query(page=2, end_page=4))
+
+        assert sorted(requested) == [2, 3, 4]
+        assert response.pages_fetched == [2, 3, 4]
+        assert response.failed_pages == []
+        assert len(response.results) == 6
+        assert response.results[0].metadata.title.startswith("Page 2")
+        assert response.stats.total_pages_available == 10
+
+    @pytest.mark.asyncio
+    async def test_range_is_capped(self, mock_rnc_client):
+        """Test that no more than max_pages pages are requested."""
+        execute, requested = paged_backend(total_pages=100)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=5)
+
+        response = await service.fetch_pages(make_query(end_page=50))
+
+        assert response.pages_fetched == [0, 1, 2, 3, 4]
+        assert len(requested) == 5
+
+    @pytest.mark.asyncio
+    async def test_single_page_by_default(self, mock_rnc_client):
+        """Test that without end_page only `page` is fetched."""
+        execute, requested = paged_backend(total_pages=10)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+
+        response = await service.fetch_pages(make_query(page=3))
+
+        assert requested == [3]
+        assert response.pages_fetched == [3]
+
+    @pytest.mark.asyncio
+    async def test_reversed_range_rejected(self, mock_rnc_client):
+        """Test that end_page before page is an error."""
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+
+        with pytest.raises(ValueError):
+            await service.fetch_pages(make_query(page=3, end_page=1))
+
+    @pytest.mark.asyncio
+    async def test_stats_only_fetches_one_page(self, mock_rnc_client):
+        """Test that return_examples=False makes a single request."""
+        execute, requested = paged_backend(total_pages=10)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+
+        response = await service.fetch_pages(
+            make_query(end_page=5, return_examples=False))
+
+        assert len(requested) == 1
+        assert response.results == []
+
+
+@pytest.mark.unit
+class TestTargetExamples:
+    """Tests for fetching until a target example count is reached."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_enough_pages(self, mock_rnc_client):
+        """Test that pages are added until the target is met."""
+        # 2 docs x 3 snippets = 6 examples per page
+        execute, requested = paged_backend(total_pages=50)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+
+        response = await service.fetch_pages(make_query(target_examples=20))
+
+        # First page, then the 3 estimated remaining pages at once
+        assert requested == [0, 1, 2, 3]
+        examples = sum(len(d.examples) for d in response.results)
+        assert examples == 20
+
+    @pytest.mark.asyncio
+    async def test_stops_when_results_run_out(self, mock_rnc_client):
+        """Test that pages beyond the last one are not requested."""
+        execute, requested = paged_backend(total_pages=2)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+
+        response = await service.fetch_pages(make_query(target_examples=100))
+
+        assert requested == [0, 1]
+        assert sum(len(d.examples) for d in response.results) == 12
+
+    @pytest.mark.asyncio
+    async def test_no_results(self, mock_rnc_client):
+        """Test that an empty search stops after the first page."""
+        execute, requested = paged_backend(total_pages=0)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+
+        response = await service.fetch_pages(make_query(target_examples=10))
+
+        assert requested == [0]
+        assert response.results == []
+
+    @pytest.mark.asyncio
+    async def test_respects_max_pages(self, mock_rnc_client):
+        """Test that the target does not exceed the page cap."""
+        execute, requested = paged_backend(total_pages=100, docs=1,
+                                           snippets=1)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=4)
+
+        await service.fetch_pages(make_query(target_examples=50))
+
+        assert sorted(requested) == [0, 1, 2, 3]
+
+
+@pytest.mark.unit
+class TestPartialFailures:
+    """Tests for reporting pages that could not be fetched."""
+
+    @pytest.mark.asyncio
+    async def test_failed_pages_reported(self, mock_rnc_client):
+        """Test that failing pages are listed and the rest returned."""
+        execute, _ = paged_backend(total_pages=10, failing={1})
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+        ctx = Mock()
+        ctx.warning = AsyncMock()
+
+        response = await service.fetch_pages(
+            make_query(end_page=2), ctx=ctx)
+
+        assert response.pages_fetched == [0, 2]
+        assert len(response.failed_pages) == 1
+        assert response.failed_pages[0].page == 1
+        assert "503" in response.failed_pages[0].error
+        ctx.warning.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_all_pages_failing_raises(self, mock_rnc_client):
+        """Test that the error is raised when nothing was fetched."""
+        execute, _ = paged_backend(total_pages=10, failing={0, 1})
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+
+        with pytest.raises(RNCAPIError, match="page 0"):
+            await service.fetch_pages(make_query(end_page=1))
+
+    @pytest.mark.asyncio
+    async def test_failed_first_page_stops_target_search(
+            self, mock_rnc_client):
+        """Test that an unknown result size ends the target search."""
+        execute, requested = paged_backend(total_pages=10, failing={0})
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+
+        with pytest.raises(RNCAPIError):
+            await service.fetch_pages(make_query(target_examples=10))
+
+        assert requested == [0]
+
+
+def corpus_of(payload):
+    return payload["corpus"]["type"]
+
+
+@pytest.mark.unit
+class TestBatch:
+    """Tests for running many independent queries."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self, mock_rnc_client):
+        """Test that results keep the order of the queries."""
+        async def execute(payload, **kwargs):
+            # Later queries finish first
+            delay = {"MAIN": 0.03, "PAPER": 0.02, "POETIC": 0.0}
+            await asyncio.sleep(delay[corpus_of(payload)])
+            raw = build_concordance_response(1, 1)
+            raw["queryStats"]["textCount"] = len(corpus_of(payload))
+            return raw
+
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+        queries = [
+            SearchQuery(corpus=corpus, tokens=[TokenRequest(lemma="дом")])
+            for corpus in ("MAIN", "PAPER", "POETIC")
+        ]
+
+        response = await service.run_batch(queries)
+
+        assert [item.index for item in response.results] == [0, 1, 2]
+        assert [
+            item.response.stats.queryStats.textCount
+            for item in response.results
+        ] == [4, 5, 6]
+        assert response.succeeded == 3
+        assert response.failed == 0
+
+    @pytest.mark.asyncio
+    async def test_parallelism_is_bounded(self, mock_rnc_client):
+        """Test that at most `concurrency` queries run at once."""
+        active = 0
+        peak = 0
+
+        async def execute(payload, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return build_concordance_response(1, 1)
+
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(
+            mock_rnc_client, max_pages=20, concurrency=3)
+
+        await service.run_batch(
+            [make_query(page=i) for i in range(10)])
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_per_item_errors(self, mock_rnc_client):
+        """Test that one failing query does not fail the batch."""
+        async def execute(payload, **kwargs):
+            if corpus_of(payload) == "PAPER":
+                raise RNCAPIError("RNC API Error 500: boom")
+            return build_concordance_response(1, 1)
+
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+        ctx = Mock()
+        ctx.warning = AsyncMock()
+        queries = [
+            SearchQuery(corpus=corpus, tokens=[TokenRequest(lemma="дом")])
+            for corpus in ("MAIN", "PAPER")
+        ]
+
+        response = await service.run_batch(queries, ctx=ctx)
+
+        assert response.results[0].response is not None
+        assert response.results[1].response is None
+        assert "API Execution Error" in response.results[1].error
+        assert "500" in response.results[1].error
+        assert response.failed == 1
+        ctx.warning.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stats_only_items(self, mock_rnc_client):
+        """Test that stats-only queries use the fast formatter path."""
+        mock_rnc_client.execute_concordance.return_value = (
+            build_concordance_response(2, 2))
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+
+        response = await service.run_batch(
+            [make_query(return_examples=False)])
+
+        assert response.results[0].response.results == []
+
+    @pytest.mark.asyncio
+    async def test_oversized_batch_rejected(self, mock_rnc_client):
+        """Test that batches above max_batch_size are refused."""
+        service = RNCSearchService(
+            mock_rnc_client, max_pages=20, max_batch_size=2)
+
+        with pytest.raises(ValueError):
+            await service.run_batch([make_query() for _ in range(3)])
+
+        mock_rnc_client.execute_concordance.assert_not_called()
+
+
+def year_of(payload):
+    conditions = payload["subcorpus"]["sectionValues"][0]["conditionValues"]
+    date = next(c for c in conditions if c["fieldName"] == "created")
+    return date["dateRange"]["begin"]["year"]
+
+
+def stats_response(matches, subcorpus_words):
+    return {
+        "corpusStats": {"textCount": 1000, "wordUsageCount": 10**8},
+        "subcorpStats": {"textCount": 10, "wordUsageCount": subcorpus_words},
+        "queryStats": {"textCount": 1, "wordUsageCount": matches},
+        "pagination": {"totalPageCount": 1}
+    }
+
+
+@pytest.mark.unit
+class TestFrequencyTimeline:
+    """Tests for date-sharded frequency statistics."""
+
+    @pytest.mark.asyncio
+    async def test_buckets_cover_span(self, mock_rnc_client):
+        """Test that buckets are consecutive and clipped to end_year."""
+        async def execute(payload, **kwargs):
+            return stats_response(year_of(payload) - 1900, 10**6)
+
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+
+        response = await service.frequency_timeline(
+            make_query(), 1900, 1925, 10)
+
+        spans = [(b.start_year, b.end_year) for b in response.buckets]
+        assert spans == [(1900, 1909), (1910, 1919), (1920, 1925)]
+        assert [b.queryStats.wordUsageCount for b in response.buckets] == [
+            0, 10, 20]
+        assert response.buckets[1].ipm == 10.0
+        assert response.buckets[1].subcorpStats.wordUsageCount == 10**6
+
+    @pytest.mark.asyncio
+    async def test_buckets_fetched_concurrently(self, mock_rnc_client):
+        """Test that buckets are fetched in parallel up to the limit."""
+        active = 0
+        peak = 0
+
+        async def execute(payload, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return stats_response(1, 10**6)
+
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(
+            mock_rnc_client, max_pages=20, concurrency=4)
+
+        await service.frequency_timeline(make_query(), 1900, 1999, 10)
+
+        assert mock_rnc_client.execute_concordance.await_count == 10
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_bucket_reported(self, mock_rnc_client):
+        """Test that a failing bucket carries its error."""
+        async def execute(payload, **kwargs):
+            if year_of(payload) == 1910:
+                raise RNCAPIError("RNC API Error 503: unavailable")
+            return stats_response(1, 10**6)
+
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+
+        response = await service.frequency_timeline(
+            make_query(), 1900, 1929, 10)
+
+        assert response.buckets[1].error is not None
+        assert "503" in response.buckets[1].error
+        assert response.buckets[1].ipm is None
+        assert response.buckets[2].ipm == 1.0
+
+    @pytest.mark.asyncio
+    async def test_all_buckets_failing_raises(self, mock_rnc_client):
+        """Test that a timeline without any data is an error."""
+        mock_rnc_client.execute_concordance.side_effect = RNCAPIError(
+            "RNC API Error 503: unavailable")
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+
+        with pytest.raises(RNCAPIError):
+            await service.frequency_timeline(make_query(), 1900, 1919, 10)
+
+    @pytest.mark.asyncio
+    async def test_invalid_spans_rejected(self, mock_rnc_client):
+        """Test that malformed spans and oversized timelines fail."""
+        service = RNCSearchService(
+            mock_rnc_client, max_pages=20, max_batch_size=5)
+
+        with pytest.raises(ValueError):
+            await service.frequency_timeline(make_query(), 1950, 1900, 10)
+        with pytest.raises(ValueError):
+            await service.frequency_timeline(make_query(), 1900, 1950, 0)
+        with pytest.raises(ValueError):
+            await service.frequency_timeline(make_query(), 1900, 1999, 10)
+        mock_rnc_client.execute_concordance.assert_not_called()
+
+
+@pytest.mark.unit
+class TestCompareCorpora:
+    """Tests for running one query across corpora."""
+
+    @pytest.mark.asyncio
+    async def test_rows_in_requested_order(self, mock_rnc_client):
+        """Test that each corpus gets its normalized frequency."""
+        sizes = {"MAIN": 4 * 10**6, "PAPER": 10**6}
+
+        async def execute(payload, **kwargs):
+            assert payload["params"]["pageParams"]["docsPerPage"] == 1
+            raw = stats_response(20, sizes[corpus_of(payload)])
+            del raw["subcorpStats"]
+            raw["corpusStats"]["wordUsageCount"] = sizes[corpus_of(payload)]
+            return raw
+
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+
+        response = await service.compare_corpora(
+            make_query(), ["PAPER", "MAIN", "PAPER"], timeout=5)
+
+        assert [row.corpus for row in response.corpora] == ["PAPER", "MAIN"]
+        assert [row.ipm for row in response.corpora] == [20.0, 5.0]
+        assert mock_rnc_client.execute_concordance.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_corpus_times_out_alone(self, mock_rnc_client):
+        """Test that a slow corpus does not hold back the others."""
+        async def execute(payload, **kwargs):
+            if corpus_of(payload) == "SPOKEN":
+                await asyncio.sleep(10)
+            return stats_response(5, 10**6)
+
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+        ctx = Mock()
+        ctx.warning = AsyncMock()
+
+        response = await asyncio.wait_for(service.compare_corpora(
+            make_query(), ["MAIN", "SPOKEN", "PAPER"], timeout=0.05,
+            ctx=ctx), timeout=2)
+
+        main, spoken, paper = response.corpora
+        assert main.ipm == 5.0 and paper.ipm == 5.0
+        assert "Timed out" in spoken.error
+        ctx.warning.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_corpus_reported(self, mock_rnc_client):
+        """Test that an API error becomes an error row."""
+        async def execute(payload, **kwargs):
+            if corpus_of(payload) == "BLOGS":
+                raise RNCAPIError("RNC API Error 400: bad corpus")
+            return stats_response(5, 10**6)
+
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+
+        response = await service.compare_corpora(
+            make_query(), ["MAIN", "BLOGS"], timeout=5)
+
+        assert response.corpora[0].error is None
+        assert "400" in response.corpora[1].error
+
+    @pytest.mark.asyncio
+    async def test_empty_corpus_list_rejected(self, mock_rnc_client):
+        """Test that at least one corpus is required."""
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+
+        with pytest.raises(ValueError):
+            await service.compare_corpora(make_query(), [], timeout=5)
+
+
+def progress_ctx():
+    ctx = Mock()
+    ctx.warning = AsyncMock()
+    ctx.report_progress = AsyncMock()
+    return ctx
+
+
+@pytest.mark.unit
+class TestProgressAndCancellation:
+    """Tests for progress notifications and early cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_progress_per_page(self, mock_rnc_client):
+        """Test that every fetched page is reported."""
+        execute, _ = paged_backend(total_pages=10)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+        ctx = progress_ctx()
+
+        await service.fetch_pages(make_query(end_page=2), ctx=ctx)
+
+        calls = ctx.report_progress.await_args_list
+        assert [c.args[:2] for c in calls] == [(1, 3), (2, 3), (3, 3)]
+        assert {c.args[2].split(" done")[0] for c in calls} == {
+            "Page 0", "Page 1", "Page 2"}
+
+    @pytest.mark.asyncio
+    async def test_progress_total_grows_in_target_mode(
+            self, mock_rnc_client):
+        """Test that the total follows the pages planned so far."""
+        execute, _ = paged_backend(total_pages=50)
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+        ctx = progress_ctx()
+
+        await service.fetch_pages(make_query(target_examples=20), ctx=ctx)
+
+        totals = [c.args[1] for c in ctx.report_progress.await_args_list]
+        assert totals == [1, 4, 4, 4]
+
+    @pytest.mark.asyncio
+    async def test_progress_per_bucket_and_batch_item(
+            self, mock_rnc_client):
+        """Test that sharded and batched requests report progress."""
+        mock_rnc_client.execute_concordance.return_value = stats_response(
+            1, 10**6)
+        service = RNCSearchService(mock_rnc_client, max_pages=20)
+        ctx = progress_ctx()
+
+        await service.frequency_timeline(
+            make_query(), 1900, 1929, 10, ctx=ctx)
+        await service.run_batch([make_query(), make_query()], ctx=ctx)
+
+        messages = [c.args[2] for c in ctx.report_progress.await_args_list]
+        assert len(messages) == 5
+        assert any(m.startswith("Years 1910-1919 done") for m in messages)
+        assert any(m.startswith("Query #1 done") for m in messages)
+
+    @pytest.mark.asyncio
+    async def test_cancellation_stops_pending_requests(
+            self, mock_rnc_client):
+        """Test that cancelling a sweep cancels queued and running calls."""
+        started = []
+        cancelled = []
+
+        async def execute(payload, **kwargs):
+            started.append(payload)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(payload)
+                raise
+
+        mock_rnc_client.execute_concordance.side_effect = execute
+        service = RNCSearchService(
+            mock_rnc_client, max_pages=20, concurrency=2)
+
+        task = asyncio.create_task(
+            service.frequency_timeline(make_query(), 1900, 1999, 10))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # Only the first two buckets got a slot; both were cancelled and
+        # the queued ones never started
+        assert len(started) == 2
+        assert len(cancelled) == 2
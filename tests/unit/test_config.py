@@ -1,6 +1,7 @@
 """Unit tests for Config class."""
 
 import pytest
+from rnc_mcp import config
 from rnc_mcp.config import Config
 from rnc_mcp.schemas.schemas import RncCorpusType
 from rnc_mcp.exceptions import RNCConfigError
@@ -14,6 +15,17 @@ class TestConfig:
         """Test that BASE_URL is configured."""
         assert Config.RNC_BASE_URL == "https://ruscorpora.ru/api/v1"
 
+    def test_data_dir_follows_xdg(self, monkeypatch, tmp_path):
+        """Test that the job database defaults to the user data dir."""
+        monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+        assert config._data_dir("jobs.sqlite3") == str(
+            tmp_path / "rnc_mcp" / "jobs.sqlite3")
+
+        monkeypatch.delenv("XDG_DATA_HOME")
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert config._data_dir("jobs.sqlite3") == str(
+            tmp_path / ".local" / "share" / "rnc_mcp" / "jobs.sqlite3")
+
     def test_corpora_has_13_entries(self):
         """Test that CORPORA dict contains all 13 corpus types."""
         assert len(Config.RNC_CORPORA) == 13
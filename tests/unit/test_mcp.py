@@ -0,0 +1,165 @@
+"""Unit tests for the FastMCP server wiring."""
+
+import json
+import pytest
+from rnc_mcp import mcp as server
+
+
+@pytest.mark.unit
+class TestReadiness:
+    """Tests for the /ready probe and the startup lifespan."""
+
+    @pytest.mark.asyncio
+    async def test_not_ready_before_startup(self):
+        """Test that the probe returns 503 before the lifespan runs."""
+        server.ready.clear()
+
+        response = await server.readiness(None)
+
+        assert response.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_ready_after_lifespan_startup(self, monkeypatch):
+        """Test that the probe returns 200 inside the lifespan."""
+        monkeypatch.setattr(server.Config, "RNC_PREWARM", False)
+
+        async with server.lifespan(server.mcp):
+            response = await server.readiness(None)
+            assert response.status_code == 200
+            body = json.loads(response.body)
+            assert body["status"] == "ready"
+            assert body["circuits"] == {
+                "concordance": "closed", "config": "closed", "attrs": "closed"
+            }
+
+        assert not server.ready.is_set()
+
+    @pytest.mark.asyncio
+    async def test_prewarm_runs_before_ready(self, monkeypatch):
+        """Test that prewarm finishes before readiness is signalled."""
+        order = []
+
+        async def prewarm(corpora, concurrency):
+            order.append(("prewarm", server.ready.is_set()))
+            return {"MAIN": True, "PAPER": False}
+
+        monkeypatch.setattr(server.Config, "RNC_PREWARM", True)
+        monkeypatch.setattr(server.resource_generator, "prewarm", prewarm)
+        monkeypatch.setattr(server, "prewarm_status", {})
+
+        async with server.lifespan(server.mcp):
+            body = json.loads((await server.readiness(None)).body)
+
+        assert order == [("prewarm", False)]
+        assert body["prewarmed"] == ["MAIN"]
+        assert body["incomplete"] == ["PAPER"]
+
+
+@pytest.mark.unit
+class TestMetricsRoute:
+    """Tests for the /metrics route."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_in_prometheus_format(self):
+        """Test that /metrics serves the registry as Prometheus text."""
+        response = await server.metrics(None)
+
+        assert response.status_code == 200
+        assert response.media_type.startswith("text/plain; version=0.0.4")
+        body = response.body.decode()
+        assert "# TYPE rnc_stage_duration_seconds histogram" in body
+        assert "# TYPE rnc_upstream_in_flight gauge" in body
+
+
+@pytest.mark.unit
+class TestConcordanceProgress:
+    """Tests for progress notifications of the concordance tool."""
+
+    @pytest.mark.asyncio
+    async def test_stage_progress_reported(self, mock_env_token, monkeypatch):
+        """Test that each pipeline stage sends a progress notification."""
+        from fastmcp import Client
+        from tests.fixtures.mock_responses import CONCORDANCE_SUCCESS
+
+        async def execute(payload, **kwargs):
+            return CONCORDANCE_SUCCESS
+
+        monkeypatch.setattr(server.client, "execute_concordance", execute)
+        updates = []
+
+        async def on_progress(progress, total, message):
+            updates.append((progress, total, message))
+
+        async with Client(server.mcp) as mcp_client:
+            await mcp_client.call_tool(
+                "concordance",
+                {"query": {"tokens": [{"lemma": "дом"}]}},
+                progress_handler=on_progress
+            )
+
+        assert [u[:2] for u in updates] == [(1, 3), (2, 3), (3, 3)]
+        assert updates[0][2].startswith("Query build done in ")
+        assert updates[1][2].startswith("RNC API request done in ")
+        assert updates[2][2].startswith("Formatting done in ")
+
+
+@pytest.mark.unit
+class TestToolTracing:
+    """Tests for per-tool-call traces."""
+
+    @pytest.mark.asyncio
+    async def test_tool_call_is_traced(self, mock_env_token, monkeypatch):
+        """Test that a tool call records one trace with nested stages."""
+        from fastmcp import Client
+        from tests.fixtures.mock_responses import CONCORDANCE_SUCCESS
+
+        payloads = []
+
+        class Exporter:
+            def export(self, payload):
+                payloads.append(payload)
+
+        async def execute(payload, **kwargs):
+            return CONCORDANCE_SUCCESS
+
+        monkeypatch.setattr(server.client, "execute_concordance", execute)
+        monkeypatch.setattr(server.TRACER, "exporter", Exporter())
+        monkeypatch.setattr(server.TRACER, "sample_rate", 1.0)
+
+        async with Client(server.mcp) as mcp_client:
+            await mcp_client.call_tool(
+                "concordance", {"query": {"tokens": [{"lemma": "дом"}]}})
+        await server.TRACER.flush()
+
+        assert len(payloads) == 1
+        spans = payloads[0]["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        by_name = {span["name"]: span for span in spans}
+        root = by_name["tools/call concordance"]
+        assert by_name["build"]["parentSpanId"] == root["spanId"]
+        assert by_name["format"]["parentSpanId"] == root["spanId"]
+        assert {span["traceId"] for span in spans} == {root["traceId"]}
+
+
+@pytest.mark.unit
+class TestJobTools:
+    """Tests for the background job tools."""
+
+    @pytest.mark.asyncio
+    async def test_job_errors(self, monkeypatch, tmp_path):
+        """Test that job lookups and bad reads report job errors."""
+        from fastmcp import Client
+        from fastmcp.exceptions import ToolError
+        from rnc_mcp.jobs.store import JobStore
+
+        store = JobStore(tmp_path / "jobs.sqlite3")
+        monkeypatch.setattr(server.job_manager, "store", store)
+
+        async with Client(server.mcp) as mcp_client:
+            with pytest.raises(ToolError, match="Unknown job: missing"):
+                await mcp_client.call_tool(
+                    "job_status", {"job_id": "missing"})
+            with pytest.raises(ToolError, match="Job Error: offset"):
+                await mcp_client.call_tool(
+                    "job_results", {"job_id": "missing", "offset": -1})
+
+        assert not store.exists()
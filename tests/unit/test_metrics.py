@@ -0,0 +1,227 @@
+"""Unit tests for the metrics registry and client instrumentation."""
+
+import asyncio
+import httpx
+import pytest
+from rnc_mcp import metrics
+from rnc_mcp.clients.breaker import CircuitBreaker
+from rnc_mcp.clients.cache import ConcordanceCache
+from rnc_mcp.clients.limiter import ConcurrencyLimiter
+from rnc_mcp.clients.retry import RetryPolicy
+from rnc_mcp.clients.rnc_client import RNCClient
+from rnc_mcp.exceptions import RNCQueueTimeoutError
+from rnc_mcp.metrics import MetricsRegistry
+from rnc_mcp.schemas.schemas import SearchQuery, TokenRequest
+from rnc_mcp.services.rnc_builder import RNCQueryBuilder
+from rnc_mcp.services.rnc_formatter import RNCResponseFormatter
+from tests.fixtures.mock_responses import CONCORDANCE_SUCCESS
+
+
+@pytest.mark.unit
+class TestRegistry:
+    """Tests for metric types and the Prometheus text format."""
+
+    def test_counter_render(self):
+        """Test that counters render one sample per label set."""
+        registry = MetricsRegistry()
+        counter = registry.counter(
+            "requests_total", "Requests.", ("status",))
+
+        counter.inc(status=200)
+        counter.inc(2, status=200)
+        counter.inc(status=503)
+
+        assert counter.value(status=200) == 3
+        assert registry.render() == (
+            "# HELP requests_total Requests.\n"
+            "# TYPE requests_total counter\n"
+            'requests_total{status="200"} 3\n'
+            'requests_total{status="503"} 1\n'
+        )
+
+    def test_labels_must_match(self):
+        """Test that a sample with the wrong labels is rejected."""
+        counter = MetricsRegistry().counter("c", "C.", ("endpoint",))
+
+        with pytest.raises(ValueError):
+            counter.inc(status=200)
+
+    def test_duplicate_name_rejected(self):
+        """Test that a metric name can only be registered once."""
+        registry = MetricsRegistry()
+        registry.counter("c", "C.")
+
+        with pytest.raises(ValueError):
+            registry.gauge("c", "C.")
+
+    def test_gauge_tracks_block(self):
+        """Test that a gauge counts a block only while it runs."""
+        gauge = MetricsRegistry().gauge("in_flight", "In flight.", ("e",))
+
+        with gauge.track(e="x"):
+            assert gauge.value(e="x") == 1
+        assert gauge.value(e="x") == 0
+
+    def test_metric_base_is_abstract(self):
+        """Test that only concrete metric types can be created."""
+        with pytest.raises(TypeError):
+            metrics.Metric("m", "M.")
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test that histogram buckets, sum and count are rendered."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram(
+            "latency_seconds", "Latency.", ("stage",), buckets=(0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value, stage="upstream")
+
+        lines = registry.render().splitlines()
+        assert lines[2:] == [
+            'latency_seconds_bucket{stage="upstream",le="0.1"} 2',
+            'latency_seconds_bucket{stage="upstream",le="1"} 3',
+            'latency_seconds_bucket{stage="upstream",le="+Inf"} 4',
+            'latency_seconds_sum{stage="upstream"} 2.65',
+            'latency_seconds_count{stage="upstream"} 4',
+        ]
+
+    def test_label_values_are_escaped(self):
+        """Test that quotes and backslashes in label values are escaped."""
+        registry = MetricsRegistry()
+        registry.counter("c", "C.", ("path",)).inc(path='a"b\\c')
+
+        assert 'c{path="a\\"b\\\\c"} 1' in registry.render()
+
+    def test_histogram_time_records_failures(self):
+        """Test that a timed block that raises is still observed."""
+        histogram = MetricsRegistry().histogram("h", "H.", ("stage",))
+
+        with pytest.raises(RuntimeError):
+            with histogram.time(stage="x"):
+                raise RuntimeError("boom")
+
+        assert histogram.count(stage="x") == 1
+
+
+@pytest.mark.unit
+class TestInstrumentation:
+    """Tests for the metrics recorded by the builder, formatter and client."""
+
+    def test_build_and_format_stages(self):
+        """Test that query building and formatting are timed."""
+        build = metrics.STAGE_SECONDS.count(stage="build")
+        fmt = metrics.STAGE_SECONDS.count(stage="format")
+
+        RNCQueryBuilder.build_payload(
+            SearchQuery(tokens=[TokenRequest(lemma="дом")]))
+        RNCResponseFormatter.format_search_results(CONCORDANCE_SUCCESS)
+
+        assert metrics.STAGE_SECONDS.count(stage="build") == build + 1
+        assert metrics.STAGE_SECONDS.count(stage="format") == fmt + 1
+
+    @pytest.mark.asyncio
+    async def test_client_records_upstream_metrics(self, mock_env_token):
+        """Test that statuses, retries, latency and cache use are counted."""
+        responses = iter([
+            httpx.Response(503, headers={"Retry-After": "0"}),
+            httpx.Response(200, json=CONCORDANCE_SUCCESS),
+        ])
+        client = RNCClient(
+            transport=httpx.MockTransport(lambda request: next(responses)),
+            concordance_cache=ConcordanceCache(max_bytes=1_000_000, ttl=60),
+            retry_policy=RetryPolicy(max_retries=2, backoff=0.0)
+        )
+        before = {
+            "ok": metrics.UPSTREAM_RESPONSES.value(
+                endpoint="concordance", status=200),
+            "unavailable": metrics.UPSTREAM_RESPONSES.value(
+                endpoint="concordance", status=503),
+            "retries": metrics.UPSTREAM_RETRIES.value(
+                endpoint="concordance", status=503),
+            "upstream": metrics.STAGE_SECONDS.count(stage="upstream"),
+            "decode": metrics.STAGE_SECONDS.count(stage="decode"),
+            "hits": metrics.CACHE_LOOKUPS.value(result="hit"),
+            "misses": metrics.CACHE_LOOKUPS.value(result="miss"),
+        }
+        payload = {"corpus": {"type": "MAIN"}}
+
+        await client.execute_concordance(payload)
+        await client.execute_concordance(payload)
+        await client.aclose()
+
+        assert metrics.UPSTREAM_RESPONSES.value(
+            endpoint="concordance", status=200) == before["ok"] + 1
+        assert metrics.UPSTREAM_RESPONSES.value(
+            endpoint="concordance", status=503) == before["unavailable"] + 1
+        assert metrics.UPSTREAM_RETRIES.value(
+            endpoint="concordance", status=503) == before["retries"] + 1
+        assert metrics.STAGE_SECONDS.count(
+            stage="upstream") == before["upstream"] + 2
+        assert metrics.STAGE_SECONDS.count(
+            stage="decode") == before["decode"] + 1
+        assert metrics.CACHE_LOOKUPS.value(
+            result="miss") == before["misses"] + 1
+        assert metrics.CACHE_LOOKUPS.value(
+            result="hit") == before["hits"] + 1
+        assert metrics.UPSTREAM_IN_FLIGHT.value(endpoint="concordance") == 0
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_are_counted(self, mock_env_token):
+        """Test that a failed connection is counted as an error status."""
+        def fail(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        client = RNCClient(transport=httpx.MockTransport(fail))
+        before = metrics.UPSTREAM_RESPONSES.value(
+            endpoint="config", status="error")
+
+        with pytest.raises(httpx.ConnectError):
+            await client.get_corpus_config("MAIN")
+        await client.aclose()
+
+        assert metrics.UPSTREAM_RESPONSES.value(
+            endpoint="config", status="error") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_limiter_queue_metrics(self):
+        """Test that queued requests and queue timeouts are exported."""
+        limiter = ConcurrencyLimiter(max_concurrency=1, max_wait=0.01)
+        release = asyncio.Event()
+        timeouts = metrics.LIMITER_QUEUE_TIMEOUTS.value(corpus="POETIC")
+
+        async def hold():
+            async with limiter.acquire("POETIC"):
+                await release.wait()
+
+        tasks = [asyncio.create_task(hold()) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        assert metrics.LIMITER_WAITING.value(corpus="POETIC") == 2
+        assert metrics.LIMITER_MAX_WAITING.value() >= 2
+        assert 'rnc_limiter_waiting{corpus="POETIC"} 2' in (
+            metrics.REGISTRY.render())
+
+        results = await asyncio.gather(*tasks[1:], return_exceptions=True)
+        release.set()
+        await tasks[0]
+
+        assert all(isinstance(r, RNCQueueTimeoutError) for r in results)
+        assert metrics.LIMITER_WAITING.value(corpus="POETIC") == 0
+        assert metrics.LIMITER_QUEUE_TIMEOUTS.value(
+            corpus="POETIC") == timeouts + 2
+
+    def test_breaker_state_gauge(self):
+        """Test that circuit breaker transitions are exported."""
+        breaker = CircuitBreaker(
+            "test-endpoint", failure_threshold=1, recovery_timeout=0)
+
+        def state():
+            return metrics.BREAKER_STATE.value(endpoint="test-endpoint")
+
+        assert state() == 0
+        breaker.record_failure()
+        assert state() == 2
+        breaker.check()
+        assert state() == 1
+        breaker.record_success(0.1)
+        assert state() == 0
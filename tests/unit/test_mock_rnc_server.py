@@ -0,0 +1,128 @@
+"""Unit tests for the local stand-in RNC API server."""
+
+import httpx
+import pytest
+from benchmarks.mock_rnc_server import API_PREFIX, create_app
+from rnc_mcp.clients.retry import RetryPolicy
+from rnc_mcp.clients.rnc_client import RNCClient
+from rnc_mcp.config import Config
+from rnc_mcp.exceptions import RNCAPIError, RNCRateLimitError
+from tests.fixtures.mock_responses import (
+    ATTRIBUTES_GRAMMAR, CONCORDANCE_SUCCESS, CORPUS_CONFIG_MAIN
+)
+
+BASE_URL = f"http://mock{API_PREFIX}"
+
+
+def mock_client(app, **kwargs):
+    return RNCClient(transport=httpx.ASGITransport(app=app), **kwargs)
+
+
+async def served(app):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport) as http:
+        response = await http.get("http://mock/_mock/stats")
+    return response.json()["served"]
+
+
+@pytest.fixture
+def mock_base_url(mock_env_token, monkeypatch):
+    monkeypatch.setattr(Config, "RNC_BASE_URL", BASE_URL)
+
+
+@pytest.mark.unit
+class TestMockServer:
+    """Tests for RNCClient against the stand-in server."""
+
+    @pytest.mark.asyncio
+    async def test_serves_fixture_payloads(self, mock_base_url):
+        """Test that all three endpoints answer like the RNC API."""
+        client = mock_client(create_app())
+
+        concordance = await client.execute_concordance(
+            {"corpus": {"type": "MAIN"}})
+        config = await client.get_corpus_config("MAIN")
+        attrs = await client.get_attributes("MAIN", "grammar")
+        await client.aclose()
+
+        assert concordance == CONCORDANCE_SUCCESS
+        assert config == CORPUS_CONFIG_MAIN
+        assert attrs == ATTRIBUTES_GRAMMAR
+
+    @pytest.mark.asyncio
+    async def test_synthetic_response_size(self, mock_base_url):
+        """Test that docs and snippets control the concordance size."""
+        client = mock_client(create_app(docs=30, snippets=4, total_pages=7))
+
+        raw = await client.execute_concordance({"corpus": {"type": "MAIN"}})
+        await client.aclose()
+
+        docs = raw["groups"][0]["docs"]
+        assert len(docs) == 30
+        assert len(docs[0]["snippetGroups"][0]["snippets"]) == 4
+        assert raw["pagination"]["totalPageCount"] == 7
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_injection(self, mock_base_url):
+        """Test that injected 429s carry Retry-After."""
+        app = create_app(rate_limit_rate=1.0, retry_after=7)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport) as http:
+            response = await http.get(f"{BASE_URL}/config/")
+        client = mock_client(app)
+
+        with pytest.raises(RNCRateLimitError):
+            await client.execute_concordance({"corpus": {"type": "MAIN"}})
+        await client.aclose()
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "7"
+
+    @pytest.mark.asyncio
+    async def test_error_injection(self, mock_base_url):
+        """Test that injected errors surface as API errors."""
+        app = create_app(error_rate=1.0)
+        client = mock_client(app)
+
+        with pytest.raises(RNCAPIError, match="503"):
+            await client.execute_concordance({"corpus": {"type": "MAIN"}})
+        await client.aclose()
+
+        assert await served(app) == {"503": 1}
+
+    @pytest.mark.asyncio
+    async def test_seeded_faults_are_reproducible(self, mock_base_url):
+        """Test that the same seed injects the same faults."""
+        outcomes = []
+        for _ in range(2):
+            app = create_app(error_rate=0.3, rate_limit_rate=0.2, seed=42)
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport) as http:
+                statuses = [
+                    (await http.post(
+                        f"{BASE_URL}/lex-gramm/concordance", json={}
+                    )).status_code
+                    for _ in range(40)
+                ]
+            outcomes.append(statuses)
+
+        assert outcomes[0] == outcomes[1]
+        assert {200, 429, 503} <= set(outcomes[0])
+
+    @pytest.mark.asyncio
+    async def test_client_retries_through_faults(self, mock_base_url):
+        """Test that retries recover from a partly failing upstream."""
+        app = create_app(error_rate=0.3, seed=1)
+        client = mock_client(
+            app, retry_policy=RetryPolicy(max_retries=10, backoff=0.0))
+
+        for page in range(20):
+            await client.execute_concordance({
+                "corpus": {"type": "MAIN"},
+                "params": {"pageParams": {"page": page}}
+            })
+        await client.aclose()
+
+        stats = await served(app)
+        assert stats["200"] == 20
+        assert client.retries == int(stats.get("503", 0)) > 0
@@ -0,0 +1,191 @@
+"""Unit tests for span tracing and OTLP export."""
+
+import asyncio
+import json
+import pytest
+from rnc_mcp import tracing
+from rnc_mcp.metrics import stage
+from rnc_mcp.tracing import (
+    STATUS_ERROR, STATUS_OK, FileExporter, OTLPHttpExporter, Tracer
+)
+
+
+class ListExporter:
+    def __init__(self):
+        self.payloads = []
+
+    def export(self, payload):
+        self.payloads.append(payload)
+
+    def spans(self, index=0):
+        payload = self.payloads[index]
+        return payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+
+
+def attributes(span):
+    return {
+        attr["key"]: next(iter(attr["value"].values()))
+        for attr in span["attributes"]
+    }
+
+
+@pytest.mark.unit
+class TestTracer:
+    """Tests for span nesting, sampling and export."""
+
+    def test_nested_spans_share_trace(self):
+        """Test that child spans point at their parent within one trace."""
+        exporter = ListExporter()
+        tracer = Tracer(exporter, sample_rate=1.0)
+
+        with tracer.start_trace("root", tool="concordance") as root:
+            with tracer.span("child") as child:
+                with tracer.span("grandchild", size=3):
+                    pass
+
+        spans = {span["name"]: span for span in exporter.spans()}
+        assert len(exporter.payloads) == 1
+        assert {s["traceId"] for s in spans.values()} == {root.trace_id}
+        assert len(root.trace_id) == 32
+        assert "parentSpanId" not in spans["root"]
+        assert spans["child"]["parentSpanId"] == root.span_id
+        assert spans["grandchild"]["parentSpanId"] == child.span_id
+        assert attributes(spans["grandchild"]) == {"size": "3"}
+        assert attributes(spans["root"]) == {"tool": "concordance"}
+        assert int(spans["root"]["endTimeUnixNano"]) >= int(
+            spans["child"]["endTimeUnixNano"])
+
+    def test_each_trace_has_its_own_id(self):
+        """Test that consecutive root operations get distinct trace ids."""
+        exporter = ListExporter()
+        tracer = Tracer(exporter, sample_rate=1.0)
+
+        for _ in range(2):
+            with tracer.start_trace("root"):
+                pass
+
+        ids = {exporter.spans(i)[0]["traceId"] for i in range(2)}
+        assert len(ids) == 2
+
+    def test_spans_outside_trace_are_dropped(self):
+        """Test that span() is a no-op without an active trace."""
+        exporter = ListExporter()
+        tracer = Tracer(exporter, sample_rate=1.0)
+
+        with tracer.span("orphan") as span:
+            assert span is None
+
+        assert exporter.payloads == []
+
+    def test_sampling(self, monkeypatch):
+        """Test that only the sampled fraction of traces is recorded."""
+        exporter = ListExporter()
+        tracer = Tracer(exporter, sample_rate=0.5)
+        draws = iter([0.2, 0.7])
+        monkeypatch.setattr(tracing.random, "random", lambda: next(draws))
+
+        with tracer.start_trace("sampled") as first:
+            with tracer.span("child") as child:
+                assert child is not None
+        with tracer.start_trace("dropped") as second:
+            with tracer.span("child") as child:
+                assert child is None
+
+        assert first is not None and second is None
+        assert len(exporter.payloads) == 1
+
+    def test_disabled_without_exporter(self):
+        """Test that tracing is off without an exporter or sample rate."""
+        assert not Tracer(None, sample_rate=1.0).enabled
+        assert not Tracer(ListExporter(), sample_rate=0.0).enabled
+
+    def test_errors_mark_spans(self):
+        """Test that a raising span is exported with an error status."""
+        exporter = ListExporter()
+        tracer = Tracer(exporter, sample_rate=1.0)
+
+        with pytest.raises(ValueError):
+            with tracer.start_trace("root"):
+                with tracer.span("child"):
+                    raise ValueError("bad query")
+
+        spans = {span["name"]: span for span in exporter.spans()}
+        assert spans["child"]["status"] == {
+            "code": STATUS_ERROR, "message": "ValueError: bad query"
+        }
+        assert spans["root"]["status"]["code"] == STATUS_ERROR
+
+    def test_export_errors_are_swallowed(self):
+        """Test that a failing exporter does not fail the operation."""
+        class Broken:
+            def export(self, payload):
+                raise OSError("disk full")
+
+        tracer = Tracer(Broken(), sample_rate=1.0)
+
+        with tracer.start_trace("root"):
+            pass
+
+    @pytest.mark.asyncio
+    async def test_spans_in_child_tasks_join_trace(self):
+        """Test that concurrent tasks record spans under the caller."""
+        exporter = ListExporter()
+        tracer = Tracer(exporter, sample_rate=1.0)
+
+        async def fetch(page):
+            with tracer.span(f"page {page}"):
+                await asyncio.sleep(0)
+
+        with tracer.start_trace("root") as root:
+            await asyncio.gather(*[fetch(p) for p in range(3)])
+        await tracer.flush()
+
+        spans = exporter.spans()
+        pages = [s for s in spans if s["name"].startswith("page")]
+        assert len(pages) == 3
+        assert {s["parentSpanId"] for s in pages} == {root.span_id}
+
+    def test_stage_records_span(self, monkeypatch):
+        """Test that metrics stages appear as spans in the trace."""
+        exporter = ListExporter()
+        tracer = Tracer(exporter, sample_rate=1.0)
+        monkeypatch.setattr(tracing, "TRACER", tracer)
+        monkeypatch.setattr("rnc_mcp.metrics.TRACER", tracer)
+
+        with tracer.start_trace("root"):
+            with stage("decode") as span:
+                span.set_attribute("bytes", 10)
+
+        decode = [s for s in exporter.spans() if s["name"] == "decode"][0]
+        assert decode["status"]["code"] == STATUS_OK
+        assert attributes(decode) == {"bytes": "10"}
+
+
+@pytest.mark.unit
+class TestExporters:
+    """Tests for the OTLP exporters."""
+
+    def test_file_exporter_appends_lines(self, tmp_path):
+        """Test that each trace is written as one JSON line."""
+        path = tmp_path / "traces" / "spans.jsonl"
+        tracer = Tracer(FileExporter(path), sample_rate=1.0)
+
+        for name in ("first", "second"):
+            with tracer.start_trace(name):
+                pass
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        payloads = [json.loads(line) for line in lines]
+        resource = payloads[0]["resourceSpans"][0]["resource"]
+        assert len(payloads) == 2
+        assert resource["attributes"][0] == {
+            "key": "service.name", "value": {"stringValue": "rnc-mcp"}
+        }
+
+    def test_collector_endpoint(self):
+        """Test that a collector base URL gets the OTLP traces path."""
+        assert OTLPHttpExporter("http://localhost:4318/").endpoint == (
+            "http://localhost:4318/v1/traces")
+        assert OTLPHttpExporter(
+            "http://collector/v1/traces").endpoint == (
+            "http://collector/v1/traces")
@@ -0,0 +1,180 @@
+"""Unit tests for logging utilities."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+from rnc_mcp.config import Config
+from rnc_mcp.utils import (
+    ProgressReporter, debug_enabled, log_debug, measure_time, preview
+)
+from tests.fixtures.synthetic_responses import build_concordance_response
+
+
+def make_ctx():
+    ctx = Mock()
+    ctx.debug = AsyncMock()
+    ctx.info = AsyncMock()
+    ctx.report_progress = AsyncMock()
+    return ctx
+
+
+class Exploding:
+    """Object whose string conversion must never happen."""
+
+    def __str__(self):
+        raise AssertionError("stringified while debug is off")
+
+
+@pytest.mark.unit
+class TestDebugGate:
+    """Tests for level-gated debug logging."""
+
+    @pytest.mark.parametrize("level,expected", [
+        ("DEBUG", True), ("INFO", False), ("WARNING", False),
+        ("NOT_A_LEVEL", False)
+    ])
+    def test_debug_enabled_follows_level(self, monkeypatch, level, expected):
+        """Test that only the DEBUG level enables debug logging."""
+        monkeypatch.setattr(Config, "RNC_LOG_LEVEL", level)
+
+        assert debug_enabled() is expected
+
+    @pytest.mark.asyncio
+    async def test_log_debug_skipped_when_disabled(self, monkeypatch):
+        """Test that nothing is stringified or sent at INFO level."""
+        monkeypatch.setattr(Config, "RNC_LOG_LEVEL", "INFO")
+        ctx = make_ctx()
+
+        await log_debug(ctx, "Raw Result", Exploding())
+
+        ctx.debug.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_log_debug_sent_when_enabled(self, monkeypatch):
+        """Test that a labelled preview is sent at DEBUG level."""
+        monkeypatch.setattr(Config, "RNC_LOG_LEVEL", "DEBUG")
+        ctx = make_ctx()
+
+        await log_debug(ctx, "Payload", {"corpus": {"type": "MAIN"}})
+
+        message = ctx.debug.await_args.args[0]
+        assert message.startswith("Payload: ")
+        assert "MAIN" in message
+
+    @pytest.mark.asyncio
+    async def test_measure_time_skipped_when_disabled(self, monkeypatch):
+        """Test that timing is not logged below DEBUG level."""
+        monkeypatch.setattr(Config, "RNC_LOG_LEVEL", "INFO")
+        ctx = make_ctx()
+
+        @measure_time
+        async def op(ctx=None):
+            return 42
+
+        assert await op(ctx=ctx) == 42
+        ctx.debug.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_measure_time_logs_when_enabled(self, monkeypatch):
+        """Test that timing is logged at DEBUG level."""
+        monkeypatch.setattr(Config, "RNC_LOG_LEVEL", "DEBUG")
+        ctx = make_ctx()
+
+        @measure_time
+        async def op(ctx=None):
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await op(ctx=ctx)
+        assert "Operation 'op' completed" in ctx.debug.await_args.args[0]
+
+
+@pytest.mark.unit
+class TestPreview:
+    """Tests for size-capped previews."""
+
+    def test_short_value_unchanged(self):
+        """Test that small values are rendered in full."""
+        assert preview("short", 100) == "short"
+
+    def test_long_value_truncated(self):
+        """Test that long values are cut at the limit."""
+        result = preview("x" * 500, 100)
+
+        assert result.startswith("x" * 100)
+        assert "truncated 400 chars" in result
+
+    def test_large_payload_is_bounded(self):
+        """Test that huge nested responses give a bounded preview."""
+        raw = build_concordance_response(50, 50)
+
+        result = preview(raw, 10 ** 6)
+
+        assert len(result) < 10000
+
+
+@pytest.mark.unit
+class TestProgressReporter:
+    """Tests for MCP progress notifications."""
+
+    @pytest.mark.asyncio
+    async def test_reports_each_step_with_timings(self):
+        """Test that each step sends progress with its duration."""
+        ctx = make_ctx()
+        progress = ProgressReporter(ctx, total=2)
+
+        async with progress.track("Page 0"):
+            pass
+        async with progress.track("Page 1"):
+            pass
+
+        calls = ctx.report_progress.await_args_list
+        assert [c.args[:2] for c in calls] == [(1, 2), (2, 2)]
+        assert calls[0].args[2].startswith("Page 0 done in ")
+        assert "(2/2, " in calls[1].args[2]
+        assert "elapsed" in calls[1].args[2]
+
+    @pytest.mark.asyncio
+    async def test_failed_step_is_reported_and_reraised(self):
+        """Test that a failing step counts as progress and still raises."""
+        ctx = make_ctx()
+        progress = ProgressReporter(ctx, total=1)
+
+        with pytest.raises(ValueError):
+            async with progress.track("Page 0"):
+                raise ValueError("boom")
+
+        assert "Page 0 failed in" in ctx.report_progress.await_args.args[2]
+
+    @pytest.mark.asyncio
+    async def test_unknown_total(self):
+        """Test that progress without a total omits it."""
+        ctx = make_ctx()
+        progress = ProgressReporter(ctx)
+
+        await progress.step("Page 0", 0.1)
+
+        completed, total, message = ctx.report_progress.await_args.args
+        assert (completed, total) == (1, None)
+        assert "(1, " in message
+
+    @pytest.mark.asyncio
+    async def test_notification_errors_are_ignored(self):
+        """Test that a failing notification does not break the step."""
+        ctx = make_ctx()
+        ctx.report_progress.side_effect = RuntimeError("disconnected")
+        progress = ProgressReporter(ctx, total=1)
+
+        async with progress.track("Page 0"):
+            pass
+
+        assert progress.completed == 1
+
+    @pytest.mark.asyncio
+    async def test_without_ctx(self):
+        """Test that progress is counted without a ctx."""
+        progress = ProgressReporter(None, total=1)
+
+        async with progress.track("Page 0"):
+            pass
+
+        assert progress.completed == 1